@@ -1,8 +1,22 @@
 """
 Analyzers - 분석 모듈
+
+하위 모듈은 이름에 처음 접근할 때 import (패키지 import만으로 분석기 / numpy를 불러오지 않음)
 """
 
-from .forensics_analyzer import ForensicsAnalyzer
-from .ai_analyzer import AIAnalyzer
+from importlib import import_module
+
+_EXPORTS = {
+    'ForensicsAnalyzer': '.forensics_analyzer',
+    'AIAnalyzer': '.ai_analyzer',
+}
 
 __all__ = ['ForensicsAnalyzer', 'AIAnalyzer']
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
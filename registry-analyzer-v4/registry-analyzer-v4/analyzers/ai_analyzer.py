@@ -5,10 +5,22 @@ Version: 4.0
 """
 
 import json
-import requests
+import os
+import sys
 from typing import Dict, List
 
 
+def _requests():
+    """requests 모듈 (AI 분석을 실제로 실행할 때만 import, 없으면 자동 설치)"""
+    try:
+        import requests
+    except ImportError:
+        print("Installing required packages...")
+        os.system(f"{sys.executable} -m pip install requests")
+        import requests
+    return requests
+
+
 class AIAnalyzer:
     """AI 기반 분석기"""
     
@@ -38,7 +50,7 @@ class AIAnalyzer:
 }}"""
         
         try:
-            response = requests.post(
+            response = _requests().post(
                 f'https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent?key={api_key}',
                 headers={'Content-Type': 'application/json'},
                 json={
@@ -92,7 +104,7 @@ class AIAnalyzer:
 - recommendations: 권장사항 (한국어)"""
         
         try:
-            response = requests.post(
+            response = _requests().post(
                 'https://api.openai.com/v1/chat/completions',
                 headers={
                     'Content-Type': 'application/json',
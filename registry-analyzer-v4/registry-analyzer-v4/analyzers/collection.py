@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Collection Ingest - 트리아지 수집 폴더 (KAPE 등) 하이브 탐색 / 해시 / 분류 / 그룹 분석
+"""
+
+import os
+import re
+import struct
+import sys
+from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor,
+                                as_completed, wait)
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from core.process_pool import pool_context
+from core.registry_parser import RegistryParser
+from analyzers.forensics_analyzer import AnalysisCancelled
+from analyzers.multi_hive_analyzer import MultiHiveAnalyzer, _load_hive
+from analyzers.parallel import DEFAULT_WORKERS
+from utils.result_cache import ResultCache
+
+
+REGF_SIGNATURE = b'regf'
+HEADER_SIZE = 0x20         # 시그니처 ~ 파일 타입 / 형식 필드
+PRIMARY_FILE_TYPE = 0      # 베이스 블록 0x1C 파일 타입 (1, 2, 6은 .LOG1/.LOG2 트랜잭션 로그)
+
+# 호스트(볼륨) 단위 하이브와 사용자 프로필 단위 하이브 (classify_hive 타입 이름)
+HOST_HIVE_TYPES = ('SYSTEM', 'SOFTWARE', 'SAM', 'SECURITY', 'Amcache.hve')
+USER_HIVE_TYPES = ('NTUSER.DAT', 'UsrClass.dat')
+
+# 경로 구성 요소 (소문자) - 볼륨 루트와 사용자 프로필 판별
+WINDOWS_SUBDIRS = ('system32', 'appcompat', 'serviceprofiles')
+PROFILE_DIRS = ('users', 'documents and settings', 'serviceprofiles')
+SYSTEM_PROFILE_DIR = 'systemprofile'
+BACKUP_DIRS = ('regback',)  # 백업 복사본 (같은 타입의 원본이 있으면 원본 우선)
+DRIVE_DIR_RE = re.compile(r'^[a-z](:|%3a|\$)?$', re.IGNORECASE)  # KAPE: <호스트>/C/Windows/...
+
+INSPECT_QUEUE_FACTOR = 4   # 해시 / 분류 대기 파일 수 = 워커 수 x 이 값
+ANALYZE_QUEUE_FACTOR = 2   # 분석 대기 하이브 수 = 워커 수 x 이 값
+
+
+def is_primary_hive(header: bytes) -> bool:
+    """베이스 블록 앞부분이 'regf' 시그니처의 주 하이브 파일인지 (트랜잭션 로그 제외)"""
+    if len(header) < HEADER_SIZE or header[:4] != REGF_SIGNATURE:
+        return False
+    return struct.unpack_from('<I', header, 0x1C)[0] == PRIMARY_FILE_TYPE
+
+
+def iter_files(root: str) -> Iterator[str]:
+    """root 아래 일반 파일 경로 (심볼릭 링크는 따라가지 않음, 읽을 수 없는 폴더는 건너뜀)"""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                subdirs = []
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry.path
+                    except OSError:
+                        continue
+        except OSError as e:
+            print(f"Skipping unreadable directory {directory}: {e}", file=sys.stderr)
+            continue
+        # 이름순으로 방문 (스택이므로 역순으로 넣음)
+        stack.extend(sorted(subdirs, reverse=True))
+
+
+def inspect_file(file_path: str) -> Optional[Dict]:
+    """파일 하나의 시그니처 확인 / SHA-256 / 하이브 타입 분류 (하이브가 아니면 None)"""
+    try:
+        with open(file_path, 'rb') as f:
+            if not is_primary_hive(f.read(HEADER_SIZE)):
+                return None
+        with RegistryParser.open(file_path) as parser:
+            classification = parser.classify_hive()
+            return {
+                'file_path': file_path,
+                'size': parser.size,
+                'sha256': parser.content_hash(),
+                'hive_type': classification['hive_type'],
+                'confidence': classification['confidence']
+            }
+    except Exception as e:
+        print(f"Failed to inspect {file_path}: {e}", file=sys.stderr)
+        return None
+
+
+def discover_hives(root: str, max_workers: int = DEFAULT_WORKERS,
+                   on_hive_found: Optional[Callable[[Dict], None]] = None,
+                   should_stop: Optional[Callable[[], bool]] = None) -> List[Dict]:
+    """
+    root 아래의 레지스트리 하이브를 파일명이 아닌 'regf' 시그니처로 찾아 해시 / 분류
+
+    폴더 순회는 한 스레드에서 하고, 시그니처 확인 / 해시 / 분류는 스레드 풀에서 실행한다
+    (mmap 페이지 읽기와 hashlib은 GIL을 놓음). 대기 중인 파일 수를 제한하므로 파일이
+    아주 많은 수집 폴더도 메모리를 일정하게 쓴다.
+
+    Returns:
+        경로순 하이브 목록 [{'file_path', 'size', 'sha256', 'hive_type', 'confidence'}]
+    """
+    records = []
+    limit = max(max_workers, 1) * INSPECT_QUEUE_FACTOR
+
+    def collect(done):
+        for future in done:
+            record = future.result()
+            if record is not None:
+                records.append(record)
+                if on_hive_found:
+                    on_hive_found(record)
+
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        pending = set()
+        try:
+            for file_path in iter_files(root):
+                if should_stop and should_stop():
+                    raise AnalysisCancelled()
+                pending.add(executor.submit(inspect_file, file_path))
+                if len(pending) >= limit:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+            collect(as_completed(pending))
+        finally:
+            for future in pending:
+                future.cancel()
+
+    records.sort(key=lambda record: record['file_path'])
+    return records
+
+
+def locate_hive(file_path: str) -> Tuple[str, Optional[str]]:
+    """(볼륨 루트, 사용자 프로필 이름) - 경로의 Windows / Users 폴더 위치로 판단
+
+    <볼륨>/Windows/System32/config/SYSTEM            -> (<볼륨>, None)
+    <볼륨>/Users/alice/NTUSER.DAT                    -> (<볼륨>, 'alice')
+    <볼륨>/Windows/ServiceProfiles/LocalService/...  -> (<볼륨>, 'LocalService')
+    표준 구조가 아니면 파일이 있는 폴더를 볼륨 루트로, 사용자는 None으로 본다.
+    """
+    parts = os.path.abspath(file_path).split(os.sep)
+    lowered = [part.lower() for part in parts]
+
+    user = None
+    for index in range(len(parts) - 2, -1, -1):
+        if lowered[index] in PROFILE_DIRS and index + 2 < len(parts):
+            user = parts[index + 1]
+            break
+        if lowered[index] == SYSTEM_PROFILE_DIR:
+            user = parts[index]
+            break
+
+    for index in range(len(parts) - 2, 0, -1):
+        if lowered[index] == 'windows' and lowered[index + 1] in WINDOWS_SUBDIRS:
+            return os.sep.join(parts[:index]) or os.sep, user
+    for index in range(len(parts) - 3, 0, -1):
+        if lowered[index] in ('users', 'documents and settings'):
+            return os.sep.join(parts[:index]) or os.sep, user
+    return os.path.dirname(os.path.abspath(file_path)), user
+
+
+def host_name(volume_root: str) -> str:
+    """볼륨 루트의 표시 이름 (드라이브 문자 폴더면 그 상위 폴더 이름 - KAPE 호스트 폴더)"""
+    name = os.path.basename(volume_root.rstrip(os.sep))
+    if DRIVE_DIR_RE.match(name):
+        parent = os.path.basename(os.path.dirname(volume_root.rstrip(os.sep)))
+        if parent:
+            return parent
+    return name or volume_root
+
+
+def _rank(record: Dict) -> Tuple:
+    """같은 하이브 후보 정렬 키 - 백업 폴더가 아닌 것, 신뢰도 높은 것 우선"""
+    parts = record['file_path'].lower().split(os.sep)
+    return (any(part in BACKUP_DIRS for part in parts), -record['confidence'], record['file_path'])
+
+
+def _preferred(records: List[Dict]) -> Tuple[Dict, List[Dict]]:
+    """같은 타입 후보 중 분석할 하이브와 나머지"""
+    ordered = sorted(records, key=_rank)
+    return ordered[0], ordered[1:]
+
+
+def group_hives(records: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+    """
+    하이브를 호스트 / 사용자 프로필 그룹으로 묶음
+
+    MultiHiveAnalyzer는 하이브 타입마다 하나씩만 다루므로, 사용자 프로필마다 호스트
+    하이브(SYSTEM / SOFTWARE / ...)와 그 사용자의 NTUSER.DAT / UsrClass.dat을 한 그룹으로
+    만든다. 사용자 하이브가 없는 호스트는 호스트 하이브만으로 한 그룹이 된다.
+    한 호스트 / 프로필 안에서 내용이 같은 파일(SHA-256)은 한 번만 쓰고, 같은 타입이 여럿이면 원본을 골라 나머지는
+    duplicates에 남긴다.
+
+    Returns:
+        (그룹 목록, 그룹에 넣지 못한 하이브 목록 - 타입을 알 수 없는 파일 등)
+        그룹: {'host', 'user', 'volume_root', 'hives': [레코드], 'duplicates': [레코드]}
+    """
+    unassigned = []
+    seen_hashes = {}
+    hosts: Dict[str, Dict] = {}  # 볼륨 루트 -> {'host': {타입: [레코드]}, 'users': {사용자: {타입: [레코드]}}}
+
+    for record in sorted(records, key=_rank):
+        volume_root, user = locate_hive(record['file_path'])
+        # 같은 호스트 (사용자 하이브는 같은 프로필) 안에서 내용이 같은 복사본은 제외
+        # (분석은 그룹이 달라도 해시당 한 번 - analyze_groups)
+        key = (volume_root, user if record['hive_type'] in USER_HIVE_TYPES else None, record['sha256'])
+        if key in seen_hashes:
+            unassigned.append(dict(record, reason=f"duplicate of {seen_hashes[key]}"))
+            continue
+        seen_hashes[key] = record['file_path']
+
+        host = hosts.setdefault(volume_root, {'host': {}, 'users': {}})
+        if record['hive_type'] in HOST_HIVE_TYPES:
+            host['host'].setdefault(record['hive_type'], []).append(record)
+        elif record['hive_type'] in USER_HIVE_TYPES:
+            # 프로필 폴더 밖의 사용자 하이브는 이름 없는 프로필 하나로 묶음
+            host['users'].setdefault(user, {}).setdefault(record['hive_type'], []).append(record)
+        else:
+            unassigned.append(dict(record, reason=f"unknown hive type {record['hive_type']}"))
+
+    groups = []
+    for volume_root in sorted(hosts):
+        host = hosts[volume_root]
+        host_hives, duplicates = [], []
+        for hive_type in HOST_HIVE_TYPES:
+            if hive_type in host['host']:
+                chosen, rest = _preferred(host['host'][hive_type])
+                host_hives.append(chosen)
+                duplicates.extend(rest)
+
+        users = sorted(host['users'], key=lambda user: (user is not None, user or '')) or [None]
+        for user in users:
+            user_hives, user_duplicates = [], []
+            for hive_type in USER_HIVE_TYPES:
+                if hive_type in host['users'].get(user, {}):
+                    chosen, rest = _preferred(host['users'][user][hive_type])
+                    user_hives.append(chosen)
+                    user_duplicates.extend(rest)
+            if not host_hives and not user_hives:
+                continue  # 타입을 알 수 없는 하이브만 있는 폴더
+            groups.append({
+                'host': host_name(volume_root),
+                'user': user,
+                'volume_root': volume_root,
+                'hives': host_hives + user_hives,
+                'duplicates': (duplicates if user == users[0] else []) + user_duplicates
+            })
+    return groups, unassigned
+
+
+def analyze_groups(groups: List[Dict], max_workers: int = DEFAULT_WORKERS,
+                   cache: Optional[ResultCache] = None, only: Optional[List[str]] = None,
+                   suffix_match: bool = False, should_stop: Optional[Callable[[], bool]] = None
+                   ) -> Iterator[Tuple[Dict, MultiHiveAnalyzer, List[Dict]]]:
+    """
+    그룹별 Multi-Hive 분석을 끝나는 대로 생성 - (그룹, 상관관계까지 계산된 분석기, 하이브 상태)
+
+    모든 그룹의 하이브를 프로세스 풀 하나에서 분석하고, 같은 하이브(SHA-256)는 여러
+    그룹(예: 같은 호스트의 사용자들)이 공유해도 한 번만 분석한다. 대기 중인 하이브 수를
+    제한하고 그룹이 끝나면 더 쓰지 않는 결과는 버리므로 그룹이 많아도 메모리가 일정하다.
+    분석기 파서는 호출자가 close()로 해제한다.
+    """
+    # 고유 하이브 -> 분석 작업 (그룹 순서로 제출)
+    jobs: Dict[str, Tuple[str, str]] = {}
+    users: Dict[str, int] = {}  # sha256 -> 이 하이브를 쓰는 남은 그룹 수
+    for group in groups:
+        for record in group['hives']:
+            jobs.setdefault(record['sha256'], (record['file_path'], record['hive_type']))
+            users[record['sha256']] = users.get(record['sha256'], 0) + 1
+
+    results: Dict[str, Tuple[Optional[Dict], Optional[str]]] = {}  # sha256 -> (findings, 오류)
+    emitted = set()
+
+    def finished_groups() -> Iterator[Tuple[Dict, MultiHiveAnalyzer, List[Dict]]]:
+        for index, group in enumerate(groups):
+            if index in emitted or any(record['sha256'] not in results for record in group['hives']):
+                continue
+            emitted.add(index)
+            analyzer = MultiHiveAnalyzer(cache=cache, only=only, suffix_match=suffix_match)
+            statuses = []
+            for record in group['hives']:
+                findings, error = results[record['sha256']]
+                if error is None:
+                    try:
+                        analyzer.add_loaded_hive(record['file_path'], record['hive_type'], findings)
+                    except Exception as e:
+                        error = str(e)
+                statuses.append({'file_path': record['file_path'], 'hive_type': record['hive_type'],
+                                 'success': error is None, 'error': error})
+                users[record['sha256']] -= 1
+                if not users[record['sha256']]:
+                    results[record['sha256']] = (None, None)  # 더 쓰는 그룹이 없으면 결과 해제
+            analyzer.find_correlations()
+            yield group, analyzer, statuses
+
+    def finish(sha256: str, findings: Optional[Dict], error: Optional[str]):
+        if error is not None:
+            print(f"Failed to analyze hive {jobs[sha256][0]}: {error}", file=sys.stderr)
+        results[sha256] = (findings, error)
+
+    queue = list(jobs)
+    workers = min(max_workers, len(queue))
+    if workers > 1:
+        executor = None
+        pending: Dict = {}
+        try:
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=pool_context())
+            limit = workers * ANALYZE_QUEUE_FACTOR
+            while queue or pending:
+                while queue and len(pending) < limit:
+                    sha256 = queue.pop(0)
+                    pending[executor.submit(_load_hive, *jobs[sha256], cache, only)] = sha256
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    sha256 = pending.pop(future)
+                    try:
+                        finish(sha256, future.result()[1], None)
+                    except BrokenProcessPool:
+                        queue.insert(0, sha256)
+                        raise
+                    except Exception as e:
+                        finish(sha256, None, str(e))
+                yield from finished_groups()
+                if should_stop and should_stop() and (queue or pending):
+                    raise AnalysisCancelled()
+        except (OSError, BrokenProcessPool) as e:
+            print(f"Parallel hive loading unavailable, loading serially: {e}", file=sys.stderr)
+            queue = [sha256 for sha256 in pending.values()] + queue
+            pending = {}
+        finally:
+            if executor is not None:
+                # 취소 / 중단 시 대기 중인 하이브는 버리고 실행 중인 워커를 기다리지 않음
+                busy = bool(pending or queue)
+                executor.shutdown(wait=not busy, cancel_futures=busy)
+
+    # 순차 실행 (워커 1개 또는 프로세스 풀 사용 불가 시 남은 하이브)
+    for sha256 in queue:
+        if should_stop and should_stop():
+            raise AnalysisCancelled()
+        try:
+            finish(sha256, _load_hive(*jobs[sha256], cache, only)[1], None)
+        except Exception as e:
+            finish(sha256, None, str(e))
+        yield from finished_groups()
+    yield from finished_groups()  # 하이브가 없는 그룹
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Correlation Engine - 선언형 상관관계 (analyzers/correlations.py) 실행기
+
+조인 키 색인 / 중복 제거 목록 / 키워드 오토마톤은 findings 목록마다 한 번만 만들고
+(목록 객체가 바뀌면 다시 생성), 모든 상관관계가 hash_join / contains_join / group_by
+연산자로 공유한다.
+"""
+
+from bisect import bisect_left
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from core.keyword_automaton import KeywordAutomaton
+from core.registry_parser import canonical_hive_type
+
+
+def _program_key(name: str) -> str:
+    """ShimCache / Amcache 조인 키 - 소문자 파일명에서 '.exe' 제거 (경로면 마지막 구성 요소)"""
+    name = name.lower().replace('/', '\\').rstrip('\\').rsplit('\\', 1)[-1]
+    return name[:-4] if name.endswith('.exe') else name
+
+
+def _drive_key(path: str) -> Optional[str]:
+    """'E:\\...' 경로의 드라이브 문자 (대문자, 드라이브 경로가 아니면 None)"""
+    path = path.upper()
+    return path.partition(':\\')[0] if ':\\' in path else None
+
+
+# 정규화 조인 키 함수 (상관관계 선언에서 이름으로 참조)
+KEY_FUNCTIONS: Dict[str, Callable[[str], Optional[str]]] = {
+    'lower': lambda value: value.lower(),
+    'upper': lambda value: value.upper(),
+    'basename': lambda value: value.lower().split('\\')[-1],  # 소문자 경로의 마지막 구성 요소
+    'program': _program_key,
+    'drive': _drive_key,
+    'drive_letter': lambda value: value.upper() or None,
+}
+
+
+class PathSuffixIndex:
+    """경로 끝부분 검색 색인 - 뒤집은 소문자 경로를 정렬해 두고 접미사를 이진 탐색"""
+
+    def __init__(self, paths: List[str]):
+        self._keys = sorted((path.lower()[::-1], order) for order, path in enumerate(paths))
+        self._reversed = [key for key, _ in self._keys]
+
+    def lookup(self, suffix: str) -> List[int]:
+        """suffix로 끝나는 경로의 번호 (입력 순서)"""
+        suffix = suffix.lower()[::-1]
+        if not suffix:
+            return []
+        start = bisect_left(self._reversed, suffix)
+        orders = []
+        for key, order in self._keys[start:]:
+            if not key.startswith(suffix):
+                break
+            orders.append(order)
+        return sorted(orders)
+
+
+# 조인 행: {별칭: 레코드, 'key': 조인 키, 'match': 'exact' | 'suffix'}
+Row = Dict
+
+_MISSING: Tuple = ()  # 없는 하이브 / 아티팩트 (같은 객체여야 색인 재사용 판단이 맞음)
+
+
+class CorrelationEngine:
+    """선언형 상관관계 실행 - 정규화 키 색인을 findings 목록마다 한 번만 생성"""
+
+    def __init__(self, correlations: Tuple[Dict, ...]):
+        self.correlations = {spec['name']: spec for spec in correlations}
+        self._memo: Dict[tuple, Tuple[tuple, object]] = {}
+
+        # 소스 (하이브, 아티팩트)별로 키워드로 쓰는 필드를 모아 오토마톤 하나로 만듦
+        self._keyword_fields: Dict[Tuple[str, str], List[str]] = {}
+        for spec in correlations:
+            plan = spec['plan']
+            if plan['op'] == 'contains_join':
+                fields = self._keyword_fields.setdefault(spec['sources'][plan['right']], [])
+                fields.extend(field for field in plan['right_fields'] if field not in fields)
+
+    def run(self, name: str, hives: Dict[str, Dict], options: Optional[Dict] = None) -> List[Dict]:
+        """상관관계 하나 실행 - 결과 목록 (조건이 맞지 않으면 빈 목록)
+
+        hives의 키는 하이브 타입 (detect_hive_type 이름이나 'NTUSER' 같은 별칭 모두 가능)
+        """
+        spec = self.correlations[name]
+        options = options or {}
+        hives = {canonical_hive_type(hive_type): hive for hive_type, hive in hives.items()}
+        sources = {alias: self._source(hives, source) for alias, source in spec['sources'].items()}
+
+        if any(not sources[alias] for alias in spec.get('requires', ())):
+            return []
+        if 'requires_any' in spec and not any(sources[alias] for alias in spec['requires_any']):
+            return []
+
+        # 연산자 결과 행은 소스 목록 / 옵션이 같으면 재사용
+        rows = self._cached(('rows', name, tuple(sorted(options.items()))), tuple(sources.values()),
+                            lambda: self._rows(spec, sources, options))
+
+        if spec['emit'] == 'each':
+            return [self._shape(spec['output'], row) for row in rows]
+        # 'summary': 행이 있으면 행 목록 / 개수로 결과 하나
+        if not rows:
+            return []
+        shaped = [self._shape(spec['row'], row) for row in rows] if 'row' in spec else rows
+        return [self._shape(spec['output'], dict(sources, count=len(rows), rows=shaped))]
+
+    def _rows(self, spec: Dict, sources: Dict, options: Dict) -> List[Row]:
+        """plan 연산자 실행"""
+        plan = spec['plan']
+        if plan['op'] == 'hash_join':
+            rows = list(self._hash_join(spec, plan, sources, options))
+        elif plan['op'] == 'contains_join':
+            rows = list(self._contains_join(spec, plan, sources))
+        elif plan['op'] == 'group_by':
+            rows = self._group_by(spec, plan, sources)
+        elif plan['op'] == 'first':
+            rows = [{plan['source']: item} for item in sources[plan['source']][:1]]
+        else:  # 'none' - 소스 전체로 결과 하나
+            rows = [sources]
+        if 'where' in plan:
+            rows = [row for row in rows if plan['where'](row)]
+        return rows
+
+    @staticmethod
+    def _shape(output: Dict, row: Row) -> Dict:
+        """출력 선언 적용 - (별칭, 필드)는 레코드 값, 호출 가능 객체는 row로 계산, 나머지는 상수"""
+        result = {}
+        for field, expr in output.items():
+            if callable(expr):
+                result[field] = expr(row)
+            elif isinstance(expr, tuple):
+                alias, name = expr
+                result[field] = row[alias].get(name)
+            else:
+                result[field] = expr
+        return result
+
+    # ---- 소스 / 색인 (findings 목록 객체가 같으면 재사용) ----
+
+    def _cached(self, key: tuple, deps: tuple, build: Callable[[], object]):
+        """deps 목록 객체가 그대로면 이전에 만든 값 반환"""
+        entry = self._memo.get(key)
+        if entry is not None and len(entry[0]) == len(deps) and all(a is b for a, b in zip(entry[0], deps)):
+            return entry[1]
+        value = build()
+        self._memo[key] = (deps, value)
+        return value
+
+    def _source(self, hives: Dict[str, Dict], source) -> List[Dict]:
+        """(하이브, 아티팩트) 또는 그 튜플 목록 (여러 개면 순서대로 이어 붙임)"""
+        if isinstance(source[0], str):
+            return hives.get(source[0], {}).get('findings', {}).get(source[1], _MISSING)
+        lists = tuple(self._source(hives, part) for part in source)
+        return self._cached(('concat', source), lists, lambda: [item for items in lists for item in items])
+
+    def unique(self, items: List[Dict], field: str, key: str) -> List[Dict]:
+        """키가 같은 레코드는 마지막 것 (순서는 처음 나온 위치)"""
+        def build():
+            normalize = KEY_FUNCTIONS[key]
+            return list({normalize(item.get(field) or ''): item for item in items}.values())
+        return self._cached(('unique', id(items), field, key), (items,), build)
+
+    def index(self, items: List[Dict], field: str, key: str) -> Dict[str, List[Dict]]:
+        """정규화 키 -> 레코드 목록 (입력 순서, 키 함수가 None을 돌려주면 제외)"""
+        def build():
+            normalize = KEY_FUNCTIONS[key]
+            table: Dict[str, List[Dict]] = {}
+            for item in items:
+                value = normalize(item.get(field) or '')
+                if value is not None:
+                    table.setdefault(value, []).append(item)
+            return table
+        return self._cached(('index', id(items), field, key), (items,), build)
+
+    def automaton(self, items: List[Dict], source: Tuple[str, str]) -> KeywordAutomaton:
+        """소스에서 키워드로 쓰는 모든 필드의 소문자 값 (빈 값 제외)으로 만든 오토마톤 (상관관계끼리 공유)"""
+        fields = self._keyword_fields[source]
+        def build():
+            keywords = ((item.get(field) or '').lower() for item in items for field in fields)
+            return KeywordAutomaton(keyword for keyword in keywords if keyword)
+        return self._cached(('automaton', source), (items,), build)
+
+    # ---- 연산자 ----
+
+    def _hash_join(self, spec: Dict, plan: Dict, sources: Dict, options: Dict) -> Iterator[Row]:
+        """왼쪽 레코드마다 정규화 키가 같은 오른쪽 레코드 (선택적으로 경로 끝부분 일치 보조)"""
+        left_field, left_key = plan['left_key']
+        right_field, right_key = plan['right_key']
+        right_items = sources[plan['right']]
+        if 'right_unique' in plan:
+            right_items = self.unique(right_items, *plan['right_unique'])
+        table = self.index(right_items, right_field, right_key)
+        check = plan.get('on')
+
+        suffix_index = None
+        if plan.get('fallback') == 'suffix' and options.get('suffix_match'):
+            suffix_index = self._cached(('suffix', id(right_items), right_field), (right_items,),
+                                        lambda: PathSuffixIndex([item.get(right_field, '') for item in right_items]))
+
+        normalize = KEY_FUNCTIONS[left_key]
+        for left in sources[plan['left']]:
+            value = left.get(left_field) or ''
+            key = normalize(value)
+            if not key:
+                continue
+            matched = False
+            for right in table.get(key, ()):
+                row = {plan['left']: left, plan['right']: right, 'key': key, 'match': 'exact'}
+                if check is None or check(row):
+                    matched = True
+                    yield row
+            if not matched and suffix_index is not None:
+                for order in suffix_index.lookup(value):
+                    yield {plan['left']: left, plan['right']: right_items[order], 'key': key, 'match': 'suffix'}
+
+    def _contains_join(self, spec: Dict, plan: Dict, sources: Dict) -> Iterator[Row]:
+        """왼쪽 텍스트 필드에 오른쪽 키워드 필드 값이 들어 있는 쌍 (오토마톤으로 텍스트당 한 번 순회)"""
+        right_items = sources[plan['right']]
+        automaton = self.automaton(right_items, spec['sources'][plan['right']])
+        if 'right_unique' in plan:
+            right_items = self.unique(right_items, *plan['right_unique'])
+
+        # 키워드 -> 오른쪽 레코드 번호 (빈 값은 키워드가 아님 - 모든 텍스트와 일치하게 됨)
+        owners: Dict[str, List[int]] = {}
+        for order, item in enumerate(right_items):
+            for field in plan['right_fields']:
+                keyword = (item.get(field) or '').lower()
+                if keyword:
+                    owners.setdefault(keyword, []).append(order)
+
+        for left in sources[plan['left']]:
+            found = set()
+            for field in plan['left_fields']:
+                found |= automaton.find((left.get(field) or '').lower())
+            orders = sorted({order for keyword in found for order in owners.get(keyword, ())})
+            for order in orders:
+                yield {plan['left']: left, plan['right']: right_items[order]}
+
+    def _group_by(self, spec: Dict, plan: Dict, sources: Dict) -> List[Row]:
+        """여러 소스의 레코드를 정규화 키로 묶고 출처 / 값 목록 / 합계 집계"""
+        collects = {name for source in plan['inputs'] for name in source.get('collect', {})}
+        sums = {name for source in plan['inputs'] for name in source.get('sum', {})}
+
+        groups: Dict[str, Dict] = {}
+        for source in plan['inputs']:
+            field, key = source['key']
+            label, display = source['label'], source['display']
+            collect = tuple(source.get('collect', {}).items())
+            total = tuple(source.get('sum', {}).items())
+            for value, members in self.index(sources[source['source']], field, key).items():
+                group = groups.get(value)
+                if group is None:
+                    group = groups[value] = {'key': value, 'display': value if display is None
+                                             else members[0].get(display), 'sources': []}
+                    for name in collects:
+                        group[name] = []
+                    for name in sums:
+                        group[name] = 0
+                group['sources'].extend([label] * len(members))
+                for item in members:
+                    for name, item_field in collect:
+                        if item.get(item_field):
+                            group[name].append(item[item_field])
+                    for name, item_field in total:
+                        if item.get(item_field):
+                            group[name] += item[item_field]
+
+        having = plan.get('having')
+        return [group for group in groups.values() if having is None or having(group)]
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Correlations - 하이브 간 상관관계 선언 (CorrelationEngine이 실행)
+"""
+
+from typing import Dict, List, Tuple
+
+
+def _contains_program(path: str, program: str) -> bool:
+    """소문자 경로에 소문자 프로그램 이름 (또는 '.exe'를 뺀 이름)이 들어 있는지"""
+    return program in path or program.replace('.exe', '') in path
+
+
+# 상관관계 목록 (실행 / 결과 순서)
+#   name:         상관관계 이름
+#   sources:      별칭 -> (하이브 타입, findings 결과 키), 튜플 목록이면 순서대로 이어 붙임
+#                 (하이브 타입은 detect_hive_type 이름, 로드한 하이브 타입은 canonical_hive_type으로 맞춤)
+#   requires:     비어 있으면 결과 없음 (모두 필요) / requires_any: 하나라도 있어야 함
+#   plan:         연산자와 조인 키 - 키는 (필드, KEY_FUNCTIONS 이름)
+#     hash_join:     left 레코드마다 정규화 키가 같은 right 레코드 (right_unique: 중복 제거 키,
+#                    on: 같은 키 안에서 추가 조건, fallback 'suffix': 일치가 없으면 경로 끝부분 일치)
+#     contains_join: left 텍스트 필드에 right 키워드 필드 값 (빈 값 제외)이 들어 있는 쌍
+#     group_by:      inputs 소스별 키로 묶고 label / collect(값 목록) / sum(합계) 집계, having 조건
+#     first:         source의 첫 레코드 / none: 소스 전체로 결과 하나
+#     where:         행 조건
+#   emit:         'each' (행마다 결과 하나) / 'summary' (행이 있으면 row 모양 목록 / count로 결과 하나)
+#   output / row: 결과 필드 -> (별칭, 필드) / 행을 받는 함수 / 상수
+CORRELATIONS: Tuple[Dict, ...] = (
+    # ShimCache-Amcache 매칭 - 프로그램 실행 증거 강화
+    {
+        'name': 'shimcache_amcache',
+        'sources': {'shimcache': ('SYSTEM', 'shimcache'), 'amcache': ('Amcache.hve', 'amcache')},
+        'requires': ('shimcache', 'amcache'),
+        'plan': {
+            'op': 'hash_join',
+            'left': 'amcache', 'left_key': ('programName', 'program'),
+            'right': 'shimcache', 'right_key': ('path', 'program'), 'right_unique': ('path', 'lower'),
+            # 프로그램 이름이 경로면 ShimCache 경로가 그 경로를 포함해야 함
+            'on': lambda row: _contains_program((row['shimcache'].get('path') or '').lower(),
+                                                (row['amcache'].get('programName') or '').lower()),
+            'fallback': 'suffix',
+        },
+        'emit': 'each',
+        'output': {
+            'type': 'ShimCache-Amcache Match',
+            'confidence': lambda row: 'MEDIUM' if row['match'] == 'suffix' else 'HIGH',
+            'program': ('amcache', 'programName'),
+            'path': ('shimcache', 'path'),
+            'shimcache_timestamp': ('shimcache', 'timestamp'),
+            'amcache_timestamp': ('amcache', 'timestamp'),
+            'sha1': ('amcache', 'sha1'),
+            'publisher': ('amcache', 'publisher'),
+            'version': ('amcache', 'version'),
+            'significance': 'Program execution confirmed by multiple sources',
+        },
+    },
+    # UserAssist, Prefetch, BAM/DAM, RecentApps 통합 - 사용자 활동 패턴
+    {
+        'name': 'user_activity',
+        'sources': {
+            'userassist': ('NTUSER.DAT', 'userassist'),
+            'prefetch': ('SYSTEM', 'prefetch'),
+            'bam_dam': ('SYSTEM', 'bam_dam'),
+            'recent_apps': ('NTUSER.DAT', 'recent_apps'),
+        },
+        'plan': {
+            'op': 'group_by',
+            # display: 그룹 표시 이름으로 쓸 첫 레코드 필드 (None이면 정규화 키)
+            'inputs': (
+                {'source': 'userassist', 'key': ('program', 'lower'), 'label': 'UserAssist', 'display': 'program',
+                 'collect': {'timestamps': 'lastExecuted'}, 'sum': {'run_count': 'runCount'}},
+                {'source': 'prefetch', 'key': ('program', 'lower'), 'label': 'Prefetch', 'display': 'program',
+                 'collect': {'timestamps': 'timestamp'}, 'sum': {'run_count': 'runCount'}},
+                {'source': 'bam_dam', 'key': ('path', 'basename'), 'label': 'BAM/DAM', 'display': None,
+                 'collect': {'timestamps': 'timestamp'}},
+                {'source': 'recent_apps', 'key': ('appName', 'lower'), 'label': 'RecentApps', 'display': 'appName',
+                 'collect': {'timestamps': 'lastAccess'}, 'sum': {'run_count': 'launchCount'}},
+            ),
+            'having': lambda group: len(group['sources']) >= 2,  # 2개 이상 소스에서 발견
+        },
+        'emit': 'each',
+        'output': {
+            'type': 'User Activity Pattern',
+            'confidence': lambda group: 'HIGH' if len(group['sources']) >= 3 else 'MEDIUM',
+            'program': lambda group: group['display'],
+            'sources': lambda group: list(set(group['sources'])),
+            'source_count': lambda group: len(set(group['sources'])),
+            'timestamps': lambda group: sorted(group['timestamps'])[:5],  # 최근 5개
+            'total_run_count': lambda group: group['run_count'],
+            'significance': lambda group: f'Program activity confirmed by {len(set(group["sources"]))} different sources',
+        },
+    },
+    # USB 장치 연결과 사용자 파일 접근 (Recent Docs, ShellBags 경로의 드라이브 문자)
+    {
+        'name': 'usb_usage',
+        'sources': {
+            'usb_devices': ('SYSTEM', 'usb_devices'),
+            'files': (('NTUSER.DAT', 'recent_docs'), ('NTUSER.DAT', 'shellbags')),
+        },
+        'requires': ('usb_devices',),
+        'plan': {
+            'op': 'hash_join',
+            'left': 'files', 'left_key': ('path', 'drive'),
+            'right': 'usb_devices', 'right_key': ('driveLetter', 'drive_letter'),
+        },
+        'emit': 'summary',
+        'row': {
+            'path': lambda row: row['files'].get('path', ''),
+            'timestamp': ('files', 'timestamp'),
+            'drive': lambda row: row['key'],
+        },
+        'output': {
+            'type': 'USB Device Usage',
+            'confidence': 'HIGH',
+            'usb_devices': lambda summary: [{'serial': usb.get('serialNumber'), 'drive': usb.get('driveLetter')}
+                                            for usb in summary['usb_devices']],
+            'accessed_files': lambda summary: summary['rows'][:20],  # 최대 20개
+            'total_file_count': lambda summary: summary['count'],
+            'significance': lambda summary: f'Found {summary["count"]} files accessed from USB devices',
+        },
+    },
+    # 네트워크 프로필과 WLAN
+    {
+        'name': 'network_activity',
+        'sources': {
+            'network_profiles': ('SOFTWARE', 'network_profiles'),
+            'wlan_profiles': ('SOFTWARE', 'wlan_profiles'),
+        },
+        'requires_any': ('network_profiles', 'wlan_profiles'),
+        'plan': {'op': 'none'},
+        'emit': 'each',
+        'output': {
+            'type': 'Network Activity',
+            'confidence': 'MEDIUM',
+            'network_profiles': lambda row: len(row['network_profiles']),
+            'wlan_profiles': lambda row: len(row['wlan_profiles']),
+            'networks': lambda row: [{'name': p.get('profileName'), 'type': 'Wired'}
+                                     for p in row['network_profiles'][:5]],
+            'wifi_networks': lambda row: [{'ssid': w.get('profileName'), 'type': w.get('connectionType')}
+                                          for w in row['wlan_profiles'][:5]],
+            'significance': lambda row: f'User connected to '
+                                        f'{len(row["network_profiles"]) + len(row["wlan_profiles"])} networks',
+        },
+    },
+    # 자동 실행 프로그램과 설치된 소프트웨어 (표시 이름이 Run 키 명령줄에 포함)
+    {
+        'name': 'autorun_software',
+        'sources': {
+            'run_keys': (('SOFTWARE', 'run_keys'), ('NTUSER.DAT', 'run_keys')),
+            'software': ('SOFTWARE', 'installed_software'),
+        },
+        'requires': ('run_keys', 'software'),
+        'plan': {
+            'op': 'contains_join',
+            'left': 'run_keys', 'left_fields': ('command',),
+            # 표시 이름 중복은 마지막 항목 (순서는 처음 나온 순서)
+            'right': 'software', 'right_fields': ('displayName',), 'right_unique': ('displayName', 'lower'),
+        },
+        'emit': 'summary',
+        'row': {
+            'autorun_program': ('run_keys', 'name'),
+            'autorun_path': ('run_keys', 'command'),
+            'installed_software': ('software', 'displayName'),
+            'publisher': ('software', 'publisher'),
+            'install_date': ('software', 'installDate'),
+        },
+        'output': {
+            'type': 'Autorun Software Correlation',
+            'confidence': 'HIGH',
+            'matched_count': lambda summary: summary['count'],
+            'matches': lambda summary: summary['rows'][:10],  # 최대 10개
+            'significance': lambda summary: f'Found {summary["count"]} autorun programs with matching installed software',
+        },
+    },
+    # 시스템 서비스와 설치된 소프트웨어 (표시 이름 / 설치 위치가 이미지 경로에 포함)
+    {
+        'name': 'services_software',
+        'sources': {
+            'service': ('SYSTEM', 'services_detailed'),
+            'software': ('SOFTWARE', 'installed_software'),
+        },
+        'requires': ('service', 'software'),
+        'plan': {
+            'op': 'contains_join',
+            'left': 'service', 'left_fields': ('imagePath',),
+            'right': 'software', 'right_fields': ('displayName', 'installLocation'),
+        },
+        'emit': 'summary',
+        'row': {
+            'service_name': ('service', 'serviceName'),
+            'service_type': ('service', 'startType'),
+            'image_path': ('service', 'imagePath'),
+            'software': ('software', 'displayName'),
+            'publisher': ('software', 'publisher'),
+        },
+        'output': {
+            'type': 'Services-Software Correlation',
+            'confidence': 'MEDIUM',
+            'matched_count': lambda summary: summary['count'],
+            'matches': lambda summary: summary['rows'][:10],
+            'significance': lambda summary: f'Found {summary["count"]} services associated with installed software',
+        },
+    },
+    # 시간대 정보 (타임라인 해석 기준)
+    {
+        'name': 'timezone_timeline',
+        'sources': {'timezone': ('SYSTEM', 'timezone')},
+        'plan': {'op': 'first', 'source': 'timezone', 'where': lambda row: row['timezone'].get('bias') is not None},
+        'emit': 'each',
+        'output': {
+            'type': 'Timezone Information',
+            'confidence': 'HIGH',
+            'timezone': ('timezone', 'standardName'),
+            'utc_offset': lambda row: f'UTC{-(row["timezone"]["bias"] // 60):+d}:00',
+            'bias_minutes': ('timezone', 'bias'),
+            'significance': lambda row: f'All timestamps should be interpreted in '
+                                        f'{row["timezone"].get("standardName")} timezone',
+        },
+    },
+)
+
+
+def required_hives(spec: Dict) -> List[str]:
+    """상관관계가 읽는 하이브 타입 (선언 순서)"""
+    hives: List[str] = []
+    for source in spec['sources'].values():
+        for hive_type, _ in ([source] if isinstance(source[0], str) else source):
+            if hive_type not in hives:
+                hives.append(hive_type)
+    return hives
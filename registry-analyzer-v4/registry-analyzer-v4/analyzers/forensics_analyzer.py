@@ -5,7 +5,7 @@ Forensics Analyzer - 포렌식 분석기
 
 import re
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 # 상위 디렉토리의 core 모듈 import
 import sys
@@ -13,19 +13,137 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.registry_parser import RegistryParser
+from analyzers.manifest import ANALYZER_MANIFEST, plan_analyzers, search_needles
+from utils.result_cache import ResultCache
+
+
+# 경로 정리용 정규식
+NON_PRINTABLE_ASCII = re.compile(r'[^\x20-\x7e]+')
+# 경로 뒤에 붙은 셀 시그니처 이하 제거 ('.lnk' 확장자의 'nk'는 시그니처가 아님)
+REGISTRY_SIGNATURE_TAIL = re.compile(r'(vk|(?<!\.l)nk|lh|sk)(?![a-z]).*$', re.IGNORECASE)
+
+class AnalysisCancelled(Exception):
+    """분석 취소 (should_stop 콜백이 True를 돌려줌)"""
 
 
 class ForensicsAnalyzer:
     """포렌식 분석기"""
     
-    def __init__(self, parser: RegistryParser, hive_type: str):
+    # 레코드를 확정 즉시 내보내는 모듈: 결과 키 -> (중복 판단 키, 최대 개수)
+    #   먼저 나온 레코드가 남으므로 후보마다 바로 판단할 수 있다.
+    #   키가 None이면 중복 제거 없음, 키 값이 비어 있으면 레코드를 버린다.
+    #   (shimcache / amcache / userassist / bam_dam은 더 나은 후보로 교체되므로 제외)
+    STREAM_DEDUP = {
+        'usb_devices': (None, None),
+        'recent_docs': (lambda item: item.get('document', '').lower(), None),
+        'run_keys': (lambda item: item.get('command', '').lower(), None),
+        'sam_users': (lambda item: item.get('username', '').lower(), None),
+        'network_profiles': (None, None),
+        'shellbags': (lambda item: item.get('path', '').lower(), 100),
+        'muicache': (lambda item: item.get('path', '').lower(), 100),
+        'prefetch': (lambda item: item.get('program', '').lower(), 100),
+        'lnk_files': (lambda item: item.get('lnkPath', '').lower(), 100),
+        'installed_software': (lambda item: item.get('displayName', ''), 150),
+        'security_detailed': (None, 100),
+        'typed_paths': (lambda item: item.get('path', '').lower(), 50),
+        'recent_apps': (lambda item: item.get('appName', '').lower(), 100),
+        'services_detailed': (lambda item: (item.get('imagePath'), item.get('displayName'))
+                              if item.get('imagePath') or item.get('displayName') else None, 100),
+        'wlan_profiles': (lambda item: item.get('profileName', ''), 50),
+        'timezone': (None, 10),
+    }
+    
+    def __init__(self, parser: RegistryParser, hive_type: str, cache: Optional[ResultCache] = None,
+                 only: Optional[List[str]] = None):
         self.parser = parser
         self.hive_type = hive_type.upper()
+        self.cache = cache  # 하이브 내용 해시 기반 결과 캐시 (run_analyzers에서 사용)
+        # 적용되는 (only가 있으면 그중 선택한) 분석 모듈만 실행 / 패턴 등록 (한 번의 순회로 모두 스캔)
+        self.scheduled, self.skipped = plan_analyzers(self.hive_type, only)
+        for name in self.scheduled:
+            self.parser.register_patterns(search_needles(name))
+    
+    def run_analyzers(self, max_workers: int = 1,
+                      on_analyzer_done: Optional[Callable[[str, int], None]] = None,
+                      should_stop: Optional[Callable[[], bool]] = None) -> Dict[str, List[Dict]]:
+        """적용되는 분석 모듈 실행 - 건너뛴 모듈도 빈 결과로 키 유지 (매니페스트 순서)
+
+        max_workers > 1이면 모듈을 프로세스 풀에 나눠 실행 (결과는 순차 실행과 동일)
+        on_analyzer_done(결과 키, 레코드 수)는 모듈이 끝날 때마다 호출 (진행 표시용)
+        should_stop()이 True를 돌려주면 AnalysisCancelled 발생
+        cache가 있으면 (하이브 SHA-256, 모듈, 버전, 하이브 타입)으로 저장된 결과를 쓰고 나머지만 실행
+        (모듈이 하이브 타입에 따라 빈 결과를 내므로 타입을 바꿔 다시 분석하면 따로 저장)
+        """
+        findings = {name: [] for name in ANALYZER_MANIFEST}
+        pending = list(self.scheduled)
+        
+        digest = None
+        options = {'hive_type': self.hive_type}  # 결과가 달라지는 분석 옵션
+        if self.cache is not None and self.cache.enabled:
+            digest = self.parser.content_hash()
+            for name in self.scheduled:
+                cached = self.cache.get(digest, name, ANALYZER_MANIFEST[name]['version'], options)
+                if cached is not None:
+                    findings[name] = cached
+                    pending.remove(name)
+                    if on_analyzer_done:
+                        on_analyzer_done(name, len(cached))
+        
+        if max_workers > 1 and pending:
+            from analyzers.parallel import run_analyzers_parallel
+            computed = run_analyzers_parallel(self, max_workers, on_analyzer_done, should_stop, pending)
+            for name in pending:
+                findings[name] = computed[name]
+        else:
+            for name in pending:
+                if should_stop and should_stop():
+                    raise AnalysisCancelled()
+                for record in self._iter_records(name):
+                    findings[name].append(record)
+                    if should_stop and should_stop():
+                        raise AnalysisCancelled()
+                if on_analyzer_done:
+                    on_analyzer_done(name, len(findings[name]))
+        
+        if digest is not None:
+            for name in pending:
+                self.cache.put(digest, name, ANALYZER_MANIFEST[name]['version'], findings[name], options)
+        return findings
+    
+    def iter_findings(self) -> Iterator[Tuple[str, Dict]]:
+        """(결과 키, 레코드)를 확정되는 대로 생성 - 모으면 run_analyzers 결과와 같음"""
+        for name in ANALYZER_MANIFEST:
+            if name in self.scheduled:
+                for record in self._iter_records(name):
+                    yield name, record
+    
+    def _iter_records(self, name: str) -> Iterator[Dict]:
+        """분석 모듈 하나의 최종 레코드 생성 (후보를 받는 즉시 중복 확인, 최대 개수에서 중단)"""
+        if name not in self.STREAM_DEDUP:
+            # 나중 후보로 교체될 수 있는 모듈은 끝까지 모아 병합 / 정렬한 결과를 내보냄
+            yield from getattr(self, ANALYZER_MANIFEST[name]['method'])()
+            return
+        
+        key, limit = self.STREAM_DEDUP[name]
+        seen = set()
+        count = 0
+        for record in getattr(self, '_iter_' + name)():
+            if key is not None:
+                value = key(record)
+                if not value or value in seen:
+                    continue
+                seen.add(value)
+            yield record
+            count += 1
+            if count == limit:
+                return
     
     def analyze_shimcache(self) -> List[Dict]:
         """ShimCache (AppCompatCache) 분석 - PROFESSIONAL UPGRADE"""
-        results = []
-        
+        return self._deduplicate_shimcache_entries(self._iter_shimcache())
+    
+    def _iter_shimcache(self) -> Iterator[Dict]:
+        """ShimCache 후보 레코드 (중복 제거 전)"""
         # .exe, .dll 등의 실행 파일 경로 검색
         patterns = ['.exe', '.dll', '.sys', '.scr']
         
@@ -43,20 +161,20 @@ class ForensicsAnalyzer:
                     # Extract file size (DWORD, 4-byte)
                     file_size = self._extract_shimcache_filesize(offset)
                     
-                    results.append({
+                    yield {
                         'path': path,
                         'timestamp': timestamp,
                         'fileSize': file_size,
                         'type': 'ShimCache',
                         'offset': offset
-                    })
-        
-        return self._deduplicate_shimcache_entries(results)
+                    }
     
     def analyze_userassist(self) -> List[Dict]:
         """UserAssist 분석 (사용자 활동 추적) - PROFESSIONAL UPGRADE"""
-        results = []
-        
+        return self._deduplicate_userassist_entries(self._iter_userassist())
+    
+    def _iter_userassist(self) -> Iterator[Dict]:
+        """UserAssist 후보 레코드 (중복 제거 전)"""
         # ROT13으로 인코딩된 GUID 검색
         userassist_patterns = [
             'HRZR_PGYFRFFVBA',  # ROT13: UEME_CTLSESSION
@@ -64,9 +182,8 @@ class ForensicsAnalyzer:
         ]
         
         for pattern in userassist_patterns:
-            offsets = self.parser.search_pattern(pattern)
-            
-            for offset in offsets:  # Increased from 20 to 50
+            # 값 이름은 ASCII / UTF-16 LE 두 형태로 저장될 수 있음
+            for offset, _ in self.parser.search_pattern_encoded(pattern):
                 # 주변 데이터 분석
                 context = self._get_context_strings(offset, 200)
                 
@@ -88,24 +205,24 @@ class ForensicsAnalyzer:
                             # Remove UEME_ prefix if exists
                             cleaned_program = decoded.replace('UEME_', '')
                             
-                            results.append({
+                            yield {
                                 'program': cleaned_program,
                                 'runCount': run_count,
                                 'focusTime': focus_time,
                                 'lastExecuted': last_executed,
                                 'type': 'UserAssist',
                                 'offset': offset
-                            })
-        
-        return self._deduplicate_userassist_entries(results)
+                            }
     
     def analyze_amcache(self) -> List[Dict]:
         """Amcache 분석 (프로그램 설치 및 실행 정보)"""
-        results = []
-        
+        return self._deduplicate_amcache_entries(self._iter_amcache())
+    
+    def _iter_amcache(self) -> Iterator[Dict]:
+        """Amcache 후보 레코드 (중복 제거 전)"""
         # Amcache.hve 전용
         if 'AMCACHE' not in self.hive_type.upper() and '.HVE' not in self.hive_type.upper():
-            return []
+            return
         
         # 실행 파일 패턴
         patterns = ['.exe', '.dll', '.sys', '.msi']
@@ -136,7 +253,7 @@ class ForensicsAnalyzer:
                 
                 program_name = file_path.split('\\')[-1] if '\\' in file_path else file_path
                 
-                results.append({
+                yield {
                     'programName': program_name,
                     'filePath': file_path,
                     'sha1': sha1,
@@ -146,7 +263,7 @@ class ForensicsAnalyzer:
                     'version': version,
                     'type': 'Amcache',
                     'offset': offset
-                })
+                }
         
         # 프로그램 정보 필드로도 검색
         program_patterns = ['ProgramName', 'Publisher', 'InstallDate']
@@ -158,7 +275,7 @@ class ForensicsAnalyzer:
                 if program_name and len(program_name) > 2:
                     file_path = self._extract_path_at_offset(offset)
                     
-                    results.append({
+                    yield {
                         'programName': program_name,
                         'filePath': file_path or '',
                         'sha1': self._extract_sha1_hash(offset),
@@ -168,15 +285,14 @@ class ForensicsAnalyzer:
                         'version': self._extract_version(offset),
                         'type': 'Amcache',
                         'offset': offset
-                    })
-        
-        # 중복 제거 (더 많은 정보를 가진 엔트리 우선)
-        return self._deduplicate_amcache_entries(results)
+                    }
     
     def analyze_bam_dam(self) -> List[Dict]:
         """BAM/DAM (Background Activity Moderator) 분석 - PROFESSIONAL UPGRADE"""
-        results = []
-        
+        return self._deduplicate_bamdam_entries(self._iter_bam_dam())
+    
+    def _iter_bam_dam(self) -> Iterator[Dict]:
+        """BAM/DAM 후보 레코드 (중복 제거 전)"""
         # BAM/DAM 관련 패턴
         patterns = ['\\Device\\HarddiskVolume', 'SystemRoot']
         
@@ -184,7 +300,7 @@ class ForensicsAnalyzer:
             offsets = self.parser.search_pattern(pattern)
             
             for offset in offsets:  # Increased from 30 to 50
-                path = self._extract_path_at_offset(offset)
+                path = self._extract_path_at_offset(offset, allow_device=True)
                 
                 if path and '\\' in path:
                     # Convert device path to drive letter (e.g., C:\)
@@ -202,20 +318,20 @@ class ForensicsAnalyzer:
                     # Extract user SID
                     user_sid = self._extract_user_sid(offset)
                     
-                    results.append({
+                    yield {
                         'path': converted_path,
                         'timestamp': timestamp,
                         'userSID': user_sid,
                         'type': 'BAM/DAM',
                         'offset': offset
-                    })
-        
-        return self._deduplicate_bamdam_entries(results)
+                    }
     
     def analyze_usb_devices(self) -> List[Dict]:
         """USB 장치 분석 (타임스탬프 추가)"""
-        results = []
-        
+        return list(self._iter_records('usb_devices'))
+    
+    def _iter_usb_devices(self) -> Iterator[Dict]:
+        """USB 장치 후보 레코드 (중복 제거 전)"""
         # USB 관련 패턴
         usb_patterns = ['VID_', 'PID_', 'USBSTOR', '\\??\\USB#']
         
@@ -242,7 +358,7 @@ class ForensicsAnalyzer:
                     if name_match:
                         device_name = name_match.group(1)
                     
-                    results.append({
+                    yield {
                         'device': context,
                         'vid': vid_match.group(1) if vid_match else None,
                         'pid': pid_match.group(1) if pid_match else None,
@@ -251,37 +367,35 @@ class ForensicsAnalyzer:
                         'timestamp': timestamp,
                         'type': 'USB Device',
                         'offset': offset
-                    })
-        
-        return results
+                    }
     
     def analyze_recent_docs(self) -> List[Dict]:
         """최근 문서 분석 (개선된 버전)"""
-        results = []
-        
-        # NTUSER.DAT 하이브에서만 정확한 분석 가능
-        if self.hive_type in ['NTUSER.DAT', 'UsrClass.dat']:
+        return list(self._iter_records('recent_docs'))
+    
+    def _iter_recent_docs(self) -> Iterator[Dict]:
+        """최근 문서 후보 레코드 (중복 제거 전)"""
+        # NTUSER.DAT / UsrClass.dat 하이브에서만 정확한 분석 가능 (대문자 타입에 포함되면 적용)
+        if 'NTUSER' in self.hive_type or 'USRCLASS' in self.hive_type:
+            found = 0
+            
             # RecentDocs 키 패턴 검색
             recentdocs_patterns = [
-                b'RecentDocs',
-                b'\\Explorer\\RecentDocs',
-                b'OpenSavePidlMRU'
+                'RecentDocs',
+                '\\Explorer\\RecentDocs',
+                'OpenSavePidlMRU'
             ]
             
             for pattern in recentdocs_patterns:
-                found = False
-                offset = 0
-                while offset < self.parser.size:
-                    pos = self.parser.data.find(pattern, offset)
-                    if pos == -1:
-                        break
-                    found = True
-                    
+                for pos in self.parser.search_pattern(pattern):
                     # RecentDocs 근처에서 파일 경로 추출 시도
+                    end = pos  # 직전에 찾은 파일명 끝 (그 안의 시작 위치는 같은 이름의 뒷부분)
                     for back in range(0, 500, 2):
                         test_offset = pos + back
                         if test_offset >= self.parser.size:
                             break
+                        if test_offset < end:
+                            continue
                         
                         # Unicode 파일명 추출
                         filename = self.parser.read_unicode_string(test_offset, 520)
@@ -291,15 +405,16 @@ class ForensicsAnalyzer:
                             # 타임스탬프 추출 시도
                             timestamp = self._find_nearby_timestamp(pos)
                             
-                            results.append({
+                            yield {
                                 'document': filename,
                                 'timestamp': timestamp,
                                 'type': 'RecentDocs (NTUSER.DAT)',
                                 'offset': pos
-                            })
+                            }
+                            found += 1
+                            end = test_offset + len(filename) * 2
                     
-                    offset = pos + 1
-                    if len(results) > 100:  # 너무 많으면 중단
+                    if found > 100:  # 너무 많으면 중단
                         break
         
         # 다른 하이브에서는 기본 패턴 검색 (덜 정확)
@@ -316,26 +431,25 @@ class ForensicsAnalyzer:
                         # 타임스탬프 추출 시도
                         timestamp = self._find_nearby_timestamp(offset)
                         
-                        results.append({
+                        yield {
                             'document': path,
                             'timestamp': timestamp,
                             'type': 'Document Path',
                             'offset': offset
-                        })
-        
-        return self._deduplicate_by_path(results)
+                        }
     
     def analyze_run_keys(self) -> List[Dict]:
         """Run/RunOnce 키 분석 (자동 시작 프로그램)"""
-        results = []
-        
+        return list(self._iter_records('run_keys'))
+    
+    def _iter_run_keys(self) -> Iterator[Dict]:
+        """Run/RunOnce 키 후보 레코드 (중복 제거 전)"""
         # Run 키 패턴
         run_patterns = ['Run', 'RunOnce', 'RunServices']
         
         for pattern in run_patterns:
-            offsets = self.parser.search_pattern(pattern)
-            
-            for offset in offsets:
+            # 키 이름은 ASCII / UTF-16 LE 두 형태로 저장될 수 있음
+            for offset, _ in self.parser.search_pattern_encoded(pattern):
                 # 주변에서 실행 경로 찾기
                 for i in range(-200, 200, 2):
                     test_offset = offset + i
@@ -345,22 +459,22 @@ class ForensicsAnalyzer:
                     path = self.parser.read_unicode_string(test_offset, 500)
                     
                     if self._is_valid_executable_path(path):
-                        results.append({
+                        yield {
                             'name': pattern,
                             'command': path[:200],
                             'type': 'Auto-Start',
                             'offset': offset
-                        })
+                        }
                         break
-        
-        return self._deduplicate_by_command(results)
     
     def analyze_sam_users(self) -> List[Dict]:
         """SAM 사용자 계정 분석 (타임스탬프 추가)"""
+        return list(self._iter_records('sam_users'))
+    
+    def _iter_sam_users(self) -> Iterator[Dict]:
+        """SAM 사용자 계정 후보 레코드 (중복 제거 전)"""
         if self.hive_type != 'SAM':
-            return []
-        
-        results = []
+            return
         
         # SID 패턴 (S-1-5-21-...)
         sid_pattern = 'S-1-5-21'
@@ -378,24 +492,22 @@ class ForensicsAnalyzer:
                 
                 # 계정 생성 시간 추출 시도 (다른 위치에서)
                 created_time = None
-                for back in range(100, 500, 8):
-                    test_offset = offset - back
-                    if test_offset < 0:
-                        break
+                candidates = self.parser.filetime_index(1996, 2029).candidates(offset - 492, offset - 99)
+                for test_offset in reversed(list(candidates)):  # offset-100부터 뒤로
                     filetime = self.parser.read_qword(test_offset)
                     dt = self.parser.filetime_to_datetime(filetime)
                     if dt and 1995 < dt.year < 2030:
                         created_time = dt.strftime('%Y-%m-%d %H:%M:%S')
                         break
                 
-                results.append({
+                yield {
                     'username': username,
                     'sid': sid,
                     'lastLogin': last_login,
                     'created': created_time,
                     'type': 'User Account',
                     'offset': offset
-                })
+                }
         
         # Administrator, Guest 등 기본 계정 검색
         default_users = ['Administrator', 'Guest', 'DefaultAccount']
@@ -403,47 +515,56 @@ class ForensicsAnalyzer:
             offsets = self.parser.search_pattern(user)
             if offsets:
                 timestamp = self._find_nearby_timestamp(offsets[0])
-                results.append({
+                yield {
                     'username': user,
                     'sid': 'Unknown',
                     'lastLogin': timestamp,
                     'created': None,
                     'type': 'User Account',
                     'offset': offsets[0]
-                })
-        
-        return self._deduplicate_by_username(results)
+                }
     
     def analyze_network_profiles(self) -> List[Dict]:
         """네트워크 프로필 분석"""
-        results = []
-        
+        return list(self._iter_records('network_profiles'))
+    
+    def _iter_network_profiles(self) -> Iterator[Dict]:
+        """네트워크 프로필 후보 레코드 (중복 제거 전)"""
         network_patterns = ['ProfileName', 'Description', 'SSID']
         
         for pattern in network_patterns:
-            offsets = self.parser.search_pattern(pattern)
-            
-            for offset in offsets[:10]:
-                name = self.parser.read_unicode_string(offset + 20, 100)
+            for offset, encoding in self._encoded_anchors(pattern, 10):
+                # ASCII 이름은 기존 위치 (+20), UTF-16 이름은 이름과 종료 문자 바로 뒤
+                name_offset = offset + 20 if encoding == 'ascii' else offset + len(pattern) * 2 + 2
+                name = self.parser.read_unicode_string(name_offset, 100)
                 
                 if name and len(name) > 2:
-                    results.append({
+                    yield {
                         'network': name,
                         'type': 'Network Profile',
                         'offset': offset
-                    })
-        
-        return results
+                    }
     
     # Helper methods
-    def _extract_path_at_offset(self, offset: int) -> str:
-        """오프셋에서 경로 추출 (improved with printable filter)"""
-        # ASCII 시도
-        for back in range(0, 500, 1):
-            test_offset = offset - back
-            if test_offset < 0:
-                break
-            
+    def _encoded_anchors(self, pattern: str, limit: int) -> List[Tuple[int, str]]:
+        """ASCII / UTF-16 LE 앵커 (오프셋, 인코딩) - 인코딩마다 앞에서 limit개, 오프셋 순"""
+        counts = {}
+        anchors = []
+        for offset, encoding in self.parser.search_pattern_encoded(pattern):
+            if counts.get(encoding, 0) < limit:
+                counts[encoding] = counts.get(encoding, 0) + 1
+                anchors.append((offset, encoding))
+        return anchors
+    
+    def _extract_path_at_offset(self, offset: int, allow_device: bool = False) -> str:
+        """오프셋에서 경로 추출 (improved with printable filter)
+        
+        allow_device가 True이면 드라이브 문자 경로가 없을 때 '\\Device\\' 경로도 반환
+        """
+        boundaries = self.parser.path_boundaries()
+        
+        # ASCII 시도 (':\\'가 나올 수 있는 시작 위치만, 가까운 순)
+        for test_offset in boundaries.ascii_starts(offset):
             path = self.parser.read_string(test_offset, 500)
             if ':\\' in path and len(path) > 5:
                 # 드라이브 문자부터 추출
@@ -451,62 +572,59 @@ class ForensicsAnalyzer:
                 if drive_idx > 0:
                     path = path[drive_idx-1:]
                     # Keep only printable ASCII
-                    path = ''.join(c for c in path if 32 <= ord(c) <= 126)
+                    path = NON_PRINTABLE_ASCII.sub('', path)
                     # Remove registry signatures
-                    import re
-                    path = re.sub(r'(vk|nk|lh|sk)(?![a-z]).*$', '', path, flags=re.IGNORECASE)
+                    path = REGISTRY_SIGNATURE_TAIL.sub('', path)
                     if ';' in path:
                         path = path[:path.index(';')]
                     return path.strip()
         
         # Unicode 시도
-        for back in range(0, 500, 2):
-            test_offset = offset - back
-            if test_offset < 0:
-                break
-            
+        for test_offset in boundaries.utf16_starts(offset):
             path = self.parser.read_unicode_string(test_offset, 500)
             if ':\\' in path and len(path) > 5:
                 drive_idx = path.find(':\\')
                 if drive_idx > 0:
                     clean_path = path[drive_idx-1:]
                     # Keep only printable ASCII
-                    clean_path = ''.join(c for c in clean_path if c.isprintable() and ord(c) < 127)
+                    clean_path = NON_PRINTABLE_ASCII.sub('', clean_path)
                     # Remove registry signatures
-                    import re
-                    clean_path = re.sub(r'(vk|nk|lh|sk)(?![a-z]).*$', '', clean_path, flags=re.IGNORECASE)
+                    clean_path = REGISTRY_SIGNATURE_TAIL.sub('', clean_path)
                     if ';' in clean_path:
                         clean_path = clean_path[:clean_path.index(';')]
                     return clean_path.strip()
         
+        # \Device\ 경로 시도 (BAM/DAM)
+        if allow_device:
+            prefix = boundaries.device_prefix(offset)
+            if prefix:
+                position, encoding = prefix
+                if encoding == 'ascii':
+                    path = self.parser.read_string(position, 500)
+                else:
+                    path = self.parser.read_unicode_string(position, 500)
+                # Keep only printable ASCII
+                path = NON_PRINTABLE_ASCII.sub('', path)
+                # Remove registry signatures
+                path = REGISTRY_SIGNATURE_TAIL.sub('', path)
+                if ';' in path:
+                    path = path[:path.index(';')]
+                return path.strip()
+        
         return ""
     
     def _get_context_strings(self, offset: int, range_size: int) -> List[str]:
-        """오프셋 주변 문자열 추출"""
-        strings = []
+        """오프셋 주변 문자열 추출 (문자열 테이블 범위 질의)"""
         start = max(0, offset - range_size)
         end = min(self.parser.size, offset + range_size)
         
         # ASCII
-        current = ""
-        for i in range(start, end):
-            byte = self.parser.data[i]
-            if 32 <= byte <= 126:
-                current += chr(byte)
-            else:
-                if len(current) >= 4:
-                    strings.append(current)
-                current = ""
-        
-        return strings
+        return self.parser.string_table().strings_in_range(start, end)
     
     def _find_nearby_timestamp(self, offset: int) -> str:
         """주변에서 타임스탬프 찾기"""
-        # 8바이트 FILETIME 검색
-        for i in range(offset - 100, offset + 100, 8):
-            if i < 0 or i + 8 > self.parser.size:
-                continue
-            
+        # 8바이트 FILETIME 검색 (후보 인덱스)
+        for i in self.parser.filetime_index(1991, 2099).candidates(offset - 100, offset + 100):
             filetime = self.parser.read_qword(i)
             dt = self.parser.filetime_to_datetime(filetime)
             
@@ -518,24 +636,26 @@ class ForensicsAnalyzer:
     def _extract_shimcache_path(self, offset: int) -> str:
         """ShimCache 경로 추출 (improved 500-byte backward search)"""
         best_path = ""
+        seen_spans = set()
         
-        # Unicode path search (primary method)
-        for back in range(0, 500, 2):
-            test_offset = offset - back
-            if test_offset < 0:
-                break
-            
+        boundaries = self.parser.path_boundaries()
+        
+        # Unicode path search (primary method, only starts that can reach a drive letter)
+        for test_offset in boundaries.utf16_starts(offset, 520):
             path = self.parser.read_unicode_string(test_offset, 520)  # 260 chars * 2
             if ':\\' in path and ('.' in path or '\\' in path):
                 # Extract from drive letter
                 drive_idx = path.find(':\\')
                 if drive_idx > 0:
                     clean_path = path[drive_idx-1:]
+                    # 이전 시작 위치와 같은 경로 구간이면 결과도 같음
+                    if clean_path in seen_spans:
+                        continue
+                    seen_spans.add(clean_path)
                     # Keep only printable ASCII characters
-                    clean_path = ''.join(c for c in clean_path if c.isprintable() and ord(c) < 127)
+                    clean_path = NON_PRINTABLE_ASCII.sub('', clean_path)
                     # Remove registry signatures at end (vk, nk, lh, sk not followed by letter)
-                    import re
-                    clean_path = re.sub(r'(vk|nk|lh|sk)(?![a-z]).*$', '', clean_path, flags=re.IGNORECASE)
+                    clean_path = REGISTRY_SIGNATURE_TAIL.sub('', clean_path)
                     # Also remove anything after semicolon
                     if ';' in clean_path:
                         clean_path = clean_path[:clean_path.index(';')]
@@ -548,21 +668,16 @@ class ForensicsAnalyzer:
             return best_path
         
         # Fallback to ASCII
-        for back in range(0, 500, 1):
-            test_offset = offset - back
-            if test_offset < 0:
-                break
-            
+        for test_offset in boundaries.ascii_starts(offset):
             path = self.parser.read_string(test_offset, 500)
             if ':\\' in path and len(path) > 5:
                 drive_idx = path.find(':\\')
                 if drive_idx > 0:
                     path = path[drive_idx-1:]
                     # Keep only ASCII printable
-                    path = ''.join(c for c in path if 32 <= ord(c) <= 126)
+                    path = NON_PRINTABLE_ASCII.sub('', path)
                     # Remove registry signatures
-                    import re
-                    path = re.sub(r'(vk|nk|lh|sk)(?![a-z]).*$', '', path, flags=re.IGNORECASE)
+                    path = REGISTRY_SIGNATURE_TAIL.sub('', path)
                     if ';' in path:
                         path = path[:path.index(';')]
                     return path.strip()
@@ -571,11 +686,8 @@ class ForensicsAnalyzer:
     
     def _extract_shimcache_timestamp(self, offset: int) -> str:
         """ShimCache 타임스탬프 추출 (FILETIME, 8-byte QWORD)"""
-        # Search within 200 bytes range
-        for i in range(offset - 100, offset + 100, 8):
-            if i < 0 or i + 8 > self.parser.size:
-                continue
-            
+        # Search within 200 bytes range (FILETIME candidate index)
+        for i in self.parser.filetime_index(1996, 2029).candidates(offset - 100, offset + 100):
             filetime = self.parser.read_qword(i)
             dt = self.parser.filetime_to_datetime(filetime)
             
@@ -626,18 +738,17 @@ class ForensicsAnalyzer:
     def _extract_sha1_hash(self, offset: int) -> str:
         """SHA1 해시 추출 (20바이트 = 40자 hex)"""
         try:
-            for i in range(offset - 100, offset + 100):
-                if i < 0 or i + 20 > self.parser.size:
-                    continue
-                
-                hash_bytes = self.parser.data[i:i+20]
-                hex_str = hash_bytes.hex().upper()
-                
-                # 유효한 SHA1 (모두 0이 아님)
-                if len(hex_str) == 40 and hex_str != '0' * 40:
-                    # 최소한의 엔트로피 확인
-                    if len(set(hex_str)) > 4:  # 4가지 이상의 다른 문자
-                        return hex_str
+            extractor = self.parser.candidate_extractor()
+            
+            # Amcache FileId 값 ('0000' + SHA1, UTF-16) 우선
+            file_id = extractor.file_id_near(offset)
+            if file_id:
+                return file_id
+            
+            # 유효한 SHA1 (모두 0이 아님, 4가지 이상의 다른 hex 문자) - 롤링 창 통계
+            position = extractor.first_hash_window(offset - 100, offset + 100)
+            if position is not None:
+                return self.parser.data[position:position + 20].hex().upper()
         except:
             pass
         
@@ -665,17 +776,17 @@ class ForensicsAnalyzer:
         try:
             patterns = ['Publisher', 'Company', 'Vendor', 'Manufacturer']
             
+            extractor = self.parser.candidate_extractor()
+            
             for pattern in patterns:
-                for i in range(offset - 500, offset + 500):
-                    if i < 0:
-                        continue
-                    
+                # 키워드가 200바이트 창에 들어올 수 있는 시작 위치만 검사
+                for i in extractor.keyword_starts(pattern, offset - 500, offset + 500, 200):
                     text = self.parser.read_unicode_string(i, 200)
                     if pattern in text:
                         # 패턴 다음의 문자열 추출
                         after_pattern = text[text.index(pattern) + len(pattern):]
                         # 출력 가능한 ASCII만 남기기
-                        cleaned = ''.join(c for c in after_pattern if 32 <= ord(c) <= 126)
+                        cleaned = NON_PRINTABLE_ASCII.sub('', after_pattern)
                         cleaned = cleaned.strip()
                         if 0 < len(cleaned) < 100:
                             return cleaned
@@ -799,10 +910,8 @@ class ForensicsAnalyzer:
         """UserAssist Last Executed Timestamp 추출 (FILETIME)"""
         try:
             # Search within 200 bytes range for FILETIME (8-byte)
-            for i in range(offset - 100, offset + 100, 8):
-                if i < 0:
-                    continue
-                
+            index = self.parser.filetime_range_index(116444736000000000, 211845350400000000)
+            for i in index.candidates(offset - 100, offset + 100):
                 timestamp = self.parser.read_qword(i)
                 
                 # Valid FILETIME range (1601-01-01 ~ 2100-12-31)
@@ -915,54 +1024,15 @@ class ForensicsAnalyzer:
             return False
         return any(ext in path.lower() for ext in ['.exe', '.dll', '.bat', '.cmd', '.com'])
     
-    # Deduplication methods
-    def _deduplicate_by_path(self, items: List[Dict]) -> List[Dict]:
-        seen = set()
-        result = []
-        for item in items:
-            key = item.get('path', '').lower()
-            if key and key not in seen:
-                seen.add(key)
-                result.append(item)
-        return result
-    
-    def _deduplicate_by_program(self, items: List[Dict]) -> List[Dict]:
-        seen = set()
-        result = []
-        for item in items:
-            key = item.get('program', '').lower()
-            if key and key not in seen:
-                seen.add(key)
-                result.append(item)
-        return result
-    
-    def _deduplicate_by_command(self, items: List[Dict]) -> List[Dict]:
-        seen = set()
-        result = []
-        for item in items:
-            key = item.get('command', '').lower()
-            if key and key not in seen:
-                seen.add(key)
-                result.append(item)
-        return result
-    
-    def _deduplicate_by_username(self, items: List[Dict]) -> List[Dict]:
-        seen = set()
-        result = []
-        for item in items:
-            key = item.get('username', '').lower()
-            if key and key not in seen:
-                seen.add(key)
-                result.append(item)
-        return result
-    
     def analyze_shellbags(self) -> List[Dict]:
         """ShellBags 분석 (탐색기 폴더 접근 이력)"""
-        results = []
-        
+        return list(self._iter_records('shellbags'))
+    
+    def _iter_shellbags(self) -> Iterator[Dict]:
+        """ShellBags 후보 레코드 (중복 제거 전)"""
         # NTUSER.DAT 또는 UsrClass.dat에만 적용
         if 'NTUSER' not in self.hive_type.upper() and 'USRCLASS' not in self.hive_type.upper():
-            return []
+            return
         
         # BagMRU 패턴 검색
         bagmru_offsets = self.parser.search_pattern('BagMRU')
@@ -976,13 +1046,13 @@ class ForensicsAnalyzer:
                     if not any(ext in ctx.lower() for ext in ['.exe', '.dll', '.txt', '.doc', '.pdf']):
                         timestamp = self._extract_filetime_near_offset(offset)
                         
-                        results.append({
+                        yield {
                             'path': ctx,
                             'type': 'folder',
                             'timestamp': timestamp,
                             'source': 'BagMRU',
                             'offset': offset
-                        })
+                        }
         
         # 일반 폴더 경로 패턴
         folder_patterns = ['\\Desktop', '\\Documents', '\\Downloads', '\\Pictures', '\\Videos']
@@ -995,22 +1065,22 @@ class ForensicsAnalyzer:
                 if path and len(path) > 10:
                     timestamp = self._extract_filetime_near_offset(offset)
                     
-                    results.append({
+                    yield {
                         'path': path,
                         'type': pattern.replace('\\', ''),
                         'timestamp': timestamp,
                         'source': 'Pattern'
-                    })
-        
-        return self._deduplicate_by_path(results)[:100]
+                    }
     
     def analyze_prefetch(self) -> List[Dict]:
         """Prefetch 분석 (프로그램 실행 최적화 정보)"""
-        results = []
-        
+        return list(self._iter_records('prefetch'))
+    
+    def _iter_prefetch(self) -> Iterator[Dict]:
+        """Prefetch 후보 레코드 (중복 제거 전)"""
         # SYSTEM 하이브에 Prefetch 정보 저장
         if 'SYSTEM' not in self.hive_type.upper():
-            return []
+            return
         
         # Prefetch 패턴 검색
         prefetch_patterns = ['.pf', 'Prefetch', 'SCCA']
@@ -1037,23 +1107,23 @@ class ForensicsAnalyzer:
                         # 마지막 실행 시간
                         timestamp = self._extract_filetime_near_offset(offset)
                         
-                        results.append({
+                        yield {
                             'program': ctx,
                             'runCount': run_count,
                             'timestamp': timestamp,
                             'type': 'Prefetch',
                             'offset': offset
-                        })
-        
-        return self._deduplicate_by_program(results)[:100]
+                        }
     
     def analyze_lnk_files(self) -> List[Dict]:
         """LNK 파일 분석 (바로가기 파일 이력)"""
-        results = []
-        
+        return list(self._iter_records('lnk_files'))
+    
+    def _iter_lnk_files(self) -> Iterator[Dict]:
+        """LNK 파일 후보 레코드 (중복 제거 전)"""
         # NTUSER.DAT에서 최근 사용한 LNK 파일 검색
         if 'NTUSER' not in self.hive_type.upper():
-            return []
+            return
         
         # .lnk 패턴 검색
         lnk_offsets = self.parser.search_pattern('.lnk')
@@ -1074,23 +1144,23 @@ class ForensicsAnalyzer:
                 # 타임스탬프 추출
                 timestamp = self._extract_filetime_near_offset(offset)
                 
-                results.append({
+                yield {
                     'lnkPath': lnk_path,
                     'targetPath': target_path,
                     'timestamp': timestamp,
                     'type': 'LNK',
                     'offset': offset
-                })
-        
-        return self._deduplicate_by_path(results)[:100]
+                }
     
     def analyze_security_detailed(self) -> List[Dict]:
         """SECURITY 하이브 상세 분석 (보안 정책, 권한, 감사)"""
-        results = []
-        
+        return list(self._iter_records('security_detailed'))
+    
+    def _iter_security_detailed(self) -> Iterator[Dict]:
+        """SECURITY 하이브 상세 후보 레코드 (중복 제거 전)"""
         # SECURITY 하이브에만 적용
         if 'SECURITY' not in self.hive_type.upper():
-            return []
+            return
         
         # 보안 정책 키 검색
         security_keys = [
@@ -1120,13 +1190,13 @@ class ForensicsAnalyzer:
                                 policy_value = val
                                 break
                         
-                        results.append({
+                        yield {
                             'policyKey': key,
                             'policyName': ctx,
                             'value': policy_value,
                             'type': 'SecurityPolicy',
                             'offset': offset
-                        })
+                        }
         
         # SID (보안 식별자) 패턴 검색
         sid_offsets = self.parser.search_pattern('S-1-5-')
@@ -1137,14 +1207,12 @@ class ForensicsAnalyzer:
                 # SID 타입 확인
                 sid_type = self._determine_sid_type(sid)
                 
-                results.append({
+                yield {
                     'sid': sid,
                     'sidType': sid_type,
                     'type': 'SID',
                     'offset': offset
-                })
-        
-        return results[:100]
+                }
     
     def _determine_sid_type(self, sid: str) -> str:
         """SID 타입 결정"""
@@ -1163,11 +1231,13 @@ class ForensicsAnalyzer:
     
     def analyze_muicache(self) -> List[Dict]:
         """MuiCache 분석 (응용 프로그램 UI 캐시) - v3.0"""
-        results = []
-        
+        return list(self._iter_records('muicache'))
+    
+    def _iter_muicache(self) -> Iterator[Dict]:
+        """MuiCache 후보 레코드 (중복 제거 전)"""
         # MuiCache는 NTUSER.DAT 또는 UsrClass.dat에 존재
         if 'NTUSER' not in self.hive_type.upper() and 'USRCLASS' not in self.hive_type.upper():
-            return []
+            return
         
         # MuiCache 키 패턴 검색
         muicache_patterns = ['MuiCache', 'ApplicationCompany', 'FriendlyAppName']
@@ -1192,24 +1262,24 @@ class ForensicsAnalyzer:
                         # 타임스탬프 추출
                         timestamp = self._extract_filetime_near_offset(offset)
                         
-                        results.append({
+                        yield {
                             'path': ctx,
                             'appName': app_name,
                             'timestamp': timestamp,
                             'source': 'MuiCache',
                             'type': 'MuiCache',
                             'offset': offset
-                        })
-        
-        return self._deduplicate_by_path(results)[:100]
+                        }
     
     def analyze_installed_software_detailed(self) -> List[Dict]:
         """설치된 소프트웨어 상세 분석 - v3.0"""
-        results = []
-        
+        return list(self._iter_records('installed_software'))
+    
+    def _iter_installed_software(self) -> Iterator[Dict]:
+        """설치된 소프트웨어 상세 후보 레코드 (중복 제거 전)"""
         # SOFTWARE 하이브에서만 작동
         if 'SOFTWARE' not in self.hive_type.upper():
-            return []
+            return
         
         # Uninstall 키 패턴 검색
         uninstall_patterns = [
@@ -1258,7 +1328,7 @@ class ForensicsAnalyzer:
                             install_size = size
                             break
                     
-                    results.append({
+                    yield {
                         'displayName': display_name,
                         'publisher': publisher,
                         'version': version,
@@ -1268,26 +1338,17 @@ class ForensicsAnalyzer:
                         'estimatedSize': install_size,
                         'type': 'InstalledSoftware',
                         'offset': offset
-                    })
-        
-        # 중복 제거 (DisplayName 기준)
-        seen = set()
-        unique_results = []
-        for item in results:
-            name = item.get('displayName', '')
-            if name and name not in seen:
-                seen.add(name)
-                unique_results.append(item)
-        
-        return unique_results[:150]
+                    }
     
     def analyze_typed_paths(self) -> List[Dict]:
         """TypedPaths 분석 (탐색기 주소창 입력 이력) - v3.1"""
-        results = []
-        
+        return list(self._iter_records('typed_paths'))
+    
+    def _iter_typed_paths(self) -> Iterator[Dict]:
+        """TypedPaths 후보 레코드 (중복 제거 전)"""
         # NTUSER.DAT에만 적용
         if 'NTUSER' not in self.hive_type.upper():
-            return []
+            return
         
         # TypedPaths 패턴 검색
         typed_patterns = ['TypedPaths', 'url']
@@ -1311,22 +1372,22 @@ class ForensicsAnalyzer:
                                 mru_order = order
                                 break
                         
-                        results.append({
+                        yield {
                             'path': ctx,
                             'mruOrder': mru_order,
                             'type': 'TypedPath',
                             'offset': offset
-                        })
-        
-        return self._deduplicate_by_path(results)[:50]
+                        }
     
     def analyze_recent_apps(self) -> List[Dict]:
         """RecentApps 분석 (Windows 10+ 최근 앱) - v3.1"""
-        results = []
-        
+        return list(self._iter_records('recent_apps'))
+    
+    def _iter_recent_apps(self) -> Iterator[Dict]:
+        """RecentApps 후보 레코드 (중복 제거 전)"""
         # NTUSER.DAT에만 적용
         if 'NTUSER' not in self.hive_type.upper():
-            return []
+            return
         
         # RecentApps 패턴 검색
         recentapps_patterns = ['RecentApps', 'AppId', 'AppPath']
@@ -1352,23 +1413,24 @@ class ForensicsAnalyzer:
                         # 마지막 실행 시간
                         last_access = self._extract_filetime_near_offset(offset)
                         
-                        results.append({
+                        yield {
+                            'appName': ctx.rsplit('\\', 1)[-1],
                             'appPath': ctx,
                             'launchCount': launch_count,
                             'lastAccess': last_access,
                             'type': 'RecentApp',
                             'offset': offset
-                        })
-        
-        return self._deduplicate_by_path(results)[:100]
+                        }
     
     def analyze_services_detailed(self) -> List[Dict]:
         """Services 상세 분석 (시스템 서비스) - v3.1"""
-        results = []
-        
+        return list(self._iter_records('services_detailed'))
+    
+    def _iter_services_detailed(self) -> Iterator[Dict]:
+        """Services 상세 후보 레코드 (중복 제거 전)"""
         # SYSTEM 하이브에만 적용
         if 'SYSTEM' not in self.hive_type.upper():
-            return []
+            return
         
         # Services 패턴 검색
         service_patterns = ['Services\\', 'ImagePath', 'DisplayName']
@@ -1403,41 +1465,30 @@ class ForensicsAnalyzer:
                         break
                 
                 if image_path or display_name:
-                    results.append({
+                    yield {
                         'serviceName': service_name,
                         'displayName': display_name,
                         'imagePath': image_path,
                         'startType': start_type,
                         'type': 'Service',
                         'offset': offset
-                    })
-        
-        # 중복 제거
-        seen = set()
-        unique_results = []
-        for item in results:
-            key = (item.get('imagePath'), item.get('displayName'))
-            if key not in seen and any(key):
-                seen.add(key)
-                unique_results.append(item)
-        
-        return unique_results[:100]
+                    }
     
     def analyze_wlan_profiles(self) -> List[Dict]:
         """WLAN Profiles 분석 (Wi-Fi 프로필) - v3.1"""
-        results = []
-        
+        return list(self._iter_records('wlan_profiles'))
+    
+    def _iter_wlan_profiles(self) -> Iterator[Dict]:
+        """WLAN Profiles 후보 레코드 (중복 제거 전)"""
         # SOFTWARE 하이브에만 적용
         if 'SOFTWARE' not in self.hive_type.upper():
-            return []
+            return
         
         # WLAN 패턴 검색
         wlan_patterns = ['ProfileName', 'Profiles\\', 'SSID']
         
         for pattern in wlan_patterns:
-            offsets = self.parser.search_pattern(pattern)
-            
-            for offset in offsets[:100]:
+            for offset, _ in self._encoded_anchors(pattern, 100):
                 context = self._get_context_strings(offset, 200)
                 
                 for ctx in context:
@@ -1456,32 +1507,23 @@ class ForensicsAnalyzer:
                         # 마지막 연결 시간
                         last_connected = self._extract_filetime_near_offset(offset)
                         
-                        results.append({
+                        yield {
                             'profileName': ctx,
                             'connectionType': conn_type,
                             'lastConnected': last_connected,
                             'type': 'WLAN',
                             'offset': offset
-                        })
-        
-        # 중복 제거
-        seen = set()
-        unique_results = []
-        for item in results:
-            name = item.get('profileName', '')
-            if name and name not in seen:
-                seen.add(name)
-                unique_results.append(item)
-        
-        return unique_results[:50]
+                        }
     
     def analyze_timezone(self) -> List[Dict]:
         """Time Zone 분석 (시간대 정보) - v3.1"""
-        results = []
-        
+        return list(self._iter_records('timezone'))
+    
+    def _iter_timezone(self) -> Iterator[Dict]:
+        """Time Zone 후보 레코드 (중복 제거 전)"""
         # SYSTEM 하이브에만 적용
         if 'SYSTEM' not in self.hive_type.upper():
-            return []
+            return
         
         # TimeZone 패턴 검색
         tz_patterns = ['TimeZoneInformation', 'StandardName', 'DaylightName']
@@ -1512,15 +1554,13 @@ class ForensicsAnalyzer:
                         break
                 
                 if standard_name or daylight_name:
-                    results.append({
+                    yield {
                         'standardName': standard_name,
                         'daylightName': daylight_name,
                         'bias': bias,
                         'type': 'TimeZone',
                         'offset': offset
-                    })
-        
-        return results[:10]
+                    }
     
     def _extract_filetime_near_offset(self, offset: int, search_range: int = 100) -> str:
         """오프셋 근처에서 FILETIME 추출"""
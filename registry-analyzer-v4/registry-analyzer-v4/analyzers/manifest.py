@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Analyzer Manifest - 분석 모듈별 적용 하이브 / 검색 패턴 / 비용 등급
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+COST_LOW = 'low'        # 패턴 몇 개, 히트마다 가벼운 문자열 읽기
+COST_MEDIUM = 'medium'  # 히트마다 주변 문자열 / 타임스탬프 탐색
+COST_HIGH = 'high'      # 히트가 많고 경로 / 해시 후보를 여러 번 검증
+
+UNICODE_SEARCH = ('ascii', 'utf-16-le')  # 키 / 값 이름이 UTF-16 LE로도 저장되는 앵커
+
+# 결과 키 -> 분석 모듈 정보
+#   method:     ForensicsAnalyzer 메서드 이름
+#   hive_types: 적용 하이브 (대문자 하이브 타입에 포함되면 적용, 예: 'NTUSER' -> 'NTUSER.DAT')
+#   patterns:   search_pattern으로 찾는 패턴 (파서에 미리 등록해 한 번의 순회로 스캔)
+#   encodings:  (선택) search_pattern_encoded로 찾는 모듈의 패턴 인코딩 (인코딩마다 등록)
+#   cost:       비용 등급 (스케줄링 참고용)
+#   version:    결과 형식 / 추출 로직 버전 (바꾸면 결과 캐시의 이전 항목을 쓰지 않음)
+ANALYZER_MANIFEST: Dict[str, Dict] = {
+    'shimcache': {
+        'method': 'analyze_shimcache',
+        'hive_types': ['SYSTEM'],
+        'patterns': ['.exe', '.dll', '.sys', '.scr'],
+        'cost': COST_HIGH,
+        'version': 2,
+    },
+    'amcache': {
+        'method': 'analyze_amcache',
+        'hive_types': ['AMCACHE', '.HVE'],
+        'patterns': ['.exe', '.dll', '.sys', '.msi', 'ProgramName', 'Publisher', 'InstallDate'],
+        'cost': COST_HIGH,
+        'version': 2,
+    },
+    'userassist': {
+        'method': 'analyze_userassist',
+        'hive_types': ['NTUSER'],
+        'patterns': ['HRZR_PGYFRFFVBA', 'HRZR_EHAPZH'],
+        'encodings': UNICODE_SEARCH,
+        'cost': COST_LOW,
+        'version': 2,
+    },
+    'bam_dam': {
+        'method': 'analyze_bam_dam',
+        'hive_types': ['SYSTEM'],
+        'patterns': ['\\Device\\HarddiskVolume', 'SystemRoot'],
+        'cost': COST_MEDIUM,
+        'version': 2,
+    },
+    'usb_devices': {
+        'method': 'analyze_usb_devices',
+        'hive_types': ['SYSTEM', 'SOFTWARE'],
+        'patterns': ['VID_', 'PID_', 'USBSTOR', '\\??\\USB#'],
+        'cost': COST_MEDIUM,
+        'version': 1,
+    },
+    'recent_docs': {
+        'method': 'analyze_recent_docs',
+        'hive_types': ['NTUSER', 'USRCLASS'],
+        'patterns': ['RecentDocs', '\\Explorer\\RecentDocs', 'OpenSavePidlMRU',
+                     '.doc', '.pdf', '.xls', '.txt', '.jpg', '.png', '.ppt', '.zip'],
+        'cost': COST_HIGH,
+        'version': 3,
+    },
+    'run_keys': {
+        'method': 'analyze_run_keys',
+        'hive_types': ['SOFTWARE', 'NTUSER'],
+        'patterns': ['Run', 'RunOnce', 'RunServices'],
+        'encodings': UNICODE_SEARCH,
+        'cost': COST_MEDIUM,
+        'version': 2,
+    },
+    'sam_users': {
+        'method': 'analyze_sam_users',
+        'hive_types': ['SAM'],
+        'patterns': ['S-1-5-21', 'Administrator', 'Guest', 'DefaultAccount'],
+        'cost': COST_LOW,
+        'version': 1,
+    },
+    'network_profiles': {
+        'method': 'analyze_network_profiles',
+        'hive_types': ['SOFTWARE'],
+        'patterns': ['ProfileName', 'Description', 'SSID'],
+        'encodings': UNICODE_SEARCH,
+        'cost': COST_LOW,
+        'version': 2,
+    },
+    'shellbags': {
+        'method': 'analyze_shellbags',
+        'hive_types': ['NTUSER', 'USRCLASS'],
+        'patterns': ['BagMRU', '\\Desktop', '\\Documents', '\\Downloads', '\\Pictures', '\\Videos'],
+        'cost': COST_MEDIUM,
+        'version': 2,
+    },
+    'muicache': {
+        'method': 'analyze_muicache',
+        'hive_types': ['NTUSER', 'USRCLASS'],
+        'patterns': ['MuiCache', 'ApplicationCompany', 'FriendlyAppName'],
+        'cost': COST_LOW,
+        'version': 1,
+    },
+    'prefetch': {
+        'method': 'analyze_prefetch',
+        'hive_types': ['SYSTEM'],
+        'patterns': ['.pf', 'Prefetch', 'SCCA'],
+        'cost': COST_LOW,
+        'version': 1,
+    },
+    'lnk_files': {
+        'method': 'analyze_lnk_files',
+        'hive_types': ['NTUSER'],
+        'patterns': ['.lnk'],
+        'cost': COST_LOW,
+        'version': 2,
+    },
+    'installed_software': {
+        'method': 'analyze_installed_software_detailed',
+        'hive_types': ['SOFTWARE'],
+        'patterns': ['Microsoft\\Windows\\CurrentVersion\\Uninstall',
+                     'Wow6432Node\\Microsoft\\Windows\\CurrentVersion\\Uninstall'],
+        'cost': COST_MEDIUM,
+        'version': 1,
+    },
+    'security_detailed': {
+        'method': 'analyze_security_detailed',
+        'hive_types': ['SECURITY'],
+        'patterns': ['Policy\\Accounts', 'Policy\\Audit', 'Policy\\PolAdtEv', 'Policy\\Secrets',
+                     'SAM\\Domains', 'S-1-5-'],
+        'cost': COST_LOW,
+        'version': 1,
+    },
+    # v3.1 추가
+    'typed_paths': {
+        'method': 'analyze_typed_paths',
+        'hive_types': ['NTUSER'],
+        'patterns': ['TypedPaths', 'url'],
+        'cost': COST_LOW,
+        'version': 1,
+    },
+    'recent_apps': {
+        'method': 'analyze_recent_apps',
+        'hive_types': ['NTUSER'],
+        'patterns': ['RecentApps', 'AppId', 'AppPath'],
+        'cost': COST_LOW,
+        'version': 2,
+    },
+    'services_detailed': {
+        'method': 'analyze_services_detailed',
+        'hive_types': ['SYSTEM'],
+        'patterns': ['Services\\', 'ImagePath', 'DisplayName'],
+        'cost': COST_MEDIUM,
+        'version': 1,
+    },
+    'wlan_profiles': {
+        'method': 'analyze_wlan_profiles',
+        'hive_types': ['SOFTWARE'],
+        'patterns': ['ProfileName', 'Profiles\\', 'SSID'],
+        'encodings': UNICODE_SEARCH,
+        'cost': COST_LOW,
+        'version': 2,
+    },
+    'timezone': {
+        'method': 'analyze_timezone',
+        'hive_types': ['SYSTEM'],
+        'patterns': ['TimeZoneInformation', 'StandardName', 'DaylightName'],
+        'cost': COST_LOW,
+        'version': 1,
+    },
+}
+
+
+def is_known_hive_type(hive_type: str) -> bool:
+    """매니페스트에 등장하는 하이브 타입인지 (UNKNOWN 등은 False)"""
+    hive_type = hive_type.upper()
+    return any(token in hive_type
+               for entry in ANALYZER_MANIFEST.values()
+               for token in entry['hive_types'])
+
+
+def is_applicable(name: str, hive_type: str) -> bool:
+    """분석 모듈이 해당 하이브 타입에 적용되는지 (알 수 없는 하이브 타입이면 모두 적용)"""
+    if not is_known_hive_type(hive_type):
+        return True
+    hive_type = hive_type.upper()
+    return any(token in hive_type for token in ANALYZER_MANIFEST[name]['hive_types'])
+
+
+def plan_analyzers(hive_type: str, only: Optional[Iterable[str]] = None) -> Tuple[List[str], List[str]]:
+    """(실행할 분석 모듈, 건너뛸 분석 모듈) - 매니페스트 순서 유지
+
+    only가 있으면 그 안의 모듈만 실행 대상 (나머지는 건너뜀)
+    """
+    only = set(only) if only is not None else None
+    scheduled = []
+    skipped = []
+    for name in ANALYZER_MANIFEST:
+        if is_applicable(name, hive_type) and (only is None or name in only):
+            scheduled.append(name)
+        else:
+            skipped.append(name)
+    return scheduled, skipped
+
+
+def search_needles(name: str) -> List[bytes]:
+    """파서에 등록할 분석 모듈 검색 패턴 (encodings가 있으면 인코딩마다)"""
+    entry = ANALYZER_MANIFEST[name]
+    encodings = entry.get('encodings', ('ascii',))
+    return [pattern.encode(encoding, errors='ignore') for pattern in entry['patterns'] for encoding in encodings]
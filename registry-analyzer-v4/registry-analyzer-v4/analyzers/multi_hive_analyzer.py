@@ -6,10 +6,27 @@ Author: Registry Forensic Analyzer Team
 Version: 4.0
 """
 
-from typing import Dict, List, Optional, Tuple
-from datetime import datetime
-from core.registry_parser import RegistryParser
-from analyzers.forensics_analyzer import ForensicsAnalyzer
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from core.process_pool import pool_context
+from core.registry_parser import RegistryParser, canonical_hive_type
+from analyzers.correlation_engine import CorrelationEngine
+from analyzers.correlations import CORRELATIONS, required_hives
+from analyzers.forensics_analyzer import AnalysisCancelled, ForensicsAnalyzer
+from analyzers.parallel import DEFAULT_WORKERS
+from utils.result_cache import ResultCache
+
+
+def _load_hive(file_path: str, hive_type: Optional[str], cache: Optional[ResultCache] = None,
+               only: Optional[List[str]] = None) -> Tuple[str, Dict[str, List[Dict]]]:
+    """하이브 하나 로드 / 타입 감지 / 전체 분석 (add_hives 워커)"""
+    with RegistryParser.open(file_path) as parser:
+        if not hive_type:
+            hive_type = parser.detect_hive_type()
+        findings = ForensicsAnalyzer(parser, hive_type, cache, only).run_analyzers()
+    return hive_type, findings
 
 
 class MultiHiveAnalyzer:
@@ -23,423 +40,202 @@ class MultiHiveAnalyzer:
     4. System-wide artifact correlation
     """
     
-    def __init__(self):
-        """초기화"""
+    def __init__(self, max_workers: int = 1, cache: Optional[ResultCache] = None,
+                 only: Optional[List[str]] = None, suffix_match: bool = False):
+        """초기화
+
+        Args:
+            max_workers: 하이브 하나의 분석 모듈을 나눠 실행할 프로세스 수 (1이면 순차 실행)
+            cache: 분석 결과 캐시 (같은 내용의 하이브는 다시 분석하지 않음)
+            only: 실행할 분석 모듈 결과 키 (None이면 적용되는 모듈 모두)
+            suffix_match: ShimCache-Amcache 파일명 일치가 없을 때 경로 끝부분 일치도 사용 (MEDIUM)
+        """
+        self.max_workers = max_workers
+        self.cache = cache
+        self.only = only
+        self.suffix_match = suffix_match
+        self._engine = CorrelationEngine(CORRELATIONS)  # 조인 키 색인을 상관관계끼리 공유
         self.hives: Dict[str, Dict] = {}  # hive_type -> {'parser': ..., 'analyzer': ..., 'findings': ...}
         self.correlations: List[Dict] = []
         self.timeline: List[Dict] = []
     
-    def add_hive(self, file_path: str, hive_type: str) -> bool:
+    def add_hive(self, file_path: str, hive_type: str, parser: Optional[RegistryParser] = None) -> bool:
         """
         하이브 파일 추가
         
         Args:
             file_path: 레지스트리 파일 경로
             hive_type: SYSTEM, SOFTWARE, SAM, SECURITY, NTUSER, USRCLASS, AMCACHE
+            parser: 이미 열린 파서 (타입 감지에 사용한 파서 재사용, 없으면 mmap으로 열기)
         
         Returns:
             성공 여부
         """
         try:
-            # 파일 읽기
-            with open(file_path, 'rb') as f:
-                data = f.read()
+            # 파일 열기 (mmap, 전체 읽기 없음)
+            if parser is None:
+                parser = RegistryParser.open(file_path)
             
-            parser = RegistryParser(data, file_path)
-            analyzer = ForensicsAnalyzer(parser, hive_type)
+            analyzer = ForensicsAnalyzer(parser, hive_type, self.cache, self.only)
             
-            # 모든 분석 실행
+            # 적용되는 분석 모듈만 실행
             findings = self._analyze_all(analyzer)
             
             self.hives[hive_type] = {
                 'file_path': file_path,
                 'parser': parser,
                 'analyzer': analyzer,
-                'findings': findings
+                'findings': findings,
+                'skipped': analyzer.skipped
             }
             
             return True
         except Exception as e:
             import traceback
-            print(f"Failed to add hive {hive_type}: {e}")
+            print(f"Failed to add hive {hive_type}: {e}", file=sys.stderr)
             traceback.print_exc()
             return False
     
-    def _analyze_all(self, analyzer: ForensicsAnalyzer) -> Dict:
-        """모든 분석 모듈 실행"""
-        return {
-            'shimcache': analyzer.analyze_shimcache(),
-            'amcache': analyzer.analyze_amcache(),
-            'userassist': analyzer.analyze_userassist(),
-            'bam_dam': analyzer.analyze_bam_dam(),
-            'usb_devices': analyzer.analyze_usb_devices(),
-            'recent_docs': analyzer.analyze_recent_docs(),
-            'run_keys': analyzer.analyze_run_keys(),
-            'sam_users': analyzer.analyze_sam_users(),
-            'network_profiles': analyzer.analyze_network_profiles(),
-            'shellbags': analyzer.analyze_shellbags(),
-            'muicache': analyzer.analyze_muicache(),
-            'prefetch': analyzer.analyze_prefetch(),
-            'lnk_files': analyzer.analyze_lnk_files(),
-            'installed_software': analyzer.analyze_installed_software_detailed(),
-            'security_detailed': analyzer.analyze_security_detailed(),
-            # v3.1 추가
-            'typed_paths': analyzer.analyze_typed_paths(),
-            'recent_apps': analyzer.analyze_recent_apps(),
-            'services_detailed': analyzer.analyze_services_detailed(),
-            'wlan_profiles': analyzer.analyze_wlan_profiles(),
-            'timezone': analyzer.analyze_timezone()
+    def add_loaded_hive(self, file_path: str, hive_type: str, findings: Dict[str, List[Dict]]):
+        """다른 프로세스에서 분석을 마친 하이브 등록 - 결과는 그대로 쓰고 mmap만 다시 연다"""
+        parser = RegistryParser.open(file_path)
+        analyzer = ForensicsAnalyzer(parser, hive_type, only=self.only)
+        self.hives[hive_type] = {
+            'file_path': file_path,
+            'parser': parser,
+            'analyzer': analyzer,
+            'findings': findings,
+            'skipped': analyzer.skipped
         }
     
-    def find_correlations(self) -> List[Dict]:
-        """
-        하이브 간 상관관계 발견
-        
-        Returns:
-            상관관계 목록
-        """
-        self.correlations = []
-        
-        # 1. ShimCache + Amcache 통합 (프로그램 실행 증거 강화)
-        self._correlate_shimcache_amcache()
-        
-        # 2. UserAssist + Prefetch + BAM/DAM (사용자 활동 패턴)
-        self._correlate_user_activity()
-        
-        # 3. USB Devices + User Files (외부 저장장치 사용 증거)
-        self._correlate_usb_usage()
-        
-        # 4. Network Profiles + WLAN + User Activity (네트워크 활동)
-        self._correlate_network_activity()
-        
-        # 5. Run Keys + Installed Software (자동 실행 프로그램)
-        self._correlate_autorun_software()
-        
-        # 6. Services + Installed Software (시스템 서비스 연관)
-        self._correlate_services_software()
-        
-        # 7. TimeZone + Timeline (시간대 보정)
-        self._correlate_timezone_timeline()
-        
-        return self.correlations
-    
-    def _correlate_shimcache_amcache(self):
-        """ShimCache와 Amcache를 교차 분석하여 프로그램 실행 증거 강화"""
-        system_findings = self.hives.get('SYSTEM', {}).get('findings', {})
-        software_findings = self.hives.get('SOFTWARE', {}).get('findings', {})
-        
-        shimcache = system_findings.get('shimcache', [])
-        amcache = software_findings.get('amcache', [])
-        
-        if not shimcache or not amcache:
-            return
-        
-        # ShimCache 경로를 키로 하는 맵 생성
-        shimcache_map = {item['path'].lower(): item for item in shimcache}
-        
-        # Amcache와 매칭
-        for am_item in amcache:
-            program_name = am_item.get('programName', '').lower()
-            
-            # ShimCache에서 일치하는 항목 찾기
-            for sc_path, sc_item in shimcache_map.items():
-                if program_name in sc_path or program_name.replace('.exe', '') in sc_path:
-                    correlation = {
-                        'type': 'ShimCache-Amcache Match',
-                        'confidence': 'HIGH',
-                        'program': am_item.get('programName'),
-                        'path': sc_item['path'],
-                        'shimcache_timestamp': sc_item.get('timestamp'),
-                        'amcache_timestamp': am_item.get('timestamp'),
-                        'sha1': am_item.get('sha1'),
-                        'publisher': am_item.get('publisher'),
-                        'version': am_item.get('version'),
-                        'significance': 'Program execution confirmed by multiple sources'
-                    }
-                    self.correlations.append(correlation)
+    def close(self):
+        """하이브 파서 (mmap) 해제"""
+        for hive in self.hives.values():
+            if hive.get('parser') is not None:
+                hive['parser'].close()
     
-    def _correlate_user_activity(self):
-        """UserAssist, Prefetch, BAM/DAM을 통합하여 사용자 활동 패턴 분석"""
-        ntuser_findings = self.hives.get('NTUSER', {}).get('findings', {})
-        system_findings = self.hives.get('SYSTEM', {}).get('findings', {})
-        software_findings = self.hives.get('SOFTWARE', {}).get('findings', {})
-        
-        userassist = ntuser_findings.get('userassist', [])
-        prefetch = software_findings.get('prefetch', [])
-        bam_dam = system_findings.get('bam_dam', [])
-        recent_apps = ntuser_findings.get('recent_apps', [])
-        
-        # 프로그램별로 그룹화
-        program_activity = {}
-        
-        # UserAssist 데이터 추가
-        for item in userassist:
-            program = item.get('program', '').lower()
-            if program not in program_activity:
-                program_activity[program] = {
-                    'program': item.get('program'),
-                    'sources': [],
-                    'timestamps': [],
-                    'run_count': 0
-                }
-            program_activity[program]['sources'].append('UserAssist')
-            if item.get('lastExecuted'):
-                program_activity[program]['timestamps'].append(item['lastExecuted'])
-            if item.get('runCount'):
-                program_activity[program]['run_count'] += item['runCount']
-        
-        # Prefetch 데이터 추가
-        for item in prefetch:
-            program = item.get('program', '').lower()
-            if program not in program_activity:
-                program_activity[program] = {
-                    'program': item.get('program'),
-                    'sources': [],
-                    'timestamps': [],
-                    'run_count': 0
-                }
-            program_activity[program]['sources'].append('Prefetch')
-            if item.get('timestamp'):
-                program_activity[program]['timestamps'].append(item['timestamp'])
-            if item.get('runCount'):
-                program_activity[program]['run_count'] += item['runCount']
-        
-        # BAM/DAM 데이터 추가
-        for item in bam_dam:
-            path = item.get('path', '').lower()
-            program = path.split('\\')[-1] if '\\' in path else path
-            if program not in program_activity:
-                program_activity[program] = {
-                    'program': program,
-                    'sources': [],
-                    'timestamps': [],
-                    'run_count': 0
-                }
-            program_activity[program]['sources'].append('BAM/DAM')
-            if item.get('timestamp'):
-                program_activity[program]['timestamps'].append(item['timestamp'])
-        
-        # RecentApps 데이터 추가
-        for item in recent_apps:
-            app_name = item.get('appName', '').lower()
-            if app_name not in program_activity:
-                program_activity[app_name] = {
-                    'program': item.get('appName'),
-                    'sources': [],
-                    'timestamps': [],
-                    'run_count': 0
-                }
-            program_activity[app_name]['sources'].append('RecentApps')
-            if item.get('lastAccessTime'):
-                program_activity[app_name]['timestamps'].append(item['lastAccessTime'])
-            if item.get('launchCount'):
-                program_activity[app_name]['run_count'] += item['launchCount']
-        
-        # 2개 이상 소스에서 발견된 프로그램을 상관관계로 추가
-        for program, data in program_activity.items():
-            if len(data['sources']) >= 2:
-                correlation = {
-                    'type': 'User Activity Pattern',
-                    'confidence': 'HIGH' if len(data['sources']) >= 3 else 'MEDIUM',
-                    'program': data['program'],
-                    'sources': list(set(data['sources'])),
-                    'source_count': len(set(data['sources'])),
-                    'timestamps': sorted(data['timestamps'])[:5],  # 최근 5개
-                    'total_run_count': data['run_count'],
-                    'significance': f'Program activity confirmed by {len(set(data["sources"]))} different sources'
-                }
-                self.correlations.append(correlation)
+    def _analyze_all(self, analyzer: ForensicsAnalyzer) -> Dict:
+        """하이브에 적용되는 분석 모듈 실행 (건너뛴 모듈은 빈 결과)"""
+        return analyzer.run_analyzers(self.max_workers)
     
-    def _correlate_usb_usage(self):
-        """USB 장치 연결과 사용자 파일 접근 상관관계"""
-        system_findings = self.hives.get('SYSTEM', {}).get('findings', {})
-        ntuser_findings = self.hives.get('NTUSER', {}).get('findings', {})
-        
-        usb_devices = system_findings.get('usb_devices', [])
-        recent_docs = ntuser_findings.get('recent_docs', [])
-        shellbags = ntuser_findings.get('shellbags', [])
-        
-        if not usb_devices:
-            return
-        
-        # USB 드라이브 레터 추출
-        usb_drives = []
-        for usb in usb_devices:
-            if usb.get('driveLetter'):
-                usb_drives.append(usb['driveLetter'].upper())
-        
-        if not usb_drives:
-            return
+    def add_hives(self, hives: List[Union[str, Tuple[str, Optional[str]]]],
+                  max_workers: int = DEFAULT_WORKERS,
+                  on_hive_done: Optional[Callable[[Dict], None]] = None,
+                  should_stop: Optional[Callable[[], bool]] = None) -> List[Dict]:
+        """
+        여러 하이브를 프로세스 풀에서 동시에 로드 / 감지 / 분석
         
-        # Recent Docs에서 USB 경로 찾기
-        usb_files = []
-        for doc in recent_docs:
-            path = doc.get('path', '')
-            for drive in usb_drives:
-                if path.upper().startswith(drive + ':\\'):
-                    usb_files.append({
-                        'path': path,
-                        'timestamp': doc.get('timestamp'),
-                        'drive': drive
-                    })
+        한 하이브가 실패해도 나머지는 계속 분석한다. 필요한 하이브가 모두 준비된
+        상관관계 분석은 남은 하이브 분석과 겹쳐 바로 실행하며, 결과는
+        find_correlations와 같은 순서로 self.correlations에 저장된다.
         
-        # ShellBags에서 USB 경로 찾기
-        for bag in shellbags:
-            path = bag.get('path', '')
-            for drive in usb_drives:
-                if path.upper().startswith(drive + ':\\'):
-                    usb_files.append({
-                        'path': path,
-                        'timestamp': bag.get('timestamp'),
-                        'drive': drive
-                    })
+        Args:
+            hives: 파일 경로 또는 (파일 경로, 하이브 타입) 목록 (타입이 없으면 자동 감지)
+            max_workers: 동시에 분석할 하이브 수 (1이면 순차 실행)
+            on_hive_done: 하이브 하나가 끝날 때마다 상태 dict로 호출 (진행 표시용)
+            should_stop: True를 돌려주면 남은 하이브를 버리고 AnalysisCancelled 발생
         
-        # 상관관계 추가
-        if usb_files:
-            correlation = {
-                'type': 'USB Device Usage',
-                'confidence': 'HIGH',
-                'usb_devices': [{'serial': usb.get('serialNumber'), 'drive': usb.get('driveLetter')} 
-                               for usb in usb_devices],
-                'accessed_files': usb_files[:20],  # 최대 20개
-                'total_file_count': len(usb_files),
-                'significance': f'Found {len(usb_files)} files accessed from USB devices'
+        Returns:
+            입력 순서의 하이브별 상태 [{'file_path', 'hive_type', 'success', 'error'}]
+        """
+        jobs = [(entry, None) if isinstance(entry, str) else tuple(entry) for entry in hives]
+        statuses: List[Optional[Dict]] = [None] * len(jobs)
+        pending = dict(enumerate(jobs))
+        correlations: Dict[str, List[Dict]] = {}
+        
+        def finish(index: int, hive_type: Optional[str], findings: Optional[Dict], error: Optional[str]):
+            file_path = jobs[index][0]
+            if pending.pop(index, None) is None:
+                return  # 이미 끝난 하이브 (완료 후 콜백 등에서 난 예외로 다시 호출됨)
+            if error is None:
+                try:
+                    self.add_loaded_hive(file_path, hive_type, findings)
+                except Exception as e:
+                    error = str(e)
+            statuses[index] = {
+                'file_path': file_path,
+                'hive_type': hive_type or jobs[index][1],
+                'success': error is None,
+                'error': error
             }
-            self.correlations.append(correlation)
+            if on_hive_done:
+                on_hive_done(statuses[index])
+            self._run_ready_correlators(correlations, [job[1] for job in pending.values()])
+        
+        workers = min(max_workers, len(jobs))
+        if workers > 1:
+            executor = None
+            try:
+                executor = ProcessPoolExecutor(max_workers=workers, mp_context=pool_context())
+                futures = {executor.submit(_load_hive, *job, self.cache, self.only): index for index, job in enumerate(jobs)}
+                for future in as_completed(futures):
+                    try:
+                        hive_type, findings = future.result()
+                        finish(futures[future], hive_type, findings, None)
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        print(f"Failed to add hive {jobs[futures[future]][0]}: {e}", file=sys.stderr)
+                        finish(futures[future], None, None, str(e))
+                    if should_stop and should_stop() and pending:
+                        raise AnalysisCancelled()
+            except (OSError, BrokenProcessPool) as e:
+                print(f"Parallel hive loading unavailable, loading serially: {e}", file=sys.stderr)
+            finally:
+                if executor is not None:
+                    # 취소 / 오류 시 대기 중인 하이브는 버리고 실행 중인 워커를 기다리지 않음
+                    executor.shutdown(wait=not pending, cancel_futures=bool(pending))
+        
+        # 순차 실행 (워커 1개 또는 프로세스 풀 사용 불가 시 남은 하이브)
+        for index in sorted(pending):
+            if should_stop and should_stop():
+                raise AnalysisCancelled()
+            try:
+                hive_type, findings = _load_hive(*jobs[index], self.cache, self.only)
+                finish(index, hive_type, findings, None)
+            except Exception as e:
+                print(f"Failed to add hive {jobs[index][0]}: {e}", file=sys.stderr)
+                finish(index, None, None, str(e))
+        
+        self.correlations = [correlation for name, _ in self.CORRELATORS
+                             for correlation in correlations.get(name, [])]
+        return statuses
     
-    def _correlate_network_activity(self):
-        """네트워크 프로필과 WLAN, 사용자 활동 연관"""
-        software_findings = self.hives.get('SOFTWARE', {}).get('findings', {})
-        
-        network_profiles = software_findings.get('network_profiles', [])
-        wlan_profiles = software_findings.get('wlan_profiles', [])
-        
-        if network_profiles or wlan_profiles:
-            correlation = {
-                'type': 'Network Activity',
-                'confidence': 'MEDIUM',
-                'network_profiles': len(network_profiles),
-                'wlan_profiles': len(wlan_profiles),
-                'networks': [{'name': p.get('profileName'), 'type': 'Wired'} 
-                            for p in network_profiles[:5]],
-                'wifi_networks': [{'ssid': w.get('profileName'), 'type': w.get('connectionType')} 
-                                 for w in wlan_profiles[:5]],
-                'significance': f'User connected to {len(network_profiles) + len(wlan_profiles)} networks'
-            }
-            self.correlations.append(correlation)
+    # 상관관계 이름과 읽는 하이브 (find_correlations 실행 순서, analyzers/correlations.py 선언)
+    CORRELATORS = tuple((spec['name'], tuple(required_hives(spec))) for spec in CORRELATIONS)
     
-    def _correlate_autorun_software(self):
-        """자동 실행 프로그램과 설치된 소프트웨어 연관"""
-        software_findings = self.hives.get('SOFTWARE', {}).get('findings', {})
-        ntuser_findings = self.hives.get('NTUSER', {}).get('findings', {})
-        
-        run_keys_sw = software_findings.get('run_keys', [])
-        run_keys_nu = ntuser_findings.get('run_keys', [])
-        installed_software = software_findings.get('installed_software', [])
-        
-        all_run_keys = run_keys_sw + run_keys_nu
-        
-        if not all_run_keys or not installed_software:
-            return
-        
-        # 설치된 소프트웨어 맵 생성
-        software_map = {sw.get('displayName', '').lower(): sw 
-                       for sw in installed_software}
-        
-        # Run Key와 매칭
-        autorun_matched = []
-        for run_key in all_run_keys:
-            program = run_key.get('program', '').lower()
-            path = run_key.get('path', '').lower()
-            
-            for sw_name, sw_data in software_map.items():
-                if sw_name in program or sw_name in path:
-                    autorun_matched.append({
-                        'autorun_program': run_key.get('program'),
-                        'autorun_path': run_key.get('path'),
-                        'installed_software': sw_data.get('displayName'),
-                        'publisher': sw_data.get('publisher'),
-                        'install_date': sw_data.get('installDate')
-                    })
+    def find_correlations(self) -> List[Dict]:
+        """
+        하이브 간 상관관계 발견
         
-        if autorun_matched:
-            correlation = {
-                'type': 'Autorun Software Correlation',
-                'confidence': 'HIGH',
-                'matched_count': len(autorun_matched),
-                'matches': autorun_matched[:10],  # 최대 10개
-                'significance': f'Found {len(autorun_matched)} autorun programs with matching installed software'
-            }
-            self.correlations.append(correlation)
+        Returns:
+            상관관계 목록
+        """
+        self.correlations = []
+        for name, _ in self.CORRELATORS:
+            self.correlations.extend(self._run_correlator(name))
+        return self.correlations
     
-    def _correlate_services_software(self):
-        """시스템 서비스와 설치된 소프트웨어 연관"""
-        system_findings = self.hives.get('SYSTEM', {}).get('findings', {})
-        software_findings = self.hives.get('SOFTWARE', {}).get('findings', {})
-        
-        services = system_findings.get('services_detailed', [])
-        installed_software = software_findings.get('installed_software', [])
-        
-        if not services or not installed_software:
-            return
-        
-        # 소프트웨어별 서비스 매칭
-        software_services = []
-        
-        for service in services:
-            image_path = service.get('imagePath', '').lower()
-            
-            for software in installed_software:
-                sw_name = software.get('displayName', '').lower()
-                install_loc = software.get('installLocation', '').lower()
-                
-                if sw_name and sw_name in image_path:
-                    software_services.append({
-                        'service_name': service.get('serviceName'),
-                        'service_type': service.get('startType'),
-                        'image_path': service.get('imagePath'),
-                        'software': software.get('displayName'),
-                        'publisher': software.get('publisher')
-                    })
-                elif install_loc and install_loc in image_path:
-                    software_services.append({
-                        'service_name': service.get('serviceName'),
-                        'service_type': service.get('startType'),
-                        'image_path': service.get('imagePath'),
-                        'software': software.get('displayName'),
-                        'publisher': software.get('publisher')
-                    })
-        
-        if software_services:
-            correlation = {
-                'type': 'Services-Software Correlation',
-                'confidence': 'MEDIUM',
-                'matched_count': len(software_services),
-                'matches': software_services[:10],
-                'significance': f'Found {len(software_services)} services associated with installed software'
-            }
-            self.correlations.append(correlation)
+    def _run_correlator(self, name: str) -> List[Dict]:
+        """상관관계 하나 실행 - self.correlations는 그대로 두고 결과만 반환"""
+        return self._engine.run(name, self.hives, {'suffix_match': self.suffix_match})
     
-    def _correlate_timezone_timeline(self):
-        """시간대 정보를 타임라인에 적용"""
-        system_findings = self.hives.get('SYSTEM', {}).get('findings', {})
-        timezone_info = system_findings.get('timezone', [])
-        
-        if timezone_info and len(timezone_info) > 0:
-            tz = timezone_info[0]
-            bias = tz.get('bias')
-            
-            if bias is not None:
-                hours_offset = -(bias // 60)
-                correlation = {
-                    'type': 'Timezone Information',
-                    'confidence': 'HIGH',
-                    'timezone': tz.get('standardName'),
-                    'utc_offset': f'UTC{hours_offset:+d}:00',
-                    'bias_minutes': bias,
-                    'significance': f'All timestamps should be interpreted in {tz.get("standardName")} timezone'
-                }
-                self.correlations.append(correlation)
+    def _run_ready_correlators(self, done: Dict[str, List[Dict]], pending_types: List[Optional[str]]):
+        """아직 실행하지 않은 상관관계 분석 중 필요한 하이브가 더 바뀌지 않을 것만 실행
+
+        분석 중인 하이브 타입이 필요하거나, 타입을 모르는 하이브가 남아 있으면 기다린다.
+        실패한 상관관계 분석은 결과 없이 끝난 것으로 처리한다 (남은 하이브 분석은 계속).
+        """
+        for name, required in self.CORRELATORS:
+            if name in done:
+                continue
+            if any(hive_type is None or canonical_hive_type(hive_type) in required for hive_type in pending_types):
+                continue
+            try:
+                done[name] = self._run_correlator(name)
+            except Exception as e:
+                print(f"Correlation {name} failed: {e}", file=sys.stderr)
+                done[name] = []
     
     def build_timeline(self) -> List[Dict]:
         """
@@ -505,7 +301,7 @@ class MultiHiveAnalyzer:
         elif artifact_type == 'usb_devices':
             return f"USB device connected: {artifact.get('serialNumber')}"
         elif artifact_type == 'recent_docs':
-            return f"Document accessed: {artifact.get('path')}"
+            return f"Document accessed: {artifact.get('document')}"
         elif artifact_type == 'run_keys':
             return f"Autorun configured: {artifact.get('program')}"
         elif artifact_type == 'network_profiles':
@@ -540,6 +336,8 @@ class MultiHiveAnalyzer:
             ),
             'correlation_count': len(self.correlations),
             'timeline_events': len(self.timeline),
+            'skipped_analyzers': {hive_type: hive.get('skipped', [])
+                                  for hive_type, hive in self.hives.items()},
             'high_confidence_correlations': len([c for c in self.correlations 
                                                  if c.get('confidence') == 'HIGH'])
         }
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Parallel Runner - 분석 모듈 프로세스 병렬 실행
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.process_pool import pool_context
+from core.registry_parser import RegistryParser
+from analyzers.forensics_analyzer import AnalysisCancelled, ForensicsAnalyzer
+from analyzers.manifest import ANALYZER_MANIFEST, COST_HIGH, COST_MEDIUM, COST_LOW
+
+
+DEFAULT_WORKERS = os.cpu_count() or 1
+PARALLEL_MIN_HIVE_SIZE = 4 * 1024 * 1024  # 이보다 작은 하이브는 프로세스 시작 비용이 더 커서 순차 실행
+
+# 비싼 모듈부터 제출해 가장 느린 모듈이 늦게 시작하지 않도록 함
+COST_ORDER = {COST_HIGH: 0, COST_MEDIUM: 1, COST_LOW: 2}
+
+# 워커 프로세스별 분석기 (initializer에서 한 번 생성)
+_worker_analyzer: Optional[ForensicsAnalyzer] = None
+
+
+def _init_worker(source: Tuple, hive_type: str, pattern_index: Dict):
+    """워커 초기화 - 하이브에 붙어 분석기 생성 (부모가 스캔한 패턴 오프셋 재사용)"""
+    global _worker_analyzer
+    parser = RegistryParser.attach(source)
+    parser.load_pattern_index(pattern_index)
+    _worker_analyzer = ForensicsAnalyzer(parser, hive_type)
+
+
+def _run_worker(name: str) -> Tuple[str, List[Dict]]:
+    """워커에서 분석 모듈 하나 실행"""
+    return name, getattr(_worker_analyzer, ANALYZER_MANIFEST[name]['method'])()
+
+
+def run_analyzers_parallel(analyzer: ForensicsAnalyzer, max_workers: int = DEFAULT_WORKERS,
+                           on_analyzer_done: Optional[Callable[[str, int], None]] = None,
+                           should_stop: Optional[Callable[[], bool]] = None,
+                           names: Optional[List[str]] = None) -> Dict[str, List[Dict]]:
+    """적용되는 분석 모듈을 프로세스 풀로 실행 - 결과는 매니페스트 순서로 병합
+
+    작은 하이브이거나 프로세스를 띄울 수 없으면 남은 모듈을 현재 프로세스에서 순차 실행한다.
+    콜백은 ForensicsAnalyzer.run_analyzers와 같다 (취소 시 대기 중인 모듈은 실행하지 않음).
+    names는 실행할 모듈 (기본값: 적용되는 모듈 전체, 나머지 키는 빈 결과)
+    """
+    if names is None:
+        names = analyzer.scheduled
+    pending = set(names)
+    names = sorted(names, key=lambda name: COST_ORDER.get(ANALYZER_MANIFEST[name]['cost'], 0))
+    results: Dict[str, List[Dict]] = {}
+
+    workers = min(max_workers, len(names)) if analyzer.parser.size >= PARALLEL_MIN_HIVE_SIZE else 1
+    if workers > 1:
+        # 등록 패턴은 부모에서 한 번만 스캔 (큰 하이브는 hbin 청크 병렬)하고 워커에 전달
+        analyzer.parser.scan_patterns()
+        source, shm = analyzer.parser.share()
+        executor = None
+        try:
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=pool_context(),
+                                           initializer=_init_worker,
+                                           initargs=(source, analyzer.hive_type,
+                                                     analyzer.parser.pattern_index_snapshot()))
+            futures = [executor.submit(_run_worker, name) for name in names]
+            for future in as_completed(futures):
+                name, findings = future.result()
+                results[name] = findings
+                if on_analyzer_done:
+                    on_analyzer_done(name, len(findings))
+                if should_stop and should_stop():
+                    raise AnalysisCancelled()
+        except (OSError, BrokenProcessPool) as e:
+            print(f"Parallel analysis unavailable, running serially: {e}", file=sys.stderr)
+        finally:
+            if executor is not None:
+                # 취소 / 오류 시 대기 중인 모듈은 버리고 기다리지 않음
+                done = len(results) == len(names)
+                executor.shutdown(wait=done, cancel_futures=not done)
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+    findings = {}
+    for name, entry in ANALYZER_MANIFEST.items():
+        if name in results:
+            findings[name] = results[name]
+        elif name in pending:
+            if should_stop and should_stop():
+                raise AnalysisCancelled()
+            findings[name] = getattr(analyzer, entry['method'])()
+            if on_analyzer_done:
+                on_analyzer_done(name, len(findings[name]))
+        else:
+            findings[name] = []
+    return findings
@@ -2,6 +2,13 @@
 Core modules - 핵심 엔진
 """
 
-from .registry_parser import RegistryParser
+from .registry_parser import RegistryParser, RegistryKey, RegistryValue
+from .pattern_scanner import PatternScanner
+from .filetime_index import FiletimeIndex
+from .string_table import StringTable
+from .path_boundary import PathBoundaryFinder
+from .candidate_extractor import CandidateExtractor
+from .keyword_automaton import KeywordAutomaton
 
-__all__ = ['RegistryParser']
+__all__ = ['RegistryParser', 'RegistryKey', 'RegistryValue', 'PatternScanner', 'FiletimeIndex', 'StringTable', 'PathBoundaryFinder',
+           'CandidateExtractor', 'KeywordAutomaton']
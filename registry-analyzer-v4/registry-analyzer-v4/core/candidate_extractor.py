@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Candidate Extractor - 해시 / 키워드 문자열 후보 추출기 (Amcache)
+"""
+
+import re
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+
+SHA1_SIZE = 20               # SHA1 바이트 수
+SHA1_MIN_HEX_DIGITS = 5      # 최소 엔트로피: 서로 다른 hex 문자 수
+FILE_ID_RANGE = 1024         # 히트와 FileId 값 사이 최대 거리 (바이트)
+
+# Amcache FileId 값: '0000' + SHA1 40자 (REG_SZ, UTF-16 LE)
+AMCACHE_FILE_ID = re.compile(
+    '0000'.encode('utf-16-le') + rb'((?:[0-9a-fA-F]\x00){40})(?![0-9a-fA-F]\x00)'
+)
+
+
+class CandidateExtractor:
+    """Amcache 필드 후보 추출기
+
+    - SHA1: 20바이트 창을 한 바이트씩 밀면서 hex 문자(니블) 종류 수를 갱신해
+      창마다 hex 문자열과 set을 새로 만들지 않는다.
+    - FileId: '0000' 접두 UTF-16 SHA1 값을 하이브 전체에서 한 번 색인한다.
+    - 키워드: read_unicode_string 결과에 키워드가 나타날 수 있는 위치
+      (사이에 필터링되는 코드 유닛만 끼어 있는 UTF-16 키워드)를 색인한다.
+    """
+
+    def __init__(self, data, allowed_chars: str):
+        self.data = data
+        self.size = len(data)
+        self._file_ids: Optional[Tuple[array, List[str]]] = None
+        self._keyword_matches: Dict[str, Tuple[array, array]] = {}
+
+        # read_unicode_string이 버리는 코드 유닛 (NUL 제외): 상위 바이트 0의 제어 문자 등, 상위 바이트 전체가 제외되는 범위
+        allowed = set(allowed_chars)
+        rejected_low = b''.join(re.escape(bytes([c])) for c in range(1, 0x100) if chr(c) not in allowed)
+        rejected_high = b''.join(re.escape(bytes([h])) for h in range(1, 0x100)
+                                 if all(chr(h << 8 | c) not in allowed for c in range(0x100)))
+        self._gap = b'(?:[%s]\x00|[\x00-\xff][%s])*' % (rejected_low, rejected_high)
+
+    # ===== SHA1 =====
+
+    def first_hash_window(self, start: int, end: int, width: int = SHA1_SIZE,
+                          min_distinct: int = SHA1_MIN_HEX_DIGITS) -> Optional[int]:
+        """[start, end) 시작 위치 중 width 바이트의 hex 문자 종류가 min_distinct 이상인 첫 위치"""
+        start = max(start, 0)
+        end = min(end, self.size - width + 1)
+        if start >= end:
+            return None
+
+        window = self.data[start:end + width - 1]
+        counts = [0] * 16
+        distinct = 0
+        for byte in window[:width]:
+            for nibble in (byte >> 4, byte & 0x0F):
+                if counts[nibble] == 0:
+                    distinct += 1
+                counts[nibble] += 1
+
+        last = end - start - 1
+        index = 0
+        while distinct < min_distinct:
+            if index == last:
+                return None
+            removed = window[index]
+            added = window[index + width]
+            for nibble in (removed >> 4, removed & 0x0F):
+                counts[nibble] -= 1
+                if counts[nibble] == 0:
+                    distinct -= 1
+            for nibble in (added >> 4, added & 0x0F):
+                if counts[nibble] == 0:
+                    distinct += 1
+                counts[nibble] += 1
+            index += 1
+        return start + index
+
+    def file_id_near(self, offset: int, max_distance: int = FILE_ID_RANGE) -> Optional[str]:
+        """offset에서 가장 가까운 Amcache FileId의 SHA1 (대문자 hex)"""
+        if self._file_ids is None:
+            positions = array('Q')
+            hashes = []
+            for match in AMCACHE_FILE_ID.finditer(self.data):
+                positions.append(match.start())
+                hashes.append(match.group(1).decode('utf-16-le').upper())
+            self._file_ids = (positions, hashes)
+
+        positions, hashes = self._file_ids
+        index = bisect_left(positions, offset)
+        best = None
+        for candidate in (index - 1, index):
+            if 0 <= candidate < len(positions):
+                distance = abs(positions[candidate] - offset)
+                if distance <= max_distance and (best is None or distance < best[0]):
+                    best = (distance, hashes[candidate])
+        return best[1] if best else None
+
+    # ===== 키워드 (UTF-16) =====
+
+    def _keyword_index(self, keyword: str) -> Tuple[array, array]:
+        """키워드 위치와 끝 위치 (필터링되는 코드 유닛이 사이에 있어도 매칭, 겹침 허용)"""
+        if keyword not in self._keyword_matches:
+            units = [re.escape(char.encode('utf-16-le')) for char in keyword]
+            pattern = re.compile(self._gap.join(units))
+            starts = array('Q')
+            ends = array('Q')
+            match = pattern.search(self.data)
+            while match:
+                starts.append(match.start())
+                ends.append(match.end())
+                match = pattern.search(self.data, match.start() + 1)
+            self._keyword_matches[keyword] = (starts, ends)
+        return self._keyword_matches[keyword]
+
+    def keyword_starts(self, keyword: str, lowest: int, highest: int, window: int) -> List[int]:
+        """read_unicode_string(start, window)에 keyword가 나타날 수 있는 start (오름차순)
+
+        start 범위는 [lowest, highest), 키워드 앞에 정렬된 NUL 유닛이 없고 키워드가 창 안에 끝나는 위치
+        """
+        starts, ends = self._keyword_index(keyword)
+        lowest = max(lowest, 0)
+        positions = set()
+        for index in range(bisect_left(starts, lowest), bisect_left(starts, highest + window)):
+            match_start = starts[index]
+            lo = max(lowest, ends[index] - window, self._last_utf16_null(lowest, match_start) + 2)
+            hi = min(highest - 1, match_start)
+            lo += (match_start - lo) & 1
+            positions.update(range(lo, hi + 1, 2))
+        return sorted(positions)
+
+    def _last_utf16_null(self, lowest: int, position: int) -> int:
+        """[lowest, position) 구간에서 position과 같은 정렬의 마지막 0x0000 유닛 위치 (없으면 lowest - 2)"""
+        end = position
+        while True:
+            found = self.data.rfind(b'\x00\x00', lowest, end)
+            if found == -1:
+                return lowest - 2
+            if (position - found) & 1 == 0:
+                return found
+            end = found + 1
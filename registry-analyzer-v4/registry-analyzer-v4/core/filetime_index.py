@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+FILETIME Index - 하이브 전체 FILETIME 후보 인덱스
+"""
+
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from functools import lru_cache
+from typing import Iterator, List, Optional
+
+
+FILETIME_EPOCH = datetime(1601, 1, 1)
+FILETIME_TICKS_PER_SECOND = 10000000
+FILETIME_TICKS_PER_DAY = 86400 * FILETIME_TICKS_PER_SECOND
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """numpy 모듈 (첫 인덱스 생성 때 import - 시작 시간에서 제외, 없으면 None)"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def year_to_filetime(year: int) -> int:
+    """해당 연도 1월 1일 00:00 (UTC)의 FILETIME 값"""
+    delta = datetime(year, 1, 1) - FILETIME_EPOCH
+    return (delta.days * 86400 + delta.seconds) * FILETIME_TICKS_PER_SECOND
+
+
+class FiletimeIndex:
+    """지정 범위 안의 QWORD 위치를 모두 기록한 인덱스
+
+    8가지 바이트 정렬(offset % 8) 각각에 대해 하이브 전체를 QWORD 배열로 보고
+    lo <= 값 <= hi 인 위치를 정렬된 배열로 보관한다. 분석기 헬퍼가 오프셋 주변을
+    8바이트 간격으로 훑는 대신 이분 탐색으로 후보 위치만 바로 얻을 수 있다.
+    """
+
+    def __init__(self, data, lo: int, hi: int):
+        self.lo = lo
+        self.hi = hi
+        self.size = len(data)
+        self._positions: List[array] = [self._build(data, residue) for residue in range(8)]
+
+    @classmethod
+    def for_years(cls, data, min_year: int, max_year: int) -> 'FiletimeIndex':
+        """연도 범위 인덱스 (지역 시간 변환 오차를 위해 앞뒤 하루 여유)"""
+        lo = year_to_filetime(min_year) - FILETIME_TICKS_PER_DAY
+        hi = year_to_filetime(max_year + 1) + FILETIME_TICKS_PER_DAY
+        return cls(data, max(lo, 1), hi)
+
+    def _build(self, data, residue: int) -> array:
+        """정렬 residue의 후보 위치 배열 생성"""
+        count = max(self.size - residue, 0) // 8
+        positions = array('Q')
+        if count == 0:
+            return positions
+
+        np = _numpy()
+        if np is not None:
+            values = np.frombuffer(data, dtype='<u8', count=count, offset=residue)
+            hits = np.flatnonzero((values >= self.lo) & (values <= self.hi))
+            positions.frombytes((hits.astype('<u8') * 8 + residue).tobytes())
+            return positions
+
+        values = array('Q')
+        values.frombytes(bytes(memoryview(data)[residue:residue + count * 8]))
+        lo, hi = self.lo, self.hi
+        positions.extend(i * 8 + residue for i, value in enumerate(values) if lo <= value <= hi)
+        return positions
+
+    def __len__(self) -> int:
+        return sum(len(positions) for positions in self._positions)
+
+    def candidates(self, start: int, end: int) -> Iterator[int]:
+        """[start, end) 구간에서 start와 같은 정렬의 후보 위치 (오름차순)
+
+        range(start, end, 8)로 훑을 때 값이 범위 안에 드는 위치만 돌려준다.
+        """
+        positions = self._positions[start % 8]
+        index = bisect_left(positions, max(start, 0))
+        while index < len(positions) and positions[index] < end:
+            yield positions[index]
+            index += 1
+
+    def first(self, start: int, end: int) -> Optional[int]:
+        """[start, end) 구간의 첫 번째 후보 위치"""
+        return next(self.candidates(start, end), None)
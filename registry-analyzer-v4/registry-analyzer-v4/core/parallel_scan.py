@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Parallel Scan - hbin 경계 청크 단위 병렬 패턴 스캔
+"""
+
+import mmap
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .pattern_scanner import PatternScanner
+from .process_pool import pool_context
+
+
+PARALLEL_SCAN_MIN_SIZE = 64 * 1024 * 1024  # 이보다 작은 하이브는 단일 패스가 더 빠름
+CHUNK_MIN_SIZE = 8 * 1024 * 1024           # 청크 최소 크기
+CHUNKS_PER_WORKER = 4                      # 워커당 청크 수 (hbin 크기 편차 완화)
+
+
+def plan_chunks(size: int, boundaries: Sequence[int], workers: int,
+                min_chunk: int = CHUNK_MIN_SIZE) -> List[Tuple[int, int]]:
+    """[0, size)를 boundaries(hbin 시작 위치, 오름차순) 중 일부에서 잘라 [(start, end)] 생성"""
+    target = max(min_chunk, -(-size // max(workers * CHUNKS_PER_WORKER, 1)))
+    chunks = []
+    start = 0
+    for boundary in boundaries:
+        if boundary >= size:
+            break
+        if boundary - start >= target:
+            chunks.append((start, boundary))
+            start = boundary
+    if size > start:
+        chunks.append((start, size))
+    return chunks
+
+
+def _attach(source: Tuple):
+    """source에 붙어 (버퍼, 해제 대상) 반환 - 복사 없음"""
+    if source[0] == 'file':
+        with open(source[1], 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return data, data
+    shm = shared_memory.SharedMemory(name=source[1])
+    return shm.buf[:source[2]], shm
+
+
+def _scan_chunk(source: Tuple, patterns: List[bytes], ignore_case: bool,
+                start: int, end: int) -> Dict[bytes, List[int]]:
+    """워커: 청크 하나 스캔"""
+    data, handle = _attach(source)
+    try:
+        return PatternScanner(patterns, ignore_case=ignore_case).scan_chunk(data, start, end)
+    finally:
+        if isinstance(data, memoryview):
+            data.release()
+        handle.close()
+
+
+def scan_parallel(source: Tuple, scanner: PatternScanner, chunks: List[Tuple[int, int]],
+                  max_workers: int) -> Optional[Dict[bytes, List[int]]]:
+    """청크를 프로세스 풀에서 스캔하고 청크 순서대로 병합 (단일 패스 scan과 같은 결과)
+
+    프로세스 풀을 쓸 수 없으면 None (호출자가 단일 패스로 처리)
+    """
+    patterns = scanner.patterns
+    tables = scanner.scan(b'')  # 패턴별 빈 테이블
+    try:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(chunks)), mp_context=pool_context()) as executor:
+            futures = [executor.submit(_scan_chunk, source, patterns, scanner.ignore_case, start, end)
+                       for start, end in chunks]
+            for future in futures:
+                for key, offsets in future.result().items():
+                    tables[key].extend(offsets)
+    except (OSError, BrokenProcessPool) as e:
+        print(f"Parallel scan unavailable, scanning serially: {e}", file=sys.stderr)
+        return None
+    return tables
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Path Boundary - 히트 주변 경로 시작 위치 탐색
+"""
+
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Tuple
+
+
+DEVICE_PREFIX = '\\Device\\'
+
+
+class PathBoundaryFinder:
+    """드라이브 문자 경로(`X:\\...`)가 시작될 수 있는 위치만 골라내는 탐색기
+
+    분석기는 히트에서 한 바이트(ASCII) 또는 두 바이트(UTF-16)씩 뒤로 물러나며
+    매번 500바이트 창을 디코딩해 ':\\'를 찾는다. 하이브 전체의 ':' + '\\' 위치를
+    한 번 색인해 두면, 창 안에 ':\\'가 들어올 수 없는 시작 위치는 디코딩 없이
+    건너뛸 수 있다. 남은 후보는 기존과 같은 순서(히트에서 가까운 순)로 돌려주므로
+    후보마다 원래 검사를 그대로 적용하면 결과가 동일하다.
+    """
+
+    # ASCII: 디코딩 시 버려지는 0x80 이상 바이트를 사이에 둔 ':' ... '\\'도 ':\\'가 된다
+    _ASCII_SEPARATOR = re.compile(rb':[\x80-\xff]*\\')
+    _UTF16_COLON = re.compile(rb':\x00')
+
+    def __init__(self, data):
+        self.data = data
+        self.size = len(data)
+        self._ascii_colons = array('Q')     # ':' 위치
+        self._ascii_separators = array('Q')  # 대응하는 '\\' 위치
+        for match in self._ASCII_SEPARATOR.finditer(data):
+            self._ascii_colons.append(match.start())
+            self._ascii_separators.append(match.end() - 1)
+        self._utf16_colons = array('Q', (m.start() for m in self._UTF16_COLON.finditer(data)))
+
+    @staticmethod
+    def _descending(intervals: List[Tuple[int, int]], step: int, phase: int = 0) -> List[int]:
+        """[lo, hi] 구간 합집합의 위치 (phase 정렬, step 간격, 큰 값부터)"""
+        positions = set()
+        for lo, hi in intervals:
+            positions.update(range(lo + (phase - lo) % step, hi + 1, step))
+        return sorted(positions, reverse=True)
+
+    def ascii_starts(self, offset: int, window: int = 500, max_back: int = 500) -> List[int]:
+        """read_string(start, window)에 ':\\'가 드라이브 문자 뒤에 나타날 수 있는 시작 위치
+
+        offset에서 max_back 바이트 이내, 1바이트 간격, 가까운 순
+        """
+        lowest = max(offset - max_back + 1, 0)
+        colons = self._ascii_colons
+        separators = self._ascii_separators
+        first = bisect_right(colons, lowest)
+        last = bisect_left(colons, offset + window)
+
+        intervals = []
+        for index in range(first, last):
+            colon = colons[index]
+            # start < colon, '\\'가 창 안, start ~ colon 사이에 NUL 없음
+            lo = max(lowest, separators[index] - window + 1, self.data.rfind(b'\x00', lowest, colon) + 1)
+            hi = min(offset, colon - 1)
+            if lo <= hi:
+                intervals.append((lo, hi))
+        return self._descending(intervals, 1)
+
+    def utf16_starts(self, offset: int, window: int = 500, max_back: int = 500) -> List[int]:
+        """read_unicode_string(start, window)에 ':'가 드라이브 문자 뒤에 나타날 수 있는 시작 위치
+
+        offset에서 max_back 바이트 이내, 2바이트 간격 (offset과 같은 정렬), 가까운 순
+        """
+        phase = offset & 1
+        lowest = offset - ((max_back - 1) // 2) * 2
+        while lowest < 0:
+            lowest += 2
+        colons = self._utf16_colons
+        first = bisect_right(colons, lowest)
+        last = bisect_left(colons, offset + window)
+
+        intervals = []
+        for index in range(first, last):
+            colon = colons[index]
+            if (colon & 1) != phase:
+                continue
+            # start < colon, ':' 다음 유닛이 창 안, start ~ colon 사이에 정렬된 NUL 유닛 없음
+            lo = max(lowest, colon + 4 - window, self._last_utf16_null(lowest, colon) + 2)
+            hi = min(offset, colon - 2)
+            if lo <= hi:
+                intervals.append((lo, hi))
+        return self._descending(intervals, 2, phase)
+
+    def _last_utf16_null(self, lowest: int, colon: int) -> int:
+        """[lowest, colon) 구간에서 colon과 같은 정렬의 마지막 0x0000 유닛 위치 (없으면 lowest - 2)"""
+        end = colon
+        while True:
+            position = self.data.rfind(b'\x00\x00', lowest, end)
+            if position == -1:
+                return lowest - 2
+            if (colon - position) & 1 == 0:
+                return position
+            end = position + 1  # 정렬이 어긋난 위치 앞쪽에서 다시 검색
+
+    def device_prefix(self, offset: int, max_back: int = 500) -> Optional[Tuple[int, str]]:
+        """offset 이전(포함) max_back 바이트 안에서 가장 가까운 '\\Device\\' 위치와 인코딩"""
+        lowest = max(offset - max_back + 1, 0)
+        best = None
+        for encoding in ('ascii', 'utf-16-le'):
+            needle = DEVICE_PREFIX.encode(encoding)
+            position = self.data.rfind(needle, lowest, offset + len(needle))
+            if position != -1 and (best is None or position > best[0]):
+                best = (position, encoding)
+        return best
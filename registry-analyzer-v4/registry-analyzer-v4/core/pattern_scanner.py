@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Pattern Scanner - 다중 패턴 단일 패스 스캐너
+"""
+
+import re
+from typing import Dict, Iterable, List, Union
+
+
+class PatternScanner:
+    """여러 패턴을 한 번의 순회로 검색하는 스캐너
+
+    등록된 패턴 전체를 긴 패턴 우선의 정규식 대안(alternation) 하나로 컴파일해
+    Aho-Corasick처럼 데이터를 한 번만 훑는다. 순회는 re 엔진(C) 안에서 이루어지고,
+    같은 위치에서 겹치는 짧은 패턴(예: 'Run' / 'RunOnce')은 접두사 맵으로 함께 기록한다.
+    """
+
+    def __init__(self, patterns: Iterable[Union[str, bytes]] = (), ignore_case: bool = False):
+        self.ignore_case = ignore_case
+        self._patterns: List[bytes] = []
+        self._compiled = None
+        self._prefixes: Dict[bytes, List[bytes]] = {}
+        self.register(*patterns)
+
+    @staticmethod
+    def to_bytes(pattern: Union[str, bytes]) -> bytes:
+        """패턴을 바이트로 변환 (RegistryParser.search_pattern과 동일한 ASCII 인코딩)"""
+        if isinstance(pattern, str):
+            return pattern.encode('ascii', errors='ignore')
+        return bytes(pattern)
+
+    def _key(self, pattern: bytes) -> bytes:
+        return pattern.lower() if self.ignore_case else pattern
+
+    def register(self, *patterns: Union[str, bytes]):
+        """검색 패턴 등록"""
+        for pattern in patterns:
+            needle = self.to_bytes(pattern)
+            if needle and needle not in self._patterns:
+                self._patterns.append(needle)
+                self._compiled = None
+
+    @property
+    def patterns(self) -> List[bytes]:
+        return list(self._patterns)
+
+    def _compile(self):
+        """긴 패턴 우선 alternation 정규식과 접두사 맵 생성"""
+        keys = sorted({self._key(p) for p in self._patterns}, key=len, reverse=True)
+        flags = re.IGNORECASE if self.ignore_case else 0
+        self._compiled = re.compile(b'|'.join(re.escape(k) for k in keys), flags)
+
+        # 한 위치에서는 가장 긴 패턴만 매칭되므로, 그 접두사인 패턴들을 함께 기록
+        self._prefixes = {
+            key: [other for other in keys if other != key and key.startswith(other)]
+            for key in keys
+        }
+
+    @property
+    def max_length(self) -> int:
+        """가장 긴 패턴 길이 (청크 경계 겹침 크기)"""
+        return max((len(p) for p in self._patterns), default=0)
+
+    def scan(self, data, start: int = 0, end: int = None) -> Dict[bytes, List[int]]:
+        """데이터를 한 번 순회하여 패턴별 오프셋 테이블 생성
+
+        Returns:
+            {패턴 바이트: 정렬된 오프셋 리스트} (ignore_case면 소문자 패턴 키)
+        """
+        end = len(data) if end is None else end
+        return self._scan(data, start, end, end)
+
+    def scan_chunk(self, data, start: int, end: int) -> Dict[bytes, List[int]]:
+        """[start, end)에서 시작하는 매치만 기록
+
+        경계에 걸친 매치를 위해 end 뒤로 (최대 패턴 길이 - 1) 바이트까지 읽는다.
+        한 위치의 매치는 그 위치 뒤의 바이트로만 정해지므로, 청크 결과를 순서대로
+        이어 붙이면 전체 scan 결과와 같다.
+        """
+        limit = min(len(data), end + max(self.max_length - 1, 0))
+        return self._scan(data, start, limit, end)
+
+    def _scan(self, data, start: int, limit: int, hit_end: int) -> Dict[bytes, List[int]]:
+        """[start, limit) 안에서 매칭, 시작 위치가 hit_end 미만인 매치만 기록"""
+        tables = {self._key(p): [] for p in self._patterns}
+        if not self._patterns:
+            return tables
+        if self._compiled is None:
+            self._compile()
+
+        search = self._compiled.search
+        prefixes = self._prefixes
+        ignore_case = self.ignore_case
+
+        pos = start
+        while True:
+            match = search(data, pos, limit)
+            if match is None:
+                break
+            hit = match.start()
+            if hit >= hit_end:
+                break
+            key = match.group().lower() if ignore_case else match.group()
+            tables[key].append(hit)
+            for prefix in prefixes[key]:
+                tables[prefix].append(hit)
+            pos = hit + 1
+
+        return tables
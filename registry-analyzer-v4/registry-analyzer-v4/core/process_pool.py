@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+Process Pool - 프로세스 풀 시작 방식 (분석 / 스캔 / 하이브 로드 풀이 공유)
+"""
+
+import multiprocessing
+from multiprocessing.context import BaseContext
+
+
+# fork는 부모의 스레드 (GUI 작업 스레드) / 잠금 / 열린 mmap 상태까지 복제하므로 사용하지 않음
+POOL_START_METHOD = 'spawn'
+
+
+def pool_context() -> BaseContext:
+    """ProcessPoolExecutor의 mp_context - 운영체제와 관계없이 spawn (Windows / 실행 파일과 같은 동작)"""
+    return multiprocessing.get_context(POOL_START_METHOD)
@@ -4,10 +4,106 @@ Registry Parser - 레지스트리 바이너리 파서
 """
 
 import os
+import mmap
+import hashlib
+from multiprocessing import shared_memory
 import struct
 import re
+from array import array
+from collections import OrderedDict
 from datetime import datetime
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .pattern_scanner import PatternScanner
+from .filetime_index import FiletimeIndex
+from .string_table import StringTable, STRING_MIN_LENGTH
+from .path_boundary import PathBoundaryFinder
+from .candidate_extractor import CandidateExtractor
+from .parallel_scan import PARALLEL_SCAN_MIN_SIZE, plan_chunks, scan_parallel
+
+
+# regf 베이스 블록 / hbin 레이아웃
+BASE_BLOCK_SIZE = 0x1000         # 베이스 블록 크기 (hbin 데이터 시작 위치)
+HBIN_HEADER_SIZE = 0x20          # hbin 헤더 크기
+INVALID_OFFSET = 0xFFFFFFFF      # 셀 오프셋 없음
+BIG_DATA_SEGMENT_SIZE = 16344    # db 셀 세그먼트 최대 크기
+
+# search_pattern 오프셋 인덱스
+PATTERN_INDEX_MAX_OFFSETS = 4 * 1024 * 1024  # 캐시에 보관할 최대 오프셋 수 (8바이트씩, 약 32MB)
+PREFIX_FILTER_COST = 64                      # 접두사 후보 1개 비교 비용 (바이트 검색 대비 추정치)
+SEARCH_ENCODINGS = ('ascii', 'utf-16-le')    # search_pattern_encoded 기본 인코딩
+HASH_CHUNK_SIZE = 8 * 1024 * 1024            # content_hash 순회 단위
+
+# nk 플래그
+KEY_HIVE_ENTRY = 0x0004
+KEY_COMP_NAME = 0x0020
+
+# vk 플래그
+VALUE_COMP_NAME = 0x0001
+
+# 값 타입
+REG_TYPES = {
+    0: 'REG_NONE',
+    1: 'REG_SZ',
+    2: 'REG_EXPAND_SZ',
+    3: 'REG_BINARY',
+    4: 'REG_DWORD',
+    5: 'REG_DWORD_BIG_ENDIAN',
+    6: 'REG_LINK',
+    7: 'REG_MULTI_SZ',
+    8: 'REG_RESOURCE_LIST',
+    9: 'REG_FULL_RESOURCE_DESCRIPTOR',
+    10: 'REG_RESOURCE_REQUIREMENTS_LIST',
+    11: 'REG_QWORD',
+}
+
+
+# read_unicode_string 허용 문자 (출력 가능하고 0x0300 미만, 제어 문자 제외)
+_UNICODE_ALLOWED = ''.join(
+    chr(c) for c in range(0x0300)
+    if chr(c).isprintable() and not (c <= 0x1f or 0x7f <= c <= 0x9f)
+)
+_UNICODE_ALLOWED_SET = frozenset(_UNICODE_ALLOWED)
+_UNICODE_REJECT = re.compile('[^%s]+' % re.escape(_UNICODE_ALLOWED))
+
+
+# 하이브 타입 판별: 루트 키 1단계 하위 키 이름
+HIVE_ROOT_SUBKEYS = {
+    'SYSTEM': ('ControlSet001', 'Select', 'MountedDevices', 'Setup'),
+    'SOFTWARE': ('Microsoft', 'Classes', 'Clients', 'Policies', 'RegisteredApplications'),
+    'NTUSER.DAT': ('Software', 'Control Panel', 'Environment', 'Keyboard Layout', 'AppEvents'),
+    'SAM': ('SAM',),
+    'SECURITY': ('Policy', 'RXACT', 'Cache'),
+    'UsrClass.dat': ('Local Settings', 'CLSID', '*'),
+    'Amcache.hve': ('Root',),
+}
+HIVE_EVIDENCE_WEIGHTS = {'file_path': 0.3, 'base_block': 0.3, 'root_subkeys': 0.4}
+HIVE_PATTERN_CONFIDENCE = 0.2  # 바이너리 패턴으로만 판별한 경우
+
+
+def _hive_type_from_name(filename: str) -> Optional[str]:
+    """표준 레지스트리 파일명으로 하이브 타입 판별"""
+    filename = filename.strip().upper()
+    if 'NTUSER.DAT' in filename or filename == 'NTUSER':
+        return 'NTUSER.DAT'
+    elif 'USRCLASS.DAT' in filename or 'USRCLASS' in filename:
+        return 'UsrClass.dat'
+    elif filename == 'SYSTEM':
+        return 'SYSTEM'
+    elif filename == 'SOFTWARE':
+        return 'SOFTWARE'
+    elif filename == 'SAM':
+        return 'SAM'
+    elif filename == 'SECURITY':
+        return 'SECURITY'
+    elif 'AMCACHE.HVE' in filename or 'AMCACHE' in filename:
+        return 'Amcache.hve'
+    return None
+
+
+def canonical_hive_type(hive_type: str) -> str:
+    """하이브 타입을 detect_hive_type 이름으로 정규화 (예: 'NTUSER' -> 'NTUSER.DAT', 'AMCACHE' -> 'Amcache.hve')"""
+    return _hive_type_from_name(hive_type) or hive_type
 
 
 class RegistryParser:
@@ -15,8 +111,100 @@ class RegistryParser:
     
     def __init__(self, data: bytes, file_path: str = None):
         self.data = data
+        self.view = memoryview(data)  # 복사 없는 슬라이스용
         self.size = len(data)
         self.file_path = file_path
+        self._file = None
+        self._base_block = None
+        self._root_key = None
+        self._scanner = PatternScanner()
+        self._scanned_patterns = set()
+        self._pattern_index: 'OrderedDict[bytes, array]' = OrderedDict()
+        self._pattern_index_size = 0
+        self.pattern_index_limit = PATTERN_INDEX_MAX_OFFSETS
+        self._pattern_stats = {'hits': 0, 'misses': 0, 'prefix_hits': 0, 'evictions': 0}
+        self.scan_workers = 1  # 큰 하이브 패턴 스캔을 hbin 청크로 나눠 실행할 프로세스 수
+        self._filetime_indexes: Dict[Tuple, FiletimeIndex] = {}
+        self._string_table = None
+        self._path_boundaries = None
+        self._candidate_extractor = None
+        self._unicode_memo = [None, None]  # read_unicode_string 정렬(짝/홀)별 직전 결과
+        self._sha256 = None
+    
+    @classmethod
+    def open(cls, file_path: str) -> 'RegistryParser':
+        """파일을 mmap으로 열기 (전체 읽기/복사 없음)"""
+        f = open(file_path, 'rb')
+        try:
+            if os.fstat(f.fileno()).st_size == 0:
+                data = b''  # 빈 파일은 mmap 불가
+            else:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            f.close()
+            raise
+        parser = cls(data, file_path)
+        parser._file = f
+        return parser
+    
+    def close(self):
+        """mmap / 파일 핸들 해제"""
+        self._string_table = None
+        self._path_boundaries = None
+        self._candidate_extractor = None
+        self.view.release()
+        if isinstance(self.data, mmap.mmap):
+            try:
+                self.data.close()
+            except BufferError:
+                pass  # 외부에서 참조 중인 슬라이스가 있으면 GC에 맡김
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def share(self) -> Tuple[Tuple, Optional[shared_memory.SharedMemory]]:
+        """다른 프로세스가 같은 하이브 바이트에 붙기 위한 (source, 공유 메모리)
+        
+        mmap으로 연 파일은 파일 경로를 넘겨 OS 페이지 캐시를 공유하고, 메모리 버퍼는
+        공유 메모리에 한 번 복사한다. 공유 메모리는 호출자가 close/unlink 한다.
+        """
+        if self._file is not None and self.file_path and os.path.isfile(self.file_path):
+            return ('file', self.file_path, self.size), None
+        shm = shared_memory.SharedMemory(create=True, size=max(self.size, 1))
+        shm.buf[:self.size] = self.view
+        return ('shm', shm.name, self.size, self.file_path), shm
+    
+    @classmethod
+    def attach(cls, source: Tuple) -> 'RegistryParser':
+        """share()의 source로 파서 생성 (다른 프로세스에서 사용)"""
+        if source[0] == 'file':
+            return cls.open(source[1])
+        _, name, size, file_path = source
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            # 분석기는 bytes 메서드(find/rfind)를 쓰므로 한 번 복사
+            return cls(bytes(shm.buf[:size]), file_path)
+        finally:
+            shm.close()
+    
+    def content_hash(self) -> str:
+        """하이브 내용 SHA-256 (16진수, 한 번만 계산)
+        
+        mmap으로 연 하이브는 이 순차 순회가 곧 로드 패스다 (페이지가 캐시에 올라가
+        이후 패턴 스캔이 디스크를 다시 읽지 않음).
+        """
+        if self._sha256 is None:
+            digest = hashlib.sha256()
+            for start in range(0, self.size, HASH_CHUNK_SIZE):
+                digest.update(self.view[start:start + HASH_CHUNK_SIZE])
+            self._sha256 = digest.hexdigest()
+        return self._sha256
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def validate_hive(self) -> bool:
         """레지스트리 하이브 검증"""
@@ -26,29 +214,74 @@ class RegistryParser:
         return signature == 'regf'
     
     def detect_hive_type(self) -> str:
-        """하이브 타입 자동 감지 (1차: 파일명, 2차: 바이너리 패턴)"""
+        """하이브 타입 자동 감지 (베이스 블록 / 루트 하위 키 / 파일명 근거, 실패 시 바이너리 패턴)"""
+        return self.classify_hive()['hive_type']
+    
+    @classmethod
+    def classify_file(cls, file_path: str) -> Dict:
+        """파일 하나의 하이브 타입 판별 (mmap으로 베이스 블록과 루트 키 셀만 읽음)"""
+        try:
+            with cls.open(file_path) as parser:
+                return parser.classify_hive()
+        except Exception:
+            return {'hive_type': 'UNKNOWN', 'confidence': 0.0, 'evidence': {}}
+    
+    def classify_hive(self) -> Dict:
+        """하이브 타입 판별과 신뢰도
+        
+        근거별 가중치(HIVE_EVIDENCE_WEIGHTS)를 타입마다 합산한다.
+        - file_path: 디스크 파일명
+        - base_block: 베이스 블록 0x30의 내장 파일명
+        - root_subkeys: 루트 키 1단계 하위 키 이름과 HIVE_ROOT_SUBKEYS의 일치 비율
+        
+        Returns:
+            {'hive_type': 'SYSTEM', 'confidence': 0.7,
+             'evidence': {'file_path': None, 'base_block': 'SYSTEM', 'root_subkeys': {'SYSTEM': 1.0}}}
+        """
+        evidence = {'file_path': None, 'base_block': None, 'root_subkeys': {}}
+        scores: Dict[str, float] = {}
+        matched: Dict[str, int] = {}
+        
+        if self.file_path:
+            evidence['file_path'] = _hive_type_from_name(os.path.basename(self.file_path))
+        
+        try:
+            base = self.parse_base_block()
+            if self.validate_hive():
+                # 헤더만 있는 (잘린) 파일도 0x30 내장 파일명은 읽을 수 있음
+                embedded = base['file_name'] if base else self.read_unicode_string(0x30, 64)
+                evidence['base_block'] = _hive_type_from_name(embedded.replace('/', '\\').split('\\')[-1])
+            root = self.root_key() if base else None
+            if root is not None:
+                names = {key.name.lower() for key in root.iter_subkeys()}
+                for hive_type, signature in HIVE_ROOT_SUBKEYS.items():
+                    hits = sum(1 for name in signature if name.lower() in names)
+                    if hits:
+                        evidence['root_subkeys'][hive_type] = round(hits / len(signature), 2)
+                        matched[hive_type] = hits
+        except Exception:
+            pass
+        
+        for source in ('file_path', 'base_block'):
+            if evidence[source]:
+                scores[evidence[source]] = scores.get(evidence[source], 0.0) + HIVE_EVIDENCE_WEIGHTS[source]
+        for hive_type, ratio in evidence['root_subkeys'].items():
+            scores[hive_type] = scores.get(hive_type, 0.0) + HIVE_EVIDENCE_WEIGHTS['root_subkeys'] * ratio
+        
+        if scores:
+            # 동점이면 일치한 하위 키가 많은 쪽 (예: SECURITY 루트에도 'SAM' 키가 있음)
+            hive_type = max(scores, key=lambda t: (scores[t], matched.get(t, 0)))
+            return {'hive_type': hive_type, 'confidence': round(min(scores[hive_type], 1.0), 2),
+                    'evidence': evidence}
+        
+        # 구조 근거가 없으면 (손상/부분 파일) 바이너리 패턴 검색
+        hive_type = self._detect_hive_type_by_patterns()
+        return {'hive_type': hive_type, 'confidence': 0.0 if hive_type == 'UNKNOWN' else HIVE_PATTERN_CONFIDENCE,
+                'evidence': evidence}
+    
+    def _detect_hive_type_by_patterns(self) -> str:
+        """바이너리 패턴 기반 감지 (처음 2MB 검색)"""
         try:
-            # 1차: 파일명 기반 감지 (가장 정확하고 빠름)
-            if self.file_path:
-                filename = os.path.basename(self.file_path).upper()
-                
-                # 표준 레지스트리 파일명 매칭
-                if 'NTUSER.DAT' in filename or filename == 'NTUSER':
-                    return 'NTUSER.DAT'
-                elif 'USRCLASS.DAT' in filename or 'USRCLASS' in filename:
-                    return 'UsrClass.dat'
-                elif filename == 'SYSTEM':
-                    return 'SYSTEM'
-                elif filename == 'SOFTWARE':
-                    return 'SOFTWARE'
-                elif filename == 'SAM':
-                    return 'SAM'
-                elif filename == 'SECURITY':
-                    return 'SECURITY'
-                elif 'AMCACHE.HVE' in filename or 'AMCACHE' in filename:
-                    return 'Amcache.hve'
-            
-            # 2차: 바이너리 패턴 기반 감지 (파일명으로 판별 실패 시)
             search_size = min(len(self.data), 2 * 1024 * 1024)  # 2MB까지 검색
             data_chunk = self.data[:search_size]
             
@@ -114,23 +347,25 @@ class RegistryParser:
     
     def read_dword(self, offset: int) -> int:
         """DWORD 읽기 (Little Endian)"""
-        if offset + 4 > self.size:
+        if offset < 0 or offset + 4 > self.size:
             return 0
-        return struct.unpack('<I', self.data[offset:offset+4])[0]
+        return struct.unpack_from('<I', self.data, offset)[0]
     
     def read_qword(self, offset: int) -> int:
         """QWORD 읽기 (Little Endian)"""
-        if offset + 8 > self.size:
+        if offset < 0 or offset + 8 > self.size:
             return 0
-        return struct.unpack('<Q', self.data[offset:offset+8])[0]
+        return struct.unpack_from('<Q', self.data, offset)[0]
     
     def read_string(self, offset: int, length: int) -> str:
         """ASCII 문자열 읽기"""
         if offset + length > self.size:
             return ""
         try:
-            data = self.data[offset:offset+length]
-            return data.split(b'\x00')[0].decode('ascii', errors='ignore')
+            end = self.data.find(b'\x00', offset, offset + length)
+            if end == -1:
+                end = offset + length
+            return str(self.view[offset:end], 'ascii', 'ignore')
         except:
             return ""
     
@@ -138,28 +373,53 @@ class RegistryParser:
         """UTF-16 LE 문자열 읽기 (강화된 필터링)"""
         if offset + length > self.size:
             return ""
-        try:
-            data = self.data[offset:offset+length]
-            # Decode UTF-16 LE
-            decoded = data.decode('utf-16-le', errors='ignore')
-            # Stop at first null terminator
-            null_pos = decoded.find('\x00')
-            if null_pos != -1:
-                decoded = decoded[:null_pos]
-            
-            # Enhanced filtering: Remove control characters and high Unicode planes
-            # Keep only printable ASCII + common European chars (< 0x0300)
-            decoded = ''.join(c for c in decoded if (
-                (c.isprintable() or c in '\n\r\t') and 
-                ord(c) < 0x0300  # Filter out combining diacritics and high Unicode
-            ))
-            
-            # Remove any remaining null bytes and control characters
-            decoded = re.sub(r'[\x00-\x1f\x7f-\x9f]+', '', decoded)
-            
-            return decoded.strip()
-        except:
-            return ""
+        if offset >= 0:
+            start, stop = offset, offset + length
+        else:
+            start, stop, _ = slice(offset, offset + length).indices(self.size)
+        
+        # 2바이트씩 앞뒤로 이동하며 같은 문자열을 다시 읽는 탐색 루프: 직전 결과에서 한 글자만 갱신
+        memo = self._unicode_memo[start & 1]
+        if memo is not None:
+            memo_start, terminator, filtered = memo
+            if start <= terminator and terminator + 2 <= stop:
+                if start == memo_start:
+                    return filtered.strip()
+                if start == memo_start - 2 and self.data[start:start + 2] != b'\x00\x00':
+                    filtered = self._filter_code_unit(start) + filtered
+                    self._unicode_memo[start & 1] = (start, terminator, filtered)
+                    return filtered.strip()
+                if start == memo_start + 2:
+                    if self._filter_code_unit(memo_start):
+                        filtered = filtered[1:]
+                    self._unicode_memo[start & 1] = (start, terminator, filtered)
+                    return filtered.strip()
+        
+        # Stop at first null terminator (2바이트 정렬된 0x0000 코드 유닛, 디코딩 전에 탐색)
+        find = self.data.find
+        null_pos = find(b'\x00\x00', start, stop)
+        while null_pos != -1 and (null_pos - start) & 1:
+            null_pos = find(b'\x00\x00', null_pos + 1, stop)
+        if null_pos == start or stop - start < 2:
+            return ""  # 첫 코드 유닛이 종료 문자
+        
+        decoded = self.data[start:stop if null_pos == -1 else null_pos].decode('utf-16-le', 'ignore')
+        
+        # Fast path: 출력 가능 ASCII만으로 구성된 경우 필터링 불필요
+        if decoded.isascii() and decoded.isprintable():
+            filtered = decoded
+        else:
+            # Enhanced filtering: 출력 가능 문자 중 0x0300 미만만 유지 (제어 문자 / 결합 분음 기호 / 상위 평면 제거)
+            filtered = _UNICODE_REJECT.sub('', decoded)
+        
+        if null_pos != -1:
+            self._unicode_memo[start & 1] = (start, null_pos, filtered)
+        return filtered.strip()
+    
+    def _filter_code_unit(self, offset: int) -> str:
+        """코드 유닛 1개의 필터링 결과 (허용 문자면 그 문자, 아니면 빈 문자열)"""
+        char = chr(self.data[offset] | (self.data[offset + 1] << 8))
+        return char if char in _UNICODE_ALLOWED_SET else ''
     
     def filetime_to_datetime(self, filetime: int):
         """Windows FILETIME을 datetime으로 변환"""
@@ -174,41 +434,672 @@ class RegistryParser:
     def extract_strings(self, min_length: int = 4, max_strings: int = 100) -> List[str]:
         """문자열 추출"""
         strings = []
-        current = ""
         max_size = min(self.size, 500 * 1024)  # 최대 500KB만 스캔
         
         # ASCII 문자열
-        for i in range(max_size):
-            byte = self.data[i]
-            if 32 <= byte <= 126:  # 출력 가능한 ASCII
-                current += chr(byte)
-            else:
-                if len(current) >= min_length:
-                    strings.append(current)
-                    if len(strings) >= max_strings:
-                        break
-                current = ""
+        if min_length >= STRING_MIN_LENGTH:
+            runs = (s for _, s in self.string_table().iter_strings(min_length, end=max_size))
+        else:
+            pattern = re.compile(rb'[\x20-\x7e]{%d,}' % max(min_length, 1))
+            runs = (m.group().decode('ascii') for m in pattern.finditer(self.data, 0, max_size)
+                    if m.end() < max_size)
+        for string in runs:
+            strings.append(string)
+            if len(strings) >= max_strings:
+                break
         
         # 중복 제거 및 필터링
         unique_strings = list(set(strings))
         filtered = [s for s in unique_strings if min_length <= len(s) < 100]
         return filtered[:max_strings]
     
-    def search_pattern(self, pattern: str) -> List[int]:
-        """패턴 검색"""
-        offsets = []
-        pattern_bytes = pattern.encode('ascii', errors='ignore')
-        offset = 0
+    def string_table(self) -> StringTable:
+        """출력 가능 ASCII / UTF-16 문자열 런 테이블 (최초 호출 시 한 번 생성)"""
+        if self._string_table is None:
+            self._string_table = StringTable(self.data)
+        return self._string_table
+    
+    def path_boundaries(self) -> PathBoundaryFinder:
+        """드라이브 문자 경로 시작 후보 탐색기 (최초 호출 시 한 번 생성)"""
+        if self._path_boundaries is None:
+            self._path_boundaries = PathBoundaryFinder(self.data)
+        return self._path_boundaries
+    
+    def candidate_extractor(self) -> CandidateExtractor:
+        """SHA1 / FileId / 키워드 후보 추출기 (최초 호출 시 한 번 생성)"""
+        if self._candidate_extractor is None:
+            self._candidate_extractor = CandidateExtractor(self.data, _UNICODE_ALLOWED)
+        return self._candidate_extractor
+    
+    def register_patterns(self, patterns: Iterable[Union[str, bytes]]):
+        """검색 패턴 사전 등록 (첫 search_pattern / search_pattern_encoded 호출 시 한 번의 순회로 모두 스캔)"""
+        self._scanner.register(*patterns)
+    
+    def scan_patterns(self):
+        """등록된 패턴 중 아직 스캔하지 않은 패턴을 단일 패스로 검색"""
+        pending = [p for p in self._scanner.patterns if p not in self._scanned_patterns]
+        if not pending:
+            return
+        self._scanned_patterns.update(pending)
+        for pattern_bytes, offsets in self._scan(PatternScanner(pending)).items():
+            self._store_pattern_offsets(pattern_bytes, offsets)
+    
+    def _scan(self, scanner: PatternScanner) -> Dict[bytes, List[int]]:
+        """하이브 전체 스캔 - 큰 하이브는 hbin 경계 청크로 나눠 병렬 스캔 (결과 동일)"""
+        if self.scan_workers > 1 and self.size >= PARALLEL_SCAN_MIN_SIZE:
+            chunks = plan_chunks(self.size, [hbin['offset'] for hbin in self.iter_hbins()], self.scan_workers)
+            if len(chunks) > 1:
+                source, shm = self.share()
+                try:
+                    tables = scan_parallel(source, scanner, chunks, self.scan_workers)
+                finally:
+                    if shm is not None:
+                        shm.close()
+                        shm.unlink()
+                if tables is not None:
+                    return tables
+        return scanner.scan(self.data)
+    
+    def search_pattern(self, pattern: Union[str, bytes]) -> List[int]:
+        """패턴 검색 (오프셋 인덱스 캐시 사용, str은 ASCII로 인코딩)
         
-        while offset < self.size:
-            pos = self.data.find(pattern_bytes, offset)
-            if pos == -1:
-                break
-            offsets.append(pos)
-            offset = pos + 1
+        조회 순서: 캐시 → 등록 패턴 단일 패스 스캔 → 캐시된 접두사 패턴 필터링 → 전체 검색
+        """
+        pattern_bytes = PatternScanner.to_bytes(pattern)
+        stats = self._pattern_stats
+        
+        cached = self._pattern_index.get(pattern_bytes)
+        if cached is not None:
+            stats['hits'] += 1
+            self._pattern_index.move_to_end(pattern_bytes)
+            return cached.tolist()
         
+        if pattern_bytes in self._scanner.patterns and pattern_bytes not in self._scanned_patterns:
+            stats['misses'] += 1
+            self.scan_patterns()
+            cached = self._pattern_index.get(pattern_bytes)
+            if cached is not None:
+                return cached.tolist()
+        
+        offsets = self._derive_from_prefix(pattern_bytes)
+        if offsets is not None:
+            stats['prefix_hits'] += 1
+        else:
+            stats['misses'] += 1
+            offsets = []
+            offset = 0
+            
+            while offset < self.size:
+                pos = self.data.find(pattern_bytes, offset)
+                if pos == -1:
+                    break
+                offsets.append(pos)
+                offset = pos + 1
+        
+        self._store_pattern_offsets(pattern_bytes, offsets)
         return offsets
     
+    def search_pattern_encoded(self, pattern: str, ignore_case: bool = False,
+                               encodings: Tuple[str, ...] = SEARCH_ENCODINGS) -> List[Tuple[int, str]]:
+        """ASCII / UTF-16 LE 인코딩을 한 번의 순회로 함께 검색
+        
+        Returns:
+            [(오프셋, 인코딩)] 오프셋 순 정렬 (예: [(4220, 'utf-16-le'), (5120, 'ascii')])
+        """
+        needles = {}
+        for encoding in encodings:
+            needle = pattern.encode(encoding, errors='ignore')
+            if needle:
+                needles[encoding] = needle
+        if not needles:
+            return []
+        
+        if ignore_case:
+            # 대소문자 무시 결과는 캐시하지 않음 (인덱스 키는 대소문자 구분)
+            self._pattern_stats['misses'] += 1
+            tables = self._scan(PatternScanner(needles.values(), ignore_case=True))
+            found = {encoding: tables[needle.lower()] for encoding, needle in needles.items()}
+        else:
+            if any(n in self._scanner.patterns and n not in self._scanned_patterns for n in needles.values()):
+                self.scan_patterns()  # 등록된 인코딩은 다른 패턴과 같은 순회에서 검색
+            missing = [n for n in needles.values() if n not in self._pattern_index]
+            if missing:
+                self._pattern_stats['misses'] += 1
+                for needle, offsets in self._scan(PatternScanner(missing)).items():
+                    self._store_pattern_offsets(needle, offsets)
+            else:
+                self._pattern_stats['hits'] += 1
+            found = {}
+            for encoding, needle in needles.items():
+                cached = self._pattern_index.get(needle)
+                found[encoding] = cached if cached is not None else self.search_pattern(needle)
+        
+        results = [(offset, encoding) for encoding, offsets in found.items() for offset in offsets]
+        results.sort()
+        return results
+    
+    def _derive_from_prefix(self, pattern_bytes: bytes) -> Optional[List[int]]:
+        """캐시된 접두사 패턴의 오프셋을 걸러 결과 생성 (예: 'Run' → 'RunOnce')"""
+        best = None
+        for cached_pattern in self._pattern_index:
+            if len(cached_pattern) < len(pattern_bytes) and pattern_bytes.startswith(cached_pattern):
+                if best is None or len(cached_pattern) > len(best):
+                    best = cached_pattern
+        if best is None:
+            return None
+        
+        candidates = self._pattern_index[best]
+        # 후보가 너무 많으면 직접 검색이 더 빠름
+        if len(candidates) * PREFIX_FILTER_COST > self.size:
+            return None
+        
+        self._pattern_index.move_to_end(best)
+        view = self.view
+        length = len(pattern_bytes)
+        return [offset for offset in candidates if view[offset:offset+length] == pattern_bytes]
+    
+    def _store_pattern_offsets(self, pattern_bytes: bytes, offsets: List[int]):
+        """오프셋 인덱스에 저장 (전체 오프셋 수 기준 LRU 제한)"""
+        if len(offsets) > self.pattern_index_limit:
+            return
+        old = self._pattern_index.pop(pattern_bytes, None)
+        if old is not None:
+            self._pattern_index_size -= len(old)
+        
+        self._pattern_index[pattern_bytes] = array('Q', offsets)
+        self._pattern_index_size += len(offsets)
+        
+        while self._pattern_index_size > self.pattern_index_limit:
+            _, evicted = self._pattern_index.popitem(last=False)
+            self._pattern_index_size -= len(evicted)
+            self._pattern_stats['evictions'] += 1
+    
+    def pattern_index_snapshot(self) -> Dict[bytes, array]:
+        """오프셋 인덱스 사본 (다른 프로세스의 파서에 넘겨 같은 스캔을 반복하지 않도록)"""
+        return dict(self._pattern_index)
+    
+    def load_pattern_index(self, index: Dict[bytes, array]):
+        """pattern_index_snapshot() 결과를 가져와 스캔된 패턴으로 표시"""
+        for pattern_bytes, offsets in index.items():
+            self._store_pattern_offsets(pattern_bytes, offsets)
+            self._scanned_patterns.add(pattern_bytes)
+    
+    def pattern_cache_info(self) -> Dict:
+        """오프셋 인덱스 캐시 통계"""
+        return dict(self._pattern_stats,
+                    patterns=len(self._pattern_index),
+                    offsets=self._pattern_index_size,
+                    limit=self.pattern_index_limit)
+    
+    def clear_pattern_cache(self):
+        """오프셋 인덱스 캐시 초기화"""
+        self._pattern_index.clear()
+        self._pattern_index_size = 0
+        self._scanned_patterns.clear()
+        for key in self._pattern_stats:
+            self._pattern_stats[key] = 0
+    
+    def filetime_index(self, min_year: int, max_year: int) -> FiletimeIndex:
+        """연도 범위 FILETIME 후보 인덱스 (범위별 캐시)"""
+        key = ('years', min_year, max_year)
+        if key not in self._filetime_indexes:
+            self._filetime_indexes[key] = FiletimeIndex.for_years(self.data, min_year, max_year)
+        return self._filetime_indexes[key]
+    
+    def filetime_range_index(self, lo: int, hi: int) -> FiletimeIndex:
+        """FILETIME 원시 값 범위 [lo, hi] 후보 인덱스 (범위별 캐시)"""
+        key = ('range', lo, hi)
+        if key not in self._filetime_indexes:
+            self._filetime_indexes[key] = FiletimeIndex(self.data, lo, hi)
+        return self._filetime_indexes[key]
+    
     def read_ascii_string(self, offset: int, length: int) -> str:
         """ASCII 문자열 읽기 (별칭)"""
         return self.read_string(offset, length)
+    
+    # ===== 셀 레벨 파서 (regf / hbin / nk / vk / lf / lh / li / ri / sk / db) =====
+    
+    def parse_base_block(self) -> Optional[Dict]:
+        """regf 베이스 블록 파싱 (결과 캐시)"""
+        if self._base_block is not None:
+            return self._base_block
+        if not self.validate_hive() or self.size < BASE_BLOCK_SIZE:
+            return None
+        
+        (primary_seq, secondary_seq, last_written, major, minor, file_type,
+         file_format, root_cell, hbins_size, clustering) = struct.unpack_from('<IIQIIIIIII', self.data, 4)
+        
+        # 체크섬: 처음 508바이트의 DWORD XOR
+        checksum = 0
+        for (dword,) in struct.iter_unpack('<I', self.view[0:508]):
+            checksum ^= dword
+        if checksum == 0xFFFFFFFF:
+            checksum = 0xFFFFFFFE
+        elif checksum == 0:
+            checksum = 1
+        
+        self._base_block = {
+            'primary_seq': primary_seq,
+            'secondary_seq': secondary_seq,
+            'last_written': last_written,
+            'major_version': major,
+            'minor_version': minor,
+            'file_type': file_type,
+            'file_format': file_format,
+            'root_cell_offset': root_cell,
+            'hive_bins_size': hbins_size,
+            'clustering_factor': clustering,
+            'file_name': self.read_unicode_string(0x30, 64),
+            'checksum': self.read_dword(508),
+            'checksum_valid': checksum == self.read_dword(508),
+            'dirty': primary_seq != secondary_seq,
+        }
+        return self._base_block
+    
+    def iter_hbins(self) -> Iterator[Dict]:
+        """hbin 블록 순회"""
+        offset = BASE_BLOCK_SIZE
+        while offset + HBIN_HEADER_SIZE <= self.size:
+            if self.data[offset:offset+4] != b'hbin':
+                break
+            size = self.read_dword(offset + 8)
+            if size < HBIN_HEADER_SIZE or size % 0x1000:
+                break
+            yield {
+                'offset': offset,
+                'relative_offset': self.read_dword(offset + 4),
+                'size': size,
+                'timestamp': self.read_qword(offset + 20),
+            }
+            offset += size
+    
+    def iter_cells(self) -> Iterator[Dict]:
+        """모든 hbin의 셀 순회 (할당/해제 셀 포함)"""
+        for hbin in self.iter_hbins():
+            offset = hbin['offset'] + HBIN_HEADER_SIZE
+            end = hbin['offset'] + hbin['size']
+            while offset + 4 <= end:
+                size = struct.unpack_from('<i', self.data, offset)[0]
+                length = abs(size)
+                if length < 8 or offset + length > end:
+                    break
+                yield {
+                    'offset': offset - BASE_BLOCK_SIZE,
+                    'size': length,
+                    'allocated': size < 0,
+                    'signature': bytes(self.view[offset+4:offset+6]),
+                }
+                offset += length
+    
+    def read_cell(self, cell_offset: int) -> Optional[memoryview]:
+        """셀 데이터 읽기 (hbin 기준 상대 오프셋, 크기 필드 제외, 복사 없음)"""
+        if cell_offset == INVALID_OFFSET:
+            return None
+        offset = BASE_BLOCK_SIZE + cell_offset
+        if offset < BASE_BLOCK_SIZE or offset + 4 > self.size:
+            return None
+        size = abs(struct.unpack_from('<i', self.data, offset)[0])
+        if size < 4 or offset + size > self.size:
+            return None
+        return self.view[offset+4:offset+size]
+    
+    def root_key(self) -> Optional['RegistryKey']:
+        """루트 키 (최초 접근 시 생성)"""
+        if self._root_key is None:
+            base = self.parse_base_block()
+            if not base:
+                return None
+            cell = self.read_cell(base['root_cell_offset'])
+            if not cell or cell[0:2] != b'nk':
+                return None
+            self._root_key = RegistryKey(self, base['root_cell_offset'])
+        return self._root_key
+    
+    def open_key(self, path: str) -> Optional['RegistryKey']:
+        """키 경로로 바로 이동 (예: 'ControlSet001\\Services')
+        
+        루트 키 이름과 'HKLM\\SYSTEM' 같은 접두어는 무시하며,
+        CurrentControlSet은 Select\\Current 값으로 해석한다.
+        """
+        root = self.root_key()
+        if root is None:
+            return None
+        
+        parts = [p for p in path.replace('/', '\\').split('\\') if p]
+        if parts and parts[0].upper() in ('HKLM', 'HKEY_LOCAL_MACHINE', 'HKCU', 'HKEY_CURRENT_USER', 'HKU', 'HKEY_USERS'):
+            parts = parts[1:]
+            if parts and root.subkey(parts[0]) is None:
+                parts = parts[1:]  # 하이브 이름 (SYSTEM, SOFTWARE 등)
+        if parts and parts[0].lower() == root.name.lower():
+            parts = parts[1:]
+        
+        key = root
+        for i, part in enumerate(parts):
+            if i == 0 and part.lower() == 'currentcontrolset':
+                part = self._current_control_set() or part
+            key = key.subkey(part)
+            if key is None:
+                return None
+        return key
+    
+    def _current_control_set(self) -> Optional[str]:
+        """SYSTEM 하이브의 CurrentControlSet 실제 이름"""
+        select = self.root_key().subkey('Select')
+        if select is None:
+            return None
+        current = select.value('Current')
+        if current is None or not isinstance(current.data, int):
+            return None
+        return f'ControlSet{current.data:03d}'
+
+
+class RegistryValue:
+    """vk 셀 기반 레지스트리 값 (최초 접근 시 파싱)"""
+    
+    def __init__(self, parser: RegistryParser, cell_offset: int):
+        self.parser = parser
+        self.cell_offset = cell_offset
+        self._header = None
+        self._raw_data = None
+    
+    def _load(self) -> Dict:
+        if self._header is None:
+            cell = self.parser.read_cell(self.cell_offset)
+            if not cell or cell[0:2] != b'vk' or len(cell) < 0x14:
+                self._header = {'name': '', 'data_size': 0, 'data_offset': INVALID_OFFSET,
+                                'data_type': 0, 'flags': 0}
+            else:
+                name_len, data_size, data_offset, data_type, flags = struct.unpack_from('<HIIIH', cell, 2)
+                raw_name = bytes(cell[0x14:0x14+name_len])
+                if flags & VALUE_COMP_NAME:
+                    name = raw_name.decode('latin-1')
+                else:
+                    name = raw_name.decode('utf-16-le', errors='replace')
+                self._header = {'name': name, 'data_size': data_size, 'data_offset': data_offset,
+                                'data_type': data_type, 'flags': flags}
+        return self._header
+    
+    @property
+    def name(self) -> str:
+        """값 이름 ('' = 기본값)"""
+        return self._load()['name']
+    
+    @property
+    def data_type(self) -> int:
+        return self._load()['data_type']
+    
+    @property
+    def type_name(self) -> str:
+        return REG_TYPES.get(self.data_type, f'0x{self.data_type:X}')
+    
+    @property
+    def data_size(self) -> int:
+        return self._load()['data_size'] & 0x7FFFFFFF
+    
+    @property
+    def raw_data(self) -> bytes:
+        """값 데이터 원본 (resident / 일반 셀 / db 빅데이터 처리)"""
+        if self._raw_data is None:
+            header = self._load()
+            size = self.data_size
+            if header['data_size'] & 0x80000000:
+                # 4바이트 이하: data_offset 필드에 직접 저장
+                self._raw_data = struct.pack('<I', header['data_offset'])[:size]
+            else:
+                cell = self.parser.read_cell(header['data_offset'])
+                if cell is None:
+                    self._raw_data = b''
+                elif cell[0:2] == b'db' and size > BIG_DATA_SEGMENT_SIZE:
+                    self._raw_data = self._read_big_data(cell, size)
+                else:
+                    self._raw_data = bytes(cell[:size])
+        return self._raw_data
+    
+    def _read_big_data(self, cell: bytes, size: int) -> bytes:
+        """db 셀의 세그먼트 결합"""
+        count, list_offset = struct.unpack_from('<HI', cell, 2)
+        segment_list = self.parser.read_cell(list_offset)
+        if segment_list is None:
+            return b''
+        chunks = []
+        for i in range(min(count, len(segment_list) // 4)):
+            segment = self.parser.read_cell(struct.unpack_from('<I', segment_list, i * 4)[0])
+            if segment is None:
+                break
+            chunks.append(bytes(segment[:BIG_DATA_SEGMENT_SIZE]))
+        return b''.join(chunks)[:size]
+    
+    @property
+    def data(self):
+        """타입에 따라 해석된 값 데이터"""
+        raw = self.raw_data
+        data_type = self.data_type
+        try:
+            if data_type in (1, 2, 6):
+                text = raw.decode('utf-16-le', errors='ignore')
+                null_pos = text.find('\x00')
+                return text[:null_pos] if null_pos != -1 else text
+            if data_type == 7:
+                return [s for s in raw.decode('utf-16-le', errors='ignore').split('\x00') if s]
+            if data_type == 4 and len(raw) >= 4:
+                return struct.unpack_from('<I', raw)[0]
+            if data_type == 5 and len(raw) >= 4:
+                return struct.unpack_from('>I', raw)[0]
+            if data_type == 11 and len(raw) >= 8:
+                return struct.unpack_from('<Q', raw)[0]
+        except Exception:
+            pass
+        return raw
+    
+    def __repr__(self):
+        return f"RegistryValue({self.name!r}, {self.type_name})"
+
+
+class RegistryKey:
+    """nk 셀 기반 레지스트리 키 (하위 키/값은 최초 접근 시 생성)"""
+    
+    def __init__(self, parser: RegistryParser, cell_offset: int, parent: 'RegistryKey' = None):
+        self.parser = parser
+        self.cell_offset = cell_offset
+        self.parent = parent
+        self._header = None
+        self._subkeys = None
+        self._values = None
+    
+    def _load(self) -> Dict:
+        if self._header is None:
+            cell = self.parser.read_cell(self.cell_offset)
+            if not cell or cell[0:2] != b'nk' or len(cell) < 0x4C:
+                raise ValueError(f'Invalid nk cell at 0x{self.cell_offset:X}')
+            flags, last_written = struct.unpack_from('<HQ', cell, 2)
+            (subkey_count, _, subkey_list, _, value_count, value_list,
+             security, class_offset) = struct.unpack_from('<IIIIIIII', cell, 0x14)
+            name_len, class_len = struct.unpack_from('<HH', cell, 0x48)
+            raw_name = bytes(cell[0x4C:0x4C+name_len])
+            if flags & KEY_COMP_NAME:
+                name = raw_name.decode('latin-1')
+            else:
+                name = raw_name.decode('utf-16-le', errors='replace')
+            self._header = {
+                'flags': flags,
+                'name': name,
+                'last_written': last_written,
+                'subkey_count': subkey_count,
+                'subkey_list': subkey_list,
+                'value_count': value_count,
+                'value_list': value_list,
+                'security': security,
+                'class_offset': class_offset,
+                'class_length': class_len,
+            }
+        return self._header
+    
+    @property
+    def name(self) -> str:
+        return self._load()['name']
+    
+    @property
+    def path(self) -> str:
+        """루트 기준 전체 경로"""
+        parts = []
+        key = self
+        while key is not None and key.parent is not None:
+            parts.append(key.name)
+            key = key.parent
+        return '\\'.join(reversed(parts))
+    
+    @property
+    def is_root(self) -> bool:
+        return bool(self._load()['flags'] & KEY_HIVE_ENTRY)
+    
+    @property
+    def last_written_filetime(self) -> int:
+        return self._load()['last_written']
+    
+    @property
+    def last_written(self):
+        """마지막 수정 시간 (datetime)"""
+        return self.parser.filetime_to_datetime(self.last_written_filetime)
+    
+    @property
+    def subkey_count(self) -> int:
+        return self._load()['subkey_count']
+    
+    @property
+    def value_count(self) -> int:
+        return self._load()['value_count']
+    
+    @property
+    def class_name(self) -> str:
+        header = self._load()
+        cell = self.parser.read_cell(header['class_offset'])
+        if not cell:
+            return ''
+        return bytes(cell[:header['class_length']]).decode('utf-16-le', errors='ignore')
+    
+    @property
+    def security_descriptor(self) -> bytes:
+        """sk 셀의 보안 디스크립터"""
+        cell = self.parser.read_cell(self._load()['security'])
+        if not cell or cell[0:2] != b'sk' or len(cell) < 0x14:
+            return b''
+        size = struct.unpack_from('<I', cell, 0x10)[0]
+        return bytes(cell[0x14:0x14+size])
+    
+    def _iter_subkey_entries(self, list_offset: int, depth: int = 0) -> Iterator[tuple]:
+        """서브키 리스트 셀 순회: (nk 오프셋, 힌트 종류, 힌트 값)"""
+        cell = self.parser.read_cell(list_offset)
+        if not cell or len(cell) < 4 or depth > 4:
+            return
+        signature = bytes(cell[0:2])
+        count = struct.unpack_from('<H', cell, 2)[0]
+        if signature in (b'lf', b'lh'):
+            count = min(count, (len(cell) - 4) // 8)
+            for i in range(count):
+                offset = struct.unpack_from('<I', cell, 4 + i * 8)[0]
+                yield offset, signature, cell[8 + i*8:12 + i*8]
+        elif signature in (b'li', b'ri'):
+            count = min(count, (len(cell) - 4) // 4)
+            for i in range(count):
+                offset = struct.unpack_from('<I', cell, 4 + i * 4)[0]
+                if signature == b'ri':
+                    yield from self._iter_subkey_entries(offset, depth + 1)
+                else:
+                    yield offset, signature, None
+    
+    def iter_subkeys(self) -> Iterator['RegistryKey']:
+        """하위 키 순회 (캐시 사용)"""
+        if self._subkeys is not None:
+            yield from self._subkeys
+            return
+        subkeys = []
+        header = self._load()
+        if header['subkey_count']:
+            for offset, _, _ in self._iter_subkey_entries(header['subkey_list']):
+                cell = self.parser.read_cell(offset)
+                if cell and cell[0:2] == b'nk':
+                    key = RegistryKey(self.parser, offset, self)
+                    subkeys.append(key)
+                    yield key
+        self._subkeys = subkeys
+    
+    def subkeys(self) -> List['RegistryKey']:
+        return list(self.iter_subkeys())
+    
+    def subkey(self, name: str) -> Optional['RegistryKey']:
+        """이름으로 하위 키 찾기 (lh 해시 / lf 힌트로 후보만 생성)"""
+        if self._subkeys is not None:
+            for key in self._subkeys:
+                if key.name.lower() == name.lower():
+                    return key
+            return None
+        
+        header = self._load()
+        if not header['subkey_count']:
+            return None
+        target = name.lower()
+        name_hash = _lh_hash(name)
+        hint = name.encode('latin-1', errors='replace')[:4].lower()
+        for offset, kind, hint_bytes in self._iter_subkey_entries(header['subkey_list']):
+            if kind == b'lh' and struct.unpack('<I', hint_bytes)[0] != name_hash:
+                continue
+            if kind == b'lf' and bytes(hint_bytes).rstrip(b'\x00').lower() != hint:
+                continue
+            cell = self.parser.read_cell(offset)
+            if not cell or cell[0:2] != b'nk':
+                continue
+            key = RegistryKey(self.parser, offset, self)
+            if key.name.lower() == target:
+                return key
+        return None
+    
+    def find_key(self, path: str) -> Optional['RegistryKey']:
+        """상대 경로로 하위 키 찾기"""
+        key = self
+        for part in path.replace('/', '\\').split('\\'):
+            if part:
+                key = key.subkey(part)
+                if key is None:
+                    return None
+        return key
+    
+    def values(self) -> List[RegistryValue]:
+        """값 목록 (캐시 사용)"""
+        if self._values is None:
+            self._values = []
+            header = self._load()
+            if header['value_count']:
+                cell = self.parser.read_cell(header['value_list'])
+                if cell:
+                    count = min(header['value_count'], len(cell) // 4)
+                    for i in range(count):
+                        offset = struct.unpack_from('<I', cell, i * 4)[0]
+                        self._values.append(RegistryValue(self.parser, offset))
+        return self._values
+    
+    def value(self, name: str) -> Optional[RegistryValue]:
+        """이름으로 값 찾기 ('' = 기본값)"""
+        target = name.lower()
+        for value in self.values():
+            if value.name.lower() == target:
+                return value
+        return None
+    
+    def walk(self) -> Iterator['RegistryKey']:
+        """자신과 모든 하위 키 깊이 우선 순회"""
+        stack = [self]
+        while stack:
+            key = stack.pop()
+            yield key
+            stack.extend(reversed(key.subkeys()))
+    
+    def __repr__(self):
+        return f"RegistryKey({self.path or self.name!r})"
+
+
+def _lh_hash(name: str) -> int:
+    """lh 리스트 이름 해시"""
+    value = 0
+    for char in name.upper():
+        value = (value * 37 + ord(char)) & 0xFFFFFFFF
+    return value
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+String Table - 하이브 전체 출력 가능 문자열 런 테이블
+"""
+
+import re
+from array import array
+from bisect import bisect_right
+from typing import Iterator, List, Tuple
+
+
+ENCODING_ASCII = 'ascii'
+ENCODING_UTF16 = 'utf-16-le'
+
+STRING_MIN_LENGTH = 4  # 테이블에 기록하는 최소 문자 수
+
+
+class StringTable:
+    """출력 가능 ASCII / UTF-16 LE 문자열 런의 정렬된 (오프셋, 길이) 테이블
+
+    하이브를 한 번만 정규식으로 훑어 인코딩별로 런 위치를 배열에 보관한다.
+    같은 인코딩의 런은 서로 겹치지 않으므로 오프셋 배열에 대한 이분 탐색만으로
+    범위 질의를 처리할 수 있다. 길이는 바이트 단위이다.
+    """
+
+    _RUN_PATTERNS = {
+        ENCODING_ASCII: re.compile(rb'[\x20-\x7e]{%d,}' % STRING_MIN_LENGTH),
+        ENCODING_UTF16: re.compile(rb'(?:[\x20-\x7e]\x00){%d,}' % STRING_MIN_LENGTH),
+    }
+    _CHAR_SIZE = {ENCODING_ASCII: 1, ENCODING_UTF16: 2}
+
+    def __init__(self, data):
+        self.data = data
+        self.size = len(data)
+        self._offsets = {}
+        self._lengths = {}
+        for encoding, pattern in self._RUN_PATTERNS.items():
+            offsets = array('Q')
+            lengths = array('I')
+            for match in pattern.finditer(data):
+                offsets.append(match.start())
+                lengths.append(match.end() - match.start())
+            self._offsets[encoding] = offsets
+            self._lengths[encoding] = lengths
+
+    def __len__(self) -> int:
+        return sum(len(offsets) for offsets in self._offsets.values())
+
+    def runs(self, start: int = 0, end: int = None,
+             encoding: str = ENCODING_ASCII) -> Iterator[Tuple[int, int]]:
+        """[start, end) 구간과 겹치는 런의 (오프셋, 바이트 길이) (오프셋 순)"""
+        end = self.size if end is None else end
+        offsets = self._offsets[encoding]
+        lengths = self._lengths[encoding]
+
+        # start를 포함하는 런이 있으면 그 런부터
+        index = max(bisect_right(offsets, start) - 1, 0)
+        if index < len(offsets) and offsets[index] + lengths[index] <= start:
+            index += 1
+        while index < len(offsets) and offsets[index] < end:
+            yield offsets[index], lengths[index]
+            index += 1
+
+    def strings_in_range(self, start: int, end: int, min_length: int = STRING_MIN_LENGTH,
+                         encoding: str = ENCODING_ASCII) -> List[str]:
+        """[start, end) 구간 안에서 끝나는 문자열 목록
+
+        구간 시작에 걸친 런은 start부터 잘라서 쓰고, 구간 끝을 넘어가는 런은 제외한다.
+        (바이트 단위로 앞에서부터 훑으며 종료 바이트에서 문자열을 확정하는 방식과 동일)
+        """
+        char_size = self._CHAR_SIZE[encoding]
+        strings = []
+        for offset, length in self.runs(start, end, encoding):
+            run_end = offset + length
+            if run_end >= end:
+                break
+            if offset < start:
+                offset += -(-(start - offset) // char_size) * char_size
+            if (run_end - offset) // char_size >= min_length:
+                strings.append(self.data[offset:run_end].decode(encoding))
+        return strings
+
+    def iter_strings(self, min_length: int = STRING_MIN_LENGTH, end: int = None,
+                     encoding: str = ENCODING_ASCII) -> Iterator[Tuple[int, str]]:
+        """end 이전에 끝나는 min_length 이상 문자열의 (오프셋, 문자열)"""
+        end = self.size if end is None else end
+        char_size = self._CHAR_SIZE[encoding]
+        for offset, length in self.runs(0, end, encoding):
+            if offset + length >= end:
+                break
+            if length // char_size >= min_length:
+                yield offset, self.data[offset:offset + length].decode(encoding)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Analysis Worker - GUI 백그라운드 분석 작업 (워커 스레드 + 이벤트 큐)
+"""
+
+import itertools
+import queue
+import threading
+import traceback
+from typing import Any, Callable
+
+from analyzers.forensics_analyzer import AnalysisCancelled
+
+
+_job_ids = itertools.count(1)
+
+
+class AnalysisJob:
+    """
+    백그라운드 분석 작업 하나
+
+    target(job)은 워커 스레드에서 실행되며 Tk 위젯을 직접 건드리지 않고
+    job.log / job.progress로 이벤트를 보낸다. UI 스레드는 공유 큐를 root.after로
+    폴링해 (job_id, kind, payload) 이벤트를 처리한다.
+
+    kind: 'log' | 'warning' | 'progress' | 'done' | 'error' | 'cancelled'
+    """
+
+    def __init__(self, label: str, target: Callable[['AnalysisJob'], Any], events: queue.Queue):
+        self.id = next(_job_ids)
+        self.label = label
+        self.target = target
+        self.events = events
+        self._stop = threading.Event()
+        self.thread = threading.Thread(target=self._run, name=f"analysis-{self.id}", daemon=True)
+
+    def start(self):
+        """워커 스레드 시작"""
+        self.thread.start()
+
+    def post(self, kind: str, payload: Any = None):
+        """UI 스레드로 이벤트 전달"""
+        self.events.put((self.id, kind, payload))
+
+    def log(self, message: str):
+        """진행 로그 한 줄"""
+        self.post('log', message)
+
+    def warn(self, message: str):
+        """경고 (UI 스레드에서 메시지 박스로 표시, 작업은 계속)"""
+        self.post('warning', message)
+
+    def progress(self, done: int, total: int, message: str = ''):
+        """진행률 (분석 모듈 / 하이브 단위)"""
+        self.post('progress', (done, total, message))
+
+    def cancel(self):
+        """취소 요청 - 다음 확인 지점에서 AnalysisCancelled로 중단"""
+        self._stop.set()
+
+    def cancelled(self) -> bool:
+        """취소 요청 여부 (should_stop 콜백으로 사용)"""
+        return self._stop.is_set()
+
+    def check(self):
+        """단계 사이 취소 확인"""
+        if self._stop.is_set():
+            raise AnalysisCancelled()
+
+    def _run(self):
+        try:
+            result = self.target(self)
+            self.check()
+        except AnalysisCancelled:
+            self.post('cancelled')
+        except Exception as e:
+            traceback.print_exc()
+            self.post('error', str(e))
+        else:
+            self.post('done', result)
@@ -7,6 +7,7 @@ import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext, messagebox
 import json
 import os
+import queue
 import sys
 from datetime import datetime
 from typing import Dict, List, Any
@@ -19,6 +20,13 @@ from core.registry_parser import RegistryParser
 from analyzers.forensics_analyzer import ForensicsAnalyzer
 from analyzers.ai_analyzer import AIAnalyzer
 from analyzers.multi_hive_analyzer import MultiHiveAnalyzer
+from analyzers.collection import discover_hives, group_hives
+from analyzers.parallel import DEFAULT_WORKERS
+from gui.analysis_worker import AnalysisJob
+from gui.result_browser import ARTIFACT_LABELS, ResultBrowser, findings_rows, multi_hive_rows
+from utils.search_index import FindingIndex
+from utils.result_cache import ResultCache
+from utils.exporters import export_csv, export_json
 
 
 class RegistryForensicGUI:
@@ -62,10 +70,19 @@ class RegistryForensicGUI:
         self.api_key = tk.StringVar()
         self.hive_type = tk.StringVar(value='AUTO (Detect)')
         self.analysis_results = None
+        self.finding_index = None  # 표시 중인 결과의 검색 역색인
+        self.result_cache = ResultCache()  # 같은 증거를 다시 열면 저장된 분석 결과 사용
         self.selected_files = []  # 선택된 파일 목록 (다중 선택 가능)
         
+        # 백그라운드 분석 작업 (워커 스레드 -> events 큐 -> root.after 폴링)
+        self.events = queue.Queue()
+        self.jobs: Dict[int, Dict] = {}  # job_id -> {'job', 'status', 'done', 'total', 'on_done', 'error_title'}
+        
         # UI 구성
         self.create_widgets()
+        
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.root.after(100, self._poll_events)
     
     def setup_styles(self):
         """스타일 설정"""
@@ -137,6 +154,8 @@ class RegistryForensicGUI:
         
         ttk.Button(file_btn_frame, text="📂 파일 선택 (다중 가능)", 
                   command=self.select_files).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+        ttk.Button(file_btn_frame, text="📁 폴더에서 찾기",
+                  command=self.select_folder).pack(side=tk.LEFT, padx=(0, 5))
         
         # 접기/펼치기 토글 버튼
         self.file_list_visible = tk.BooleanVar(value=True)
@@ -177,6 +196,23 @@ class RegistryForensicGUI:
                              cursor='hand2', relief=tk.RAISED, bd=2)
         clear_btn.pack(fill=tk.X, pady=5)
         
+        # 진행 중인 작업 (여러 분석 동시 실행 가능)
+        jobs_frame = ttk.LabelFrame(parent, text="⏳ 작업", padding=10)
+        jobs_frame.pack(fill=tk.X, pady=5)
+        
+        self.jobs_list = tk.Listbox(jobs_frame, height=4, bg='#2a2a2a', fg='#e0e0e0',
+                                    selectbackground='#0066ff', font=('Segoe UI', 9),
+                                    selectmode=tk.EXTENDED)
+        self.jobs_list.pack(fill=tk.X)
+        
+        self.progress_bar = ttk.Progressbar(jobs_frame, mode='determinate', maximum=1)
+        self.progress_bar.pack(fill=tk.X, pady=5)
+        
+        self.cancel_btn = tk.Button(jobs_frame, text="⏹ 취소", command=self.cancel_jobs,
+                                    bg='#ff4444', fg='#ffffff', font=('Segoe UI', 9),
+                                    cursor='hand2', state=tk.DISABLED)
+        self.cancel_btn.pack(fill=tk.X)
+        
         # 내보내기 버튼
         export_frame = ttk.Frame(parent)
         export_frame.pack(fill=tk.X, pady=5)
@@ -251,15 +287,20 @@ class RegistryForensicGUI:
                  bg='#666666', fg='#ffffff', font=('Segoe UI', 9),
                  cursor='hand2').pack(side=tk.LEFT, padx=(10, 0))
         
+        # 보고서(요약 / AI 분석) 탭 + 아티팩트 / 타임라인 표 탭
+        self.results_tabs = ttk.Notebook(results_frame)
+        self.results_tabs.pack(fill=tk.BOTH, expand=True)
+        
         # 결과 텍스트 영역
-        self.results_text = scrolledtext.ScrolledText(results_frame, wrap=tk.WORD,
+        self.results_text = scrolledtext.ScrolledText(self.results_tabs, wrap=tk.WORD,
                                                        bg='#0a0a0a', fg='#00ff00',
                                                        font=('Consolas', 10),
                                                        insertbackground='#00ff00')
-        self.results_text.pack(fill=tk.BOTH, expand=True)
+        self.results_tabs.add(self.results_text, text="📋 보고서")
         
-        # 검색 하이라이트 태그 설정
-        self.results_text.tag_config("highlight", background="#ffff00", foreground="#000000")
+        # 항목 목록 (보이는 행만 렌더링, 정렬 / 필터)
+        self.result_browser = ResultBrowser(self.results_tabs)
+        self.results_tabs.add(self.result_browser, text="📑 아티팩트 / 타임라인")
         
         # 초기 메시지
         self.results_text.insert('1.0', """
@@ -306,6 +347,35 @@ Supported Analysis:
             self.selected_files = list(filenames)
             self.update_file_list_display()
     
+    def select_folder(self):
+        """수집 폴더 선택 - 'regf' 시그니처로 하이브를 찾아 파일 목록으로 사용 (워커 스레드)"""
+        folder = filedialog.askdirectory(title="트리아지 수집 폴더 선택")
+        if not folder:
+            return
+        
+        def run(job: AnalysisJob) -> List[Dict]:
+            job.log(f"📁 하이브 검색 중: {folder}")
+            records = discover_hives(folder, max_workers=DEFAULT_WORKERS,
+                                     on_hive_found=lambda record: job.log(
+                                         f"  ✓ {record['file_path']} ({record['hive_type']})"),
+                                     should_stop=job.cancelled)
+            groups, unassigned = group_hives(records)
+            for group in groups:
+                job.log(f"  🖥 {group['host']} / {group['user'] or '-'}: "
+                        + ", ".join(record['hive_type'] for record in group['hives']))
+            for record in unassigned:
+                job.log(f"  ⚠️  {os.path.basename(record['file_path'])}: {record['reason']}")
+            return records
+        
+        def on_done(records: List[Dict]):
+            if not records:
+                messagebox.showwarning("경고", "폴더에서 레지스트리 하이브를 찾지 못했습니다.")
+                return
+            self.selected_files = [record['file_path'] for record in records]
+            self.update_file_list_display()
+        
+        self.start_job(f"폴더 검색 ({os.path.basename(folder)})", run, on_done, "Folder scan failed")
+    
     def update_file_list_display(self):
         """선택된 파일 목록 표시 업데이트"""
         # 기존 위젯 제거
@@ -343,17 +413,13 @@ Supported Analysis:
         for i, filepath in enumerate(self.selected_files, 1):
             filename = os.path.basename(filepath)
             
-            # 하이브 타입 자동 감지
-            try:
-                with open(filepath, 'rb') as f:
-                    data = f.read(512)  # 헤더만 읽기
-                    parser = RegistryParser(data, filepath)
-                    hive_type = parser.detect_hive_type()
-            except:
-                hive_type = "Unknown"
+            # 하이브 타입 자동 감지 (베이스 블록 + 루트 키 셀만 읽음)
+            classification = RegistryParser.classify_file(filepath)
+            hive_type = classification['hive_type']
+            confidence = classification['confidence']
             
             file_label = ttk.Label(scrollable_frame, 
-                                  text=f"{i}. {filename} ({hive_type})",
+                                  text=f"{i}. {filename} ({hive_type}, {confidence:.0%})",
                                   foreground='#00ff00')
             file_label.pack(anchor=tk.W, pady=2)
         
@@ -407,16 +473,12 @@ Supported Analysis:
         for i, filepath in enumerate(self.selected_files):
             filename = os.path.basename(filepath)
             
-            # 하이브 타입 감지
-            try:
-                with open(filepath, 'rb') as f:
-                    data = f.read(512)
-                    parser = RegistryParser(data, filepath)
-                    hive_type = parser.detect_hive_type()
-            except:
-                hive_type = "Unknown"
+            # 하이브 타입 감지 (베이스 블록 + 루트 키 셀만 읽음)
+            classification = RegistryParser.classify_file(filepath)
+            hive_type = classification['hive_type']
+            confidence = classification['confidence']
             
-            listbox.insert(tk.END, f"{i+1}. {filename} ({hive_type})")
+            listbox.insert(tk.END, f"{i+1}. {filename} ({hive_type}, {confidence:.0%})")
         
         # 선택된 파일 변수
         selected_file = [None]
@@ -484,129 +546,108 @@ Supported Analysis:
         self.results_text.delete('1.0', tk.END)
         self.results_text.insert('1.0', "🔍 분석 진행 중...\n\n")
         self.results_text.config(state=tk.DISABLED)
-        self.root.update()
         
-        try:
+        # Tk 변수는 UI 스레드에서만 읽음
+        api_key = self.api_key.get()
+        api_provider = self.api_provider.get()
+        selected_type = self.hive_type.get()
+        file_name = os.path.basename(self.file_path.get())
+        
+        def run(job: AnalysisJob) -> Dict:
             # 파일 읽기
-            self.results_text.config(state=tk.NORMAL)
-            self.results_text.insert(tk.END, "📂 파일 읽는 중...\n")
-            self.results_text.config(state=tk.DISABLED)
-            self.root.update()
-            
-            # selected_file 사용
-            with open(selected_file, 'rb') as f:
-                data = f.read()
-            
-            # 파서 생성 (파일 경로 전달)
-            parser = RegistryParser(data, selected_file)
-            
-            self.results_text.config(state=tk.NORMAL)
-            self.results_text.insert(tk.END, f"📂 파일: {os.path.basename(selected_file)}\n")
-            self.results_text.config(state=tk.DISABLED)
-            self.root.update()
-            
-            if not parser.validate_hive():
-                messagebox.showwarning("경고", "유효한 레지스트리 하이브 파일이 아닐 수 있습니다 (missing 'regf' signature)")
-            
-            # 하이브 타입 자동 감지
-            detected_type = parser.detect_hive_type()
-            self.results_text.config(state=tk.NORMAL)
-            self.results_text.insert(tk.END, f"🔍 Detected hive type: {detected_type}\n")
-            self.results_text.config(state=tk.DISABLED)
-            self.root.update()
-            
-            # 사용자가 선택한 타입이 있으면 우선, 없으면 자동 감지 사용
-            selected_type = self.hive_type.get()
-            if selected_type == 'AUTO (Detect)' or not selected_type:
-                hive_type = detected_type
-            else:
-                hive_type = selected_type
+            job.log("📂 파일 읽는 중...")
             
-            # 포렌식 분석
-            self.results_text.config(state=tk.NORMAL)
-            self.results_text.insert(tk.END, f"🔬 Running forensic analysis on {hive_type} hive...\n")
-            self.results_text.config(state=tk.DISABLED)
-            self.root.update()
-            
-            analyzer = ForensicsAnalyzer(parser, hive_type)
-            
-            raw_findings = {
-                'shimcache': analyzer.analyze_shimcache(),
-                'amcache': analyzer.analyze_amcache(),
-                'userassist': analyzer.analyze_userassist(),
-                'bam_dam': analyzer.analyze_bam_dam(),
-                'usb_devices': analyzer.analyze_usb_devices(),
-                'recent_docs': analyzer.analyze_recent_docs(),
-                'run_keys': analyzer.analyze_run_keys(),
-                'sam_users': analyzer.analyze_sam_users(),
-                'network_profiles': analyzer.analyze_network_profiles(),
-                # v3.0 새로운 분석 모듈
-                'shellbags': analyzer.analyze_shellbags(),
-                'muicache': analyzer.analyze_muicache(),
-                'prefetch': analyzer.analyze_prefetch(),
-                'lnk_files': analyzer.analyze_lnk_files(),
-                'installed_software': analyzer.analyze_installed_software_detailed(),
-                'security_detailed': analyzer.analyze_security_detailed(),
-                # v3.1 추가 모듈 (5개)
-                'typed_paths': analyzer.analyze_typed_paths(),
-                'recent_apps': analyzer.analyze_recent_apps(),
-                'services_detailed': analyzer.analyze_services_detailed(),
-                'wlan_profiles': analyzer.analyze_wlan_profiles(),
-                'timezone': analyzer.analyze_timezone()
-            }
-            
-            # 문자열 추출 (개선: 50 → 1000개)
-            # 우선순위 기반: 아티팩트에서 추출한 데이터 우선
-            strings = parser.extract_strings(min_length=4, max_strings=1000)
-            
-            # AI 분석
-            self.results_text.config(state=tk.NORMAL)
-            self.results_text.insert(tk.END, "🤖 AI 분석 실행 중...\n")
-            self.results_text.config(state=tk.DISABLED)
-            self.root.update()
-            
-            if self.api_provider.get() == 'gemini':
-                ai_results = AIAnalyzer.analyze_with_gemini(
-                    self.api_key.get(),
-                    self.hive_type.get(),
-                    strings,
-                    raw_findings
-                )
-            else:
-                ai_results = AIAnalyzer.analyze_with_openai(
-                    self.api_key.get(),
-                    self.hive_type.get(),
-                    strings,
-                    raw_findings
-                )
-            
-            # 결과 저장
-            self.analysis_results = {
-                'file_name': os.path.basename(self.file_path.get()),
-                'file_size': len(data),
-                'hive_type': self.hive_type.get(),
-                'analysis_date': datetime.now().isoformat(),
-                'raw_findings': raw_findings,
-                'ai_analysis': ai_results
-            }
+            # selected_file 사용 (mmap으로 열기, 큰 하이브는 패턴 스캔을 hbin 청크로 병렬 처리)
+            parser = RegistryParser.open(selected_file)
+            try:
+                parser.scan_workers = DEFAULT_WORKERS
+                job.log(f"📂 파일: {os.path.basename(selected_file)}")
+                
+                if not parser.validate_hive():
+                    job.warn("유효한 레지스트리 하이브 파일이 아닐 수 있습니다 (missing 'regf' signature)")
+                
+                # 하이브 타입 자동 감지
+                detected_type = parser.detect_hive_type()
+                job.log(f"🔍 Detected hive type: {detected_type}")
+                
+                # 사용자가 선택한 타입이 있으면 우선, 없으면 자동 감지 사용
+                if selected_type == 'AUTO (Detect)' or not selected_type:
+                    hive_type = detected_type
+                else:
+                    hive_type = selected_type
+                
+                # 포렌식 분석
+                job.check()
+                job.log(f"🔬 Running forensic analysis on {hive_type} hive...")
+                
+                analyzer = ForensicsAnalyzer(parser, hive_type, self.result_cache)
+                total = len(analyzer.scheduled)
+                done = []
+                job.progress(0, total)
+                
+                def on_analyzer_done(name, count):
+                    done.append(name)
+                    job.progress(len(done), total, f"{name}: {count}")
+                
+                # 매니페스트 기준으로 적용되는 분석 모듈만 실행 (프로세스 병렬)
+                raw_findings = analyzer.run_analyzers(max_workers=DEFAULT_WORKERS,
+                                                      on_analyzer_done=on_analyzer_done,
+                                                      should_stop=job.cancelled)
+                
+                # 문자열 추출 (개선: 50 → 1000개)
+                # 우선순위 기반: 아티팩트에서 추출한 데이터 우선
+                job.check()
+                strings = parser.extract_strings(min_length=4, max_strings=1000)
+                
+                # AI 분석
+                job.check()
+                job.log("🤖 AI 분석 실행 중...")
+                
+                if api_provider == 'gemini':
+                    ai_results = AIAnalyzer.analyze_with_gemini(
+                        api_key,
+                        selected_type,
+                        strings,
+                        raw_findings
+                    )
+                else:
+                    ai_results = AIAnalyzer.analyze_with_openai(
+                        api_key,
+                        selected_type,
+                        strings,
+                        raw_findings
+                    )
+                
+                results = {
+                    'file_name': file_name,
+                    'file_size': parser.size,
+                    'hive_type': selected_type,
+                    'analysis_date': datetime.now().isoformat(),
+                    'raw_findings': raw_findings,
+                    'skipped_analyzers': analyzer.skipped,
+                    'ai_analysis': ai_results
+                }
+            finally:
+                parser.close()
             
-            # 결과 표시
-            self.display_results(self.analysis_results)
+            # 검색 역색인도 워커에서 생성
+            return {'results': results, 'index': FindingIndex(findings_rows(raw_findings, hive_type))}
+        
+        def on_done(result: Dict):
+            # 결과 저장 / 표시
+            self.analysis_results = result['results']
+            self.display_results(self.analysis_results, result['index'])
             
             # 내보내기 버튼 활성화
             self.export_json_btn.config(state=tk.NORMAL)
             self.export_csv_btn.config(state=tk.NORMAL)
             
             messagebox.showinfo("Success", "Analysis completed successfully!")
-            
-        except Exception as e:
-            self.results_text.config(state=tk.NORMAL)
-            self.results_text.insert(tk.END, f"\n❌ Error: {str(e)}\n")
-            self.results_text.config(state=tk.DISABLED)
-            messagebox.showerror("Error", f"Analysis failed: {str(e)}")
+        
+        self.start_job(os.path.basename(selected_file), run, on_done, "Analysis failed")
     
-    def display_results(self, results):
-        """결과 표시"""
+    def display_results(self, results, index: FindingIndex = None):
+        """결과 표시 (index: 결과 행 검색 역색인, 없으면 여기서 생성)"""
         self.results_text.config(state=tk.NORMAL)
         self.results_text.delete('1.0', tk.END)
         
@@ -628,227 +669,19 @@ Supported Analysis:
         
         raw = results['raw_findings']
         
-        # ShimCache
-        if raw['shimcache']:
-            self.results_text.insert(tk.END, f"🚀 ShimCache (Executed Programs): {len(raw['shimcache'])} items\n")
-            for i, item in enumerate(raw['shimcache'], 1):
-                ts_info = f" [{item.get('timestamp', 'N/A')}]" if item.get('timestamp') else ""
-                size_info = f" ({item.get('fileSize', 0):,} bytes)" if item.get('fileSize') else ""
-                self.results_text.insert(tk.END, f"   {i}. {item['path']}{ts_info}{size_info}\n")
-            self.results_text.insert(tk.END, "\n")
-        
-        # Amcache
-        if raw['amcache']:
-            self.results_text.insert(tk.END, f"📦 Amcache (Program Information): {len(raw['amcache'])} items\n")
-            for i, item in enumerate(raw['amcache'], 1):
-                sha1_info = f" [SHA1:{item.get('sha1', 'N/A')[:16]}...]" if item.get('sha1') else ""
-                pub_info = f" ({item.get('publisher', 'Unknown')})" if item.get('publisher') else ""
-                ver_info = f" v{item.get('version')}" if item.get('version') else ""
-                size_info = f" [{item.get('fileSize', 0):,} bytes]" if item.get('fileSize') else ""
-                ts_info = f" [{item.get('timestamp', 'N/A')}]" if item.get('timestamp') else ""
-                self.results_text.insert(tk.END, f"   {i}. {item['programName']}{pub_info}{ver_info}{ts_info}\n")
-                if sha1_info or size_info:
-                    self.results_text.insert(tk.END, f"       {sha1_info}{size_info}\n")
-            self.results_text.insert(tk.END, "\n")
-        
-        # UserAssist
-        if raw['userassist']:
-            self.results_text.insert(tk.END, f"👤 UserAssist (User Activity): {len(raw['userassist'])} items\n")
-            for i, item in enumerate(raw['userassist'], 1):
-                run_info = f" [Runs: {item.get('runCount')}]" if item.get('runCount') else ""
-                focus_ms = item.get('focusTime')
-                focus_info = ""
-                if focus_ms:
-                    focus_sec = focus_ms / 1000
-                    if focus_sec < 60:
-                        focus_info = f" [Focus: {focus_sec:.1f}s]"
-                    else:
-                        focus_min = focus_sec / 60
-                        focus_info = f" [Focus: {focus_min:.1f}m]"
-                ts_info = f" [{item.get('lastExecuted', 'N/A')}]" if item.get('lastExecuted') else ""
-                self.results_text.insert(tk.END, f"   {i}. {item['program']}{run_info}{focus_info}{ts_info}\n")
-            self.results_text.insert(tk.END, "\n")
-        
-        # BAM/DAM
-        if raw['bam_dam']:
-            self.results_text.insert(tk.END, f"⚡ BAM/DAM (Background Activity): {len(raw['bam_dam'])} items\n")
-            for i, item in enumerate(raw['bam_dam'], 1):
-                ts = f" [{item['timestamp']}]" if item.get('timestamp') else ""
-                sid_info = f" [User: {item['userSID'][-8:]}...]" if item.get('userSID') else ""
-                self.results_text.insert(tk.END, f"   {i}. {item['path']}{ts}{sid_info}\n")
-            self.results_text.insert(tk.END, "\n")
-        
-        # USB Devices
-        if raw['usb_devices']:
-            self.results_text.insert(tk.END, f"💾 USB Devices: {len(raw['usb_devices'])} items\n")
-            for i, item in enumerate(raw['usb_devices'], 1):
-                vid_pid = f" (VID:{item.get('vid', 'N/A')} PID:{item.get('pid', 'N/A')})" if item.get('vid') else ""
-                ts_info = f" [{item.get('timestamp', 'N/A')}]" if item.get('timestamp') else ""
-                serial_info = f" [S/N: {item.get('serialNumber', 'N/A')}]" if item.get('serialNumber') else ""
-                self.results_text.insert(tk.END, f"   {i}. {item['device']}{vid_pid}{ts_info}{serial_info}\n")
-            self.results_text.insert(tk.END, "\n")
-        
-        # Recent Documents
-        if raw['recent_docs']:
-            self.results_text.insert(tk.END, f"📄 Recent Documents: {len(raw['recent_docs'])} items\n")
-            for i, item in enumerate(raw['recent_docs'], 1):
-                ts_info = f" [{item.get('timestamp', 'N/A')}]" if item.get('timestamp') else ""
-                path_info = f" ({item.get('path', '')}" if item.get('path') else ""
-                self.results_text.insert(tk.END, f"   {i}. {item['document']}{ts_info}{path_info}\n")
-            self.results_text.insert(tk.END, "\n")
-        
-        # Run Keys
-        if raw['run_keys']:
-            self.results_text.insert(tk.END, f"🔑 Auto-Start Programs: {len(raw['run_keys'])} items\n")
-            for i, item in enumerate(raw['run_keys'], 1):
-                self.results_text.insert(tk.END, f"   {i}. {item['name']}: {item['command'][:80]}\n")
-            self.results_text.insert(tk.END, "\n")
-        
-        # SAM Users
-        if raw['sam_users']:
-            self.results_text.insert(tk.END, f"👥 User Accounts: {len(raw['sam_users'])} items\n")
-            for i, item in enumerate(raw['sam_users'], 1):
-                last_login = f" [Last Login: {item.get('lastLogin', 'N/A')}]" if item.get('lastLogin') else ""
-                created = f" [Created: {item.get('created', 'N/A')}]" if item.get('created') else ""
-                self.results_text.insert(tk.END, f"   {i}. {item['username']} (SID: {item['sid']}){last_login}{created}\n")
-            self.results_text.insert(tk.END, "\n")
-        
-        # Network Profiles
-        if raw['network_profiles']:
-            self.results_text.insert(tk.END, f"🌐 Network Profiles: {len(raw['network_profiles'])} items\n")
-            for i, item in enumerate(raw['network_profiles'], 1):
-                ts_info = f" [{item.get('timestamp', 'N/A')}]" if item.get('timestamp') else ""
-                type_info = f" ({item.get('type', 'Unknown')})" if item.get('type') else ""
-                self.results_text.insert(tk.END, f"   {i}. {item['network']}{type_info}{ts_info}\n")
-            self.results_text.insert(tk.END, "\n")
+        # 항목은 아티팩트 탭의 가상화 목록에 표시 (보고서에는 개수만)
+        for key, items in raw.items():
+            if items:
+                self.results_text.insert(tk.END, f"{ARTIFACT_LABELS.get(key, key)}: {len(items)} items\n")
+        self.results_text.insert(tk.END, "\n📑 항목 상세는 '아티팩트 / 타임라인' 탭에서 정렬 / 필터할 수 있습니다.\n\n")
+        if index is None:
+            index = FindingIndex(findings_rows(raw, results['hive_type']))
+        self.finding_index = index
+        self.result_browser.set_rows(index.rows, index)
         
-        # ShellBags (v3.0)
-        if raw.get('shellbags'):
-            self.results_text.insert(tk.END, f"📁 ShellBags (Folder Access History): {len(raw['shellbags'])} items\n")
-            for i, item in enumerate(raw['shellbags'], 1):
-                ts_info = f" [{item.get('timestamp', 'N/A')}]" if item.get('timestamp') else ""
-                type_info = f" [{item.get('type', 'folder')}]" if item.get('type') else ""
-                self.results_text.insert(tk.END, f"   {i}. {item['path']}{type_info}{ts_info}\n")
-            self.results_text.insert(tk.END, "\n")
-        
-        # MuiCache (v3.0)
-        if raw.get('muicache'):
-            self.results_text.insert(tk.END, f"🎨 MuiCache (Application UI Cache): {len(raw['muicache'])} items\n")
-            for i, item in enumerate(raw['muicache'], 1):
-                app_info = f" ({item.get('appName')})" if item.get('appName') else ""
-                ts_info = f" [{item.get('timestamp', 'N/A')}]" if item.get('timestamp') else ""
-                self.results_text.insert(tk.END, f"   {i}. {item['path']}{app_info}{ts_info}\n")
-            self.results_text.insert(tk.END, "\n")
-        
-        # Prefetch (v3.0)
-        if raw.get('prefetch'):
-            self.results_text.insert(tk.END, f"⚡ Prefetch (Program Execution Cache): {len(raw['prefetch'])} items\n")
-            for i, item in enumerate(raw['prefetch'], 1):
-                run_info = f" [Runs: {item.get('runCount')}]" if item.get('runCount') else ""
-                ts_info = f" [{item.get('timestamp', 'N/A')}]" if item.get('timestamp') else ""
-                self.results_text.insert(tk.END, f"   {i}. {item['program']}{run_info}{ts_info}\n")
-            self.results_text.insert(tk.END, "\n")
-        
-        # LNK Files (v3.0)
-        if raw.get('lnk_files'):
-            self.results_text.insert(tk.END, f"🔗 LNK Files (Shortcuts): {len(raw['lnk_files'])} items\n")
-            for i, item in enumerate(raw['lnk_files'], 1):
-                target_info = f" → {item.get('targetPath', 'N/A')}" if item.get('targetPath') else ""
-                ts_info = f" [{item.get('timestamp', 'N/A')}]" if item.get('timestamp') else ""
-                self.results_text.insert(tk.END, f"   {i}. {item['lnkPath']}{target_info}{ts_info}\n")
-            self.results_text.insert(tk.END, "\n")
-        
-        # Installed Software Detailed (v3.0)
-        if raw.get('installed_software'):
-            self.results_text.insert(tk.END, f"💿 Installed Software (Detailed): {len(raw['installed_software'])} items\n")
-            for i, item in enumerate(raw['installed_software'], 1):
-                pub_info = f" by {item.get('publisher')}" if item.get('publisher') else ""
-                ver_info = f" v{item.get('version')}" if item.get('version') else ""
-                date_info = f" [Installed: {item.get('installDate')}]" if item.get('installDate') else ""
-                self.results_text.insert(tk.END, f"   {i}. {item['displayName']}{pub_info}{ver_info}{date_info}\n")
-                if item.get('installLocation'):
-                    self.results_text.insert(tk.END, f"       Location: {item.get('installLocation')}\n")
-            self.results_text.insert(tk.END, "\n")
-        
-        # Security Detailed (v3.0)
-        if raw.get('security_detailed'):
-            self.results_text.insert(tk.END, f"🔐 Security Policies & SIDs: {len(raw['security_detailed'])} items\n")
-            for i, item in enumerate(raw['security_detailed'], 1):
-                if item.get('type') == 'SecurityPolicy':
-                    val_info = f" = {item.get('value')}" if item.get('value') is not None else ""
-                    self.results_text.insert(tk.END, f"   {i}. [{item.get('policyKey')}] {item.get('policyName', 'N/A')}{val_info}\n")
-                elif item.get('type') == 'SID':
-                    type_info = f" ({item.get('sidType', 'Unknown')})" if item.get('sidType') else ""
-                    self.results_text.insert(tk.END, f"   {i}. {item.get('sid')}{type_info}\n")
-            self.results_text.insert(tk.END, "\n")
-        
-        # TypedPaths (v3.1)
-        if raw.get('typed_paths'):
-            self.results_text.insert(tk.END, f"📍 TypedPaths (Address Bar History): {len(raw['typed_paths'])} items\n")
-            for i, item in enumerate(raw['typed_paths'], 1):
-                mru_info = f" [MRU: {item.get('mruOrder')}]" if item.get('mruOrder') is not None else ""
-                type_info = f" ({item.get('type')})" if item.get('type') else ""
-                self.results_text.insert(tk.END, f"   {i}. {item['path']}{mru_info}{type_info}\n")
-            self.results_text.insert(tk.END, "\n")
-        
-        # RecentApps (v3.1)
-        if raw.get('recent_apps'):
-            self.results_text.insert(tk.END, f"📱 RecentApps (Windows 10+ Recent Apps): {len(raw['recent_apps'])} items\n")
-            for i, item in enumerate(raw['recent_apps'], 1):
-                app_info = item.get('appName', 'Unknown')
-                path_info = f" [{item.get('appPath', 'N/A')}]" if item.get('appPath') else ""
-                count_info = f" (Launches: {item.get('launchCount')})" if item.get('launchCount') else ""
-                ts_info = f" [Last: {item.get('lastAccessTime', 'N/A')}]" if item.get('lastAccessTime') else ""
-                self.results_text.insert(tk.END, f"   {i}. {app_info}{count_info}{ts_info}\n")
-                if path_info:
-                    self.results_text.insert(tk.END, f"       Path: {item.get('appPath', 'N/A')}\n")
-            self.results_text.insert(tk.END, "\n")
-        
-        # Services Detailed (v3.1)
-        if raw.get('services_detailed'):
-            self.results_text.insert(tk.END, f"⚙️  Services (System Services): {len(raw['services_detailed'])} items\n")
-            for i, item in enumerate(raw['services_detailed'], 1):
-                name = item.get('serviceName', 'Unknown')
-                start_type = item.get('startType', 'Unknown')
-                img_path = item.get('imagePath', 'N/A')
-                display = item.get('displayName', '')
-                
-                # startType에 따른 이모지 추가
-                start_emoji = {
-                    'Boot': '🚀', 'System': '⚡', 'Auto': '✅', 
-                    'Manual': '⏸️', 'Disabled': '❌'
-                }.get(start_type, '❓')
-                
-                self.results_text.insert(tk.END, f"   {i}. {start_emoji} {name} [{start_type}]\n")
-                if display and display != name:
-                    self.results_text.insert(tk.END, f"       Display: {display}\n")
-                self.results_text.insert(tk.END, f"       Image: {img_path}\n")
-            self.results_text.insert(tk.END, "\n")
-        
-        # WLAN Profiles (v3.1)
-        if raw.get('wlan_profiles'):
-            self.results_text.insert(tk.END, f"📶 WLAN Profiles (Wi-Fi Networks): {len(raw['wlan_profiles'])} items\n")
-            for i, item in enumerate(raw['wlan_profiles'], 1):
-                profile_name = item.get('profileName', 'Unknown')
-                conn_type = item.get('connectionType', 'Unknown')
-                ts_info = f" [Connected: {item.get('lastConnectedTime')}]" if item.get('lastConnectedTime') else ""
-                conn_emoji = '🏢' if conn_type == 'Infrastructure' else '📡' if conn_type == 'AdHoc' else '❓'
-                self.results_text.insert(tk.END, f"   {i}. {conn_emoji} {profile_name} ({conn_type}){ts_info}\n")
-            self.results_text.insert(tk.END, "\n")
-        
-        # TimeZone (v3.1)
-        if raw.get('timezone'):
-            self.results_text.insert(tk.END, f"🌍 Time Zone Information: {len(raw['timezone'])} items\n")
-            for i, item in enumerate(raw['timezone'], 1):
-                std_name = item.get('standardName', 'Unknown')
-                bias = item.get('bias')
-                bias_info = ""
-                if bias is not None:
-                    hours = -(bias // 60)  # Bias는 음수로 저장됨
-                    bias_info = f" (UTC{hours:+d}:00)"
-                daylight = f" / Daylight: {item.get('daylightName')}" if item.get('daylightName') else ""
-                self.results_text.insert(tk.END, f"   {i}. {std_name}{bias_info}{daylight}\n")
-            self.results_text.insert(tk.END, "\n")
+        # 하이브 타입에 해당하지 않아 건너뛴 분석 모듈
+        if results.get('skipped_analyzers'):
+            self.results_text.insert(tk.END, f"⏭️  Skipped (not applicable): {', '.join(results['skipped_analyzers'])}\n\n")
         
         # AI Analysis
         ai = results['ai_analysis']
@@ -896,8 +729,7 @@ Supported Analysis:
         
         if filename:
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(self.analysis_results, f, indent=2, ensure_ascii=False, default=str)
+                export_json(self.analysis_results, filename)
                 messagebox.showinfo("Success", f"Exported to {filename}")
             except Exception as e:
                 messagebox.showerror("Error", f"Export failed: {str(e)}")
@@ -915,65 +747,7 @@ Supported Analysis:
         
         if filename:
             try:
-                with open(filename, 'w', encoding='utf-8-sig') as f:
-                    # 헤더
-                    f.write("Category,Item,Timestamp,Details\n")
-                    
-                    raw = self.analysis_results['raw_findings']
-                    
-                    # ShimCache (with timestamp and file size)
-                    for item in raw['shimcache']:
-                        ts = item.get('timestamp', '')
-                        size = item.get('fileSize', '')
-                        details = f"Size: {size} bytes" if size else ""
-                        f.write(f"ShimCache,{item['path']},{ts},{details}\n")
-                    
-                    # Amcache (with SHA1, publisher, version, etc.)
-                    for item in raw.get('amcache', []):
-                        ts = item.get('timestamp', '')
-                        sha1 = item.get('sha1', 'N/A')
-                        pub = item.get('publisher', 'Unknown')
-                        ver = item.get('version', '')
-                        size = item.get('fileSize', '')
-                        details = f"SHA1:{sha1[:16]}... Publisher:{pub} Version:{ver} Size:{size}"
-                        f.write(f"Amcache,{item['programName']},{ts},{details}\n")
-                    
-                    # UserAssist (with run count and focus time)
-                    for item in raw['userassist']:
-                        runs = item.get('runCount', '')
-                        focus = item.get('focusTime', '')
-                        details = f"Runs:{runs} FocusTime:{focus}ms" if runs or focus else ""
-                        f.write(f"UserAssist,{item['program']},,{details}\n")
-                    
-                    # BAM/DAM (with user SID)
-                    for item in raw['bam_dam']:
-                        ts = item.get('timestamp', '')
-                        sid = item.get('userSID', '')
-                        details = f"UserSID:{sid}" if sid else ""
-                        f.write(f"BAM/DAM,{item['path']},{ts},{details}\n")
-                    
-                    # USB
-                    for item in raw['usb_devices']:
-                        vid = item.get('vid', '')
-                        pid = item.get('pid', '')
-                        f.write(f"USB Device,{item['device']},,VID:{vid} PID:{pid}\n")
-                    
-                    # Recent Docs
-                    for item in raw['recent_docs']:
-                        f.write(f"Recent Document,{item['document']},,\n")
-                    
-                    # Run Keys
-                    for item in raw['run_keys']:
-                        f.write(f"Auto-Start,{item['name']},,{item['command']}\n")
-                    
-                    # SAM Users
-                    for item in raw['sam_users']:
-                        f.write(f"User Account,{item['username']},,{item['sid']}\n")
-                    
-                    # Network
-                    for item in raw['network_profiles']:
-                        f.write(f"Network Profile,{item['network']},,\n")
-                
+                export_csv(self.analysis_results, filename)
                 messagebox.showinfo("Success", f"Exported to {filename}")
             except Exception as e:
                 messagebox.showerror("Error", f"Export failed: {str(e)}")
@@ -984,6 +758,8 @@ Supported Analysis:
         self.selected_files = []  # 선택된 파일 목록 초기화
         self.update_file_list_display()  # UI 업데이트
         self.analysis_results = None
+        self.finding_index = None
+        self.result_browser.clear()
         
         self.results_text.config(state=tk.NORMAL)
         self.results_text.delete('1.0', tk.END)
@@ -1003,10 +779,15 @@ Instructions:
         
         self.export_json_btn.config(state=tk.DISABLED)
         self.export_csv_btn.config(state=tk.DISABLED)
+        
+        # 끝난 작업은 목록에서 제거 (실행 / 취소 중인 작업은 유지)
+        self.jobs = {job_id: entry for job_id, entry in self.jobs.items()
+                     if entry['status'] in ('실행 중', '취소 중')}
+        self.refresh_jobs()
     
     def search_results(self):
-        """분석 결과 검색 (v3.0)"""
-        if not self.analysis_results:
+        """분석 결과 검색 - 구조화된 findings 역색인 검색 후 일치하는 행으로 이동"""
+        if not self.analysis_results or self.finding_index is None:
             messagebox.showwarning("경고", "검색할 분석 결과가 없습니다.")
             return
         
@@ -1015,55 +796,20 @@ Instructions:
             messagebox.showwarning("경고", "검색어를 입력하세요.")
             return
         
-        # 기존 하이라이트 제거
-        self.results_text.tag_remove("highlight", "1.0", tk.END)
-        
-        # 검색 수행
-        case_sensitive = self.case_sensitive.get()
-        regex_mode = self.regex_mode.get()
-        
-        match_count = 0
-        
-        if regex_mode:
-            # 정규표현식 검색
-            try:
-                import re
-                pattern = re.compile(query, 0 if case_sensitive else re.IGNORECASE)
-            except re.error as e:
-                messagebox.showerror("오류", f"잘못된 정규표현식: {e}")
-                return
-            
-            # 텍스트에서 패턴 검색
-            content = self.results_text.get("1.0", tk.END)
-            for match in pattern.finditer(content):
-                start_idx = f"1.0+{match.start()}c"
-                end_idx = f"1.0+{match.end()}c"
-                self.results_text.tag_add("highlight", start_idx, end_idx)
-                match_count += 1
-        
-        else:
-            # 일반 문자열 검색
-            search_str = query if case_sensitive else query.lower()
-            start_pos = "1.0"
-            
-            while True:
-                pos = self.results_text.search(search_str, start_pos, tk.END, 
-                                              nocase=not case_sensitive)
-                if not pos:
-                    break
-                
-                end_pos = f"{pos}+{len(query)}c"
-                self.results_text.tag_add("highlight", pos, end_pos)
-                match_count += 1
-                start_pos = end_pos
+        # 검색 수행 (공백 = AND, "필드:값" = 필드 검색, 정규표현식 모드는 필드 값 전체에 re.search)
+        try:
+            ids = self.finding_index.search(query, case_sensitive=self.case_sensitive.get(),
+                                            regex=self.regex_mode.get())
+        except re.error as e:
+            messagebox.showerror("오류", f"잘못된 정규표현식: {e}")
+            return
         
         # 결과 카운트 표시
-        if match_count > 0:
-            self.search_count_label.config(text=f"찾음: {match_count}개")
-            # 첫 번째 매치로 스크롤
-            first_match = self.results_text.tag_ranges("highlight")
-            if first_match:
-                self.results_text.see(first_match[0])
+        if ids:
+            self.search_count_label.config(text=f"찾음: {len(ids)}개")
+            # 일치하는 행만 표시하고 첫 번째 행으로 이동
+            self.result_browser.show_matches(ids)
+            self.results_tabs.select(self.result_browser)
         else:
             self.search_count_label.config(text="결과 없음")
             messagebox.showinfo("검색", f"'{query}'에 대한 결과를 찾을 수 없습니다.")
@@ -1072,7 +818,7 @@ Instructions:
         """검색 초기화 (v3.0)"""
         self.search_query.set("")
         self.search_count_label.config(text="")
-        self.results_text.tag_remove("highlight", "1.0", tk.END)
+        self.result_browser.show_matches(None)
     
     def decrease_font(self):
         """폰트 크기 감소 (v4.0)"""
@@ -1129,73 +875,69 @@ Instructions:
         multi_hive_files = self.selected_files
         
         # 분석 시작
-        try:
-            self.results_text.config(state=tk.NORMAL)
-            self.results_text.delete('1.0', tk.END)
-            self.results_text.insert(tk.END, "🔄 Multi-Hive 분석 시작...\n\n")
-            self.results_text.insert(tk.END, f"선택된 파일: {len(multi_hive_files)}개\n")
-            for i, fp in enumerate(multi_hive_files, 1):
-                self.results_text.insert(tk.END, f"  {i}. {os.path.basename(fp)}\n")
-            self.results_text.insert(tk.END, "\n")
-            self.root.update()
-            
+        self.results_text.config(state=tk.NORMAL)
+        self.results_text.delete('1.0', tk.END)
+        self.results_text.insert(tk.END, "🔄 Multi-Hive 분석 시작...\n\n")
+        self.results_text.insert(tk.END, f"선택된 파일: {len(multi_hive_files)}개\n")
+        for i, fp in enumerate(multi_hive_files, 1):
+            self.results_text.insert(tk.END, f"  {i}. {os.path.basename(fp)}\n")
+        self.results_text.insert(tk.END, "\n")
+        self.results_text.config(state=tk.DISABLED)
+        
+        # Tk 변수는 UI 스레드에서만 읽음
+        api_key = self.api_key.get()
+        api_provider = self.api_provider.get()
+        
+        def run(job: AnalysisJob) -> Dict:
             # MultiHiveAnalyzer 생성
-            analyzer = MultiHiveAnalyzer()
+            analyzer = MultiHiveAnalyzer(cache=self.result_cache)
             
-            # 각 파일 로드
-            self.results_text.insert(tk.END, "📂 하이브 파일 로드 중...\n")
-            loaded_hives = []
+            # 각 파일 로드 / 타입 감지 / 분석 (프로세스 병렬, 실패한 파일만 제외)
+            job.log("📂 하이브 파일 로드 중...")
+            total = len(multi_hive_files)
+            done = []
+            job.progress(0, total)
             
-            for fp in multi_hive_files:
-                # 파일 읽기
-                with open(fp, 'rb') as f:
-                    data = f.read()
-                
-                # Hive 타입 자동 감지
-                parser = RegistryParser(data, fp)
-                hive_type = parser.detect_hive_type()
-                
-                # 하이브 추가
-                success = analyzer.add_hive(fp, hive_type)
-                if success:
-                    loaded_hives.append((os.path.basename(fp), hive_type))
-                    self.results_text.insert(tk.END, f"  ✅ {os.path.basename(fp)} ({hive_type})\n")
+            def on_hive_done(status):
+                name = os.path.basename(status['file_path'])
+                done.append(name)
+                if status['success']:
+                    job.log(f"  ✅ {name} ({status['hive_type']})")
                 else:
-                    self.results_text.insert(tk.END, f"  ❌ {os.path.basename(fp)} - 로드 실패\n")
-                
-                self.root.update()
+                    job.log(f"  ❌ {name} - 로드 실패: {status['error']}")
+                job.progress(len(done), total, name)
+            
+            statuses = analyzer.add_hives(multi_hive_files, max_workers=DEFAULT_WORKERS,
+                                          on_hive_done=on_hive_done, should_stop=job.cancelled)
+            loaded_hives = [(os.path.basename(status['file_path']), status['hive_type'])
+                            for status in statuses if status['success']]
             
             if not loaded_hives:
-                messagebox.showerror("오류", "하이브 파일을 로드할 수 없습니다.")
-                return
+                raise RuntimeError("하이브 파일을 로드할 수 없습니다.")
             
-            self.results_text.insert(tk.END, f"\n✅ {len(loaded_hives)}개 하이브 로드 완료\n\n")
-            self.root.update()
+            job.log(f"\n✅ {len(loaded_hives)}개 하이브 로드 완료\n")
             
             # 상관관계 분석
-            self.results_text.insert(tk.END, "🔍 상관관계 분석 중...\n")
-            self.root.update()
+            job.log("🔍 상관관계 분석 중...")
             
-            correlations = analyzer.find_correlations()
-            self.results_text.insert(tk.END, f"✅ {len(correlations)}개 상관관계 발견\n\n")
-            self.root.update()
+            correlations = analyzer.correlations  # add_hives에서 필요한 하이브가 준비되는 대로 계산됨
+            job.log(f"✅ {len(correlations)}개 상관관계 발견\n")
             
             # 타임라인 생성
-            self.results_text.insert(tk.END, "📅 타임라인 생성 중...\n")
-            self.root.update()
+            job.check()
+            job.log("📅 타임라인 생성 중...")
             
             timeline = analyzer.build_timeline()
-            self.results_text.insert(tk.END, f"✅ {len(timeline)}개 이벤트 추출\n\n")
-            self.root.update()
+            job.log(f"✅ {len(timeline)}개 이벤트 추출\n")
             
             # 요약 정보
             summary = analyzer.get_summary()
             
             # AI 분석 (API 키가 설정된 경우)
             ai_result = None
-            if self.api_key.get():
-                self.results_text.insert(tk.END, "🤖 AI 기반 통합 분석 중...\n")
-                self.root.update()
+            if api_key:
+                job.check()
+                job.log("🤖 AI 기반 통합 분석 중...")
                 
                 # Multi-Hive 분석 결과를 AI로 분석
                 # 모든 하이브의 findings를 합침
@@ -1216,9 +958,9 @@ Instructions:
                 
                 # AI 분석 실행
                 try:
-                    if self.api_provider.get() == 'gemini':
+                    if api_provider == 'gemini':
                         ai_result = AIAnalyzer.analyze_with_gemini(
-                            self.api_key.get(),
+                            api_key,
                             'Multi-Hive',
                             all_strings[:1000],  # 최대 1000개 문자열
                             {
@@ -1230,7 +972,7 @@ Instructions:
                         )
                     else:
                         ai_result = AIAnalyzer.analyze_with_openai(
-                            self.api_key.get(),
+                            api_key,
                             'Multi-Hive',
                             all_strings[:1000],
                             {
@@ -1241,14 +983,25 @@ Instructions:
                             }
                         )
                     
-                    self.results_text.insert(tk.END, "✅ AI 분석 완료\n\n")
-                    self.root.update()
+                    job.log("✅ AI 분석 완료\n")
                 except Exception as e:
-                    self.results_text.insert(tk.END, f"⚠️  AI 분석 실패: {str(e)}\n\n")
-                    self.root.update()
+                    job.log(f"⚠️  AI 분석 실패: {str(e)}\n")
             
+            return {
+                'analyzer': analyzer,
+                'loaded_hives': loaded_hives,
+                'correlations': correlations,
+                'timeline': timeline,
+                'summary': summary,
+                'ai_result': ai_result,
+                'index': FindingIndex(multi_hive_rows(analyzer.hives, correlations, timeline))
+            }
+        
+        def on_done(result: Dict):
             # 결과 표시 (analyzer 객체 전달)
-            self.display_multi_hive_results(analyzer, loaded_hives, correlations, timeline, summary, ai_result)
+            self.display_multi_hive_results(result['analyzer'], result['loaded_hives'], result['correlations'],
+                                            result['timeline'], result['summary'], result['ai_result'],
+                                            result['index'])
             
             # 내보내기 버튼 활성화
             self.export_json_btn.config(state=tk.NORMAL)
@@ -1257,19 +1010,112 @@ Instructions:
             # 분석 결과 저장
             self.analysis_results = {
                 'type': 'multi-hive',
-                'loaded_hives': loaded_hives,
-                'correlations': correlations,
-                'timeline': timeline,
-                'summary': summary,
-                'ai_analysis': ai_result if ai_result else None
+                'loaded_hives': result['loaded_hives'],
+                'correlations': result['correlations'],
+                'timeline': result['timeline'],
+                'summary': result['summary'],
+                'ai_analysis': result['ai_result'] if result['ai_result'] else None
             }
-            
-        except Exception as e:
-            self.results_text.config(state=tk.DISABLED)
-            messagebox.showerror("Error", f"Multi-hive analysis failed: {str(e)}")
+        
+        self.start_job(f"Multi-Hive ({len(multi_hive_files)}개)", run, on_done, "Multi-hive analysis failed")
+    
+    def start_job(self, label: str, target, on_done, error_title: str):
+        """분석 작업을 워커 스레드에서 시작 - 진행 / 결과는 _poll_events에서 UI 스레드로 처리"""
+        job = AnalysisJob(label, target, self.events)
+        self.jobs[job.id] = {
+            'job': job,
+            'status': '실행 중',
+            'done': 0,
+            'total': 0,
+            'on_done': on_done,
+            'error_title': error_title
+        }
+        job.start()
+        self.refresh_jobs()
+    
+    def _poll_events(self):
+        """워커 이벤트 큐 처리 (UI 스레드, root.after 주기 호출)"""
+        try:
+            while True:
+                job_id, kind, payload = self.events.get_nowait()
+                self._handle_event(job_id, kind, payload)
+        except queue.Empty:
+            pass
+        self.root.after(100, self._poll_events)
+    
+    def _handle_event(self, job_id: int, kind: str, payload):
+        """워커 이벤트 하나 처리"""
+        entry = self.jobs.get(job_id)
+        if entry is None:
+            return
+        label = entry['job'].label
+        
+        if kind == 'log':
+            self.append_log(f"[{label}] {payload}")
+        elif kind == 'warning':
+            messagebox.showwarning("경고", f"{label}: {payload}")
+        elif kind == 'progress':
+            entry['done'], entry['total'], message = payload
+            if message:
+                self.append_log(f"[{label}]   ✓ {message} ({entry['done']}/{entry['total']})")
+        elif kind == 'done':
+            entry['status'] = '완료'
+            try:
+                entry['on_done'](payload)
+            except Exception as e:
+                messagebox.showerror("Error", f"{entry['error_title']}: {str(e)}")
+        elif kind == 'cancelled':
+            entry['status'] = '취소됨'
+            self.append_log(f"[{label}] ⏹ 분석 취소됨")
+        elif kind == 'error':
+            entry['status'] = '실패'
+            self.append_log(f"\n[{label}] ❌ Error: {payload}")
+            messagebox.showerror("Error", f"{entry['error_title']}: {payload}")
+        
+        self.refresh_jobs()
+    
+    def append_log(self, message: str):
+        """결과 영역에 진행 로그 한 줄 추가"""
+        self.results_text.config(state=tk.NORMAL)
+        self.results_text.insert(tk.END, message + "\n")
+        self.results_text.see(tk.END)
+        self.results_text.config(state=tk.DISABLED)
+    
+    def refresh_jobs(self):
+        """작업 목록 / 전체 진행률 / 취소 버튼 갱신"""
+        self.jobs_list.delete(0, tk.END)
+        running = [entry for entry in self.jobs.values() if entry['status'] in ('실행 중', '취소 중')]
+        for job_id, entry in self.jobs.items():
+            progress = f" ({entry['done']}/{entry['total']})" if entry['total'] else ""
+            self.jobs_list.insert(tk.END, f"#{job_id} {entry['job'].label} - {entry['status']}{progress}")
+        
+        # 실행 중인 작업 전체 진행률
+        total = sum(entry['total'] for entry in running)
+        self.progress_bar.config(maximum=max(total, 1),
+                                 value=sum(entry['done'] for entry in running))
+        self.cancel_btn.config(state=tk.NORMAL if any(entry['status'] == '실행 중' for entry in running)
+                               else tk.DISABLED)
+    
+    def cancel_jobs(self):
+        """선택한 작업 취소 (선택이 없으면 실행 중인 작업 모두)"""
+        job_ids = list(self.jobs)
+        selected = [job_ids[index] for index in self.jobs_list.curselection()]
+        for job_id in selected or job_ids:
+            entry = self.jobs[job_id]
+            if entry['status'] == '실행 중':
+                entry['job'].cancel()
+                entry['status'] = '취소 중'
+        self.refresh_jobs()
     
-    def display_multi_hive_results(self, analyzer, loaded_hives, correlations, timeline, summary, ai_result=None):
-        """Multi-hive 분석 결과 표시 - 모든 아티팩트 상세 출력 + AI 분석 (v4.0)"""
+    def on_close(self):
+        """창 닫기 - 실행 중인 작업 취소 후 종료"""
+        for entry in self.jobs.values():
+            entry['job'].cancel()
+        self.root.destroy()
+    
+    def display_multi_hive_results(self, analyzer, loaded_hives, correlations, timeline, summary, ai_result=None,
+                                   index: FindingIndex = None):
+        """Multi-hive 분석 결과 표시 - 요약 / 상관관계 / AI 분석은 보고서, 모든 항목은 아티팩트 탭 (v4.0)"""
         self.results_text.config(state=tk.NORMAL)
         self.results_text.delete('1.0', tk.END)
         
@@ -1299,224 +1145,22 @@ Instructions:
         self.results_text.insert(tk.END, f"Timeline Events: {summary['timeline_events']}\n")
         self.results_text.insert(tk.END, "\n")
         
-        # ===== 모든 하이브의 모든 아티팩트 상세 출력 =====
+        # ===== 하이브별 아티팩트 개수 (항목은 아티팩트 / 타임라인 탭) =====
         self.results_text.insert(tk.END, "\n" + "#" * 80 + "\n")
-        self.results_text.insert(tk.END, "#  DETAILED ARTIFACTS FROM ALL HIVES - 모든 아티팩트 상세 정보\n")
+        self.results_text.insert(tk.END, "#  ARTIFACTS FROM ALL HIVES - 항목 상세는 '아티팩트 / 타임라인' 탭\n")
         self.results_text.insert(tk.END, "#" * 80 + "\n\n")
         
-        # analyzer.hives를 순회하며 모든 findings 출력
         for hive_type, hive_data in analyzer.hives.items():
-            hive_path = hive_data.get('path', 'Unknown')
+            hive_path = hive_data.get('file_path', 'Unknown')
             findings = hive_data.get('findings', {})
             
-            self.results_text.insert(tk.END, "\n" + "="*80 + "\n")
             self.results_text.insert(tk.END, f"🗂️  HIVE: {hive_type.upper()} - {hive_path}\n")
-            self.results_text.insert(tk.END, "="*80 + "\n\n")
-            
-            # 각 artifact type별로 모든 항목 출력
             for artifact_type, artifacts in findings.items():
-                if not artifacts:
-                    continue
-                
-                self.results_text.insert(tk.END, f"\n{'─'*80}\n")
-                self.results_text.insert(tk.END, f"📌 {artifact_type.upper()} ({len(artifacts)} items)\n")
-                self.results_text.insert(tk.END, f"{'─'*80}\n\n")
-                
-                # artifact type별로 다른 출력 포맷 적용
-                if artifact_type == 'shimcache':
-                    for i, item in enumerate(artifacts, 1):
-                        self.results_text.insert(tk.END, f"[{i}] Path: {item.get('path', 'N/A')}\n")
-                        self.results_text.insert(tk.END, f"    Last Modified: {item.get('lastModified', 'N/A')}\n")
-                        if item.get('fileSize'):
-                            self.results_text.insert(tk.END, f"    Size: {item.get('fileSize')}\n")
-                        self.results_text.insert(tk.END, "\n")
-                
-                elif artifact_type == 'amcache':
-                    for i, item in enumerate(artifacts, 1):
-                        self.results_text.insert(tk.END, f"[{i}] Program: {item.get('programName', 'N/A')}\n")
-                        self.results_text.insert(tk.END, f"    Path: {item.get('fullPath', 'N/A')}\n")
-                        if item.get('sha1'):
-                            self.results_text.insert(tk.END, f"    SHA1: {item.get('sha1')}\n")
-                        if item.get('fileSize'):
-                            self.results_text.insert(tk.END, f"    Size: {item.get('fileSize')} bytes\n")
-                        if item.get('lastModified'):
-                            self.results_text.insert(tk.END, f"    Modified: {item.get('lastModified')}\n")
-                        if item.get('created'):
-                            self.results_text.insert(tk.END, f"    Created: {item.get('created')}\n")
-                        self.results_text.insert(tk.END, "\n")
-                
-                elif artifact_type == 'userassist':
-                    for i, item in enumerate(artifacts, 1):
-                        self.results_text.insert(tk.END, f"[{i}] Program: {item.get('programName', 'N/A')}\n")
-                        self.results_text.insert(tk.END, f"    GUID: {item.get('guid', 'N/A')}\n")
-                        self.results_text.insert(tk.END, f"    Run Count: {item.get('runCount', 0)}\n")
-                        self.results_text.insert(tk.END, f"    Last Executed: {item.get('lastExecuted', 'N/A')}\n")
-                        if item.get('focusCount'):
-                            self.results_text.insert(tk.END, f"    Focus Count: {item.get('focusCount')}\n")
-                        if item.get('focusTime'):
-                            self.results_text.insert(tk.END, f"    Focus Time: {item.get('focusTime')}\n")
-                        self.results_text.insert(tk.END, "\n")
-                
-                elif artifact_type == 'bam' or artifact_type == 'dam':
-                    for i, item in enumerate(artifacts, 1):
-                        self.results_text.insert(tk.END, f"[{i}] Path: {item.get('path', 'N/A')}\n")
-                        self.results_text.insert(tk.END, f"    Last Executed: {item.get('lastExecuted', 'N/A')}\n")
-                        if item.get('sid'):
-                            self.results_text.insert(tk.END, f"    SID: {item.get('sid')}\n")
-                        self.results_text.insert(tk.END, "\n")
-                
-                elif artifact_type == 'usb':
-                    for i, item in enumerate(artifacts, 1):
-                        self.results_text.insert(tk.END, f"[{i}] Device: {item.get('deviceName', 'N/A')}\n")
-                        self.results_text.insert(tk.END, f"    Serial: {item.get('serialNumber', 'N/A')}\n")
-                        if item.get('vendor'):
-                            self.results_text.insert(tk.END, f"    Vendor: {item.get('vendor')}\n")
-                        if item.get('product'):
-                            self.results_text.insert(tk.END, f"    Product: {item.get('product')}\n")
-                        if item.get('firstConnected'):
-                            self.results_text.insert(tk.END, f"    First Connected: {item.get('firstConnected')}\n")
-                        if item.get('lastConnected'):
-                            self.results_text.insert(tk.END, f"    Last Connected: {item.get('lastConnected')}\n")
-                        self.results_text.insert(tk.END, "\n")
-                
-                elif artifact_type == 'network':
-                    for i, item in enumerate(artifacts, 1):
-                        self.results_text.insert(tk.END, f"[{i}] Profile: {item.get('profileName', 'N/A')}\n")
-                        if item.get('ssid'):
-                            self.results_text.insert(tk.END, f"    SSID: {item.get('ssid')}\n")
-                        if item.get('dateCreated'):
-                            self.results_text.insert(tk.END, f"    Created: {item.get('dateCreated')}\n")
-                        if item.get('lastConnected'):
-                            self.results_text.insert(tk.END, f"    Last Connected: {item.get('lastConnected')}\n")
-                        self.results_text.insert(tk.END, "\n")
-                
-                elif artifact_type == 'shellbags':
-                    for i, item in enumerate(artifacts, 1):
-                        self.results_text.insert(tk.END, f"[{i}] Path: {item.get('path', 'N/A')}\n")
-                        if item.get('shellbagType'):
-                            self.results_text.insert(tk.END, f"    Type: {item.get('shellbagType')}\n")
-                        if item.get('accessed'):
-                            self.results_text.insert(tk.END, f"    Accessed: {item.get('accessed')}\n")
-                        if item.get('modified'):
-                            self.results_text.insert(tk.END, f"    Modified: {item.get('modified')}\n")
-                        self.results_text.insert(tk.END, "\n")
-                
-                elif artifact_type == 'muicache':
-                    for i, item in enumerate(artifacts, 1):
-                        self.results_text.insert(tk.END, f"[{i}] Path: {item.get('path', 'N/A')}\n")
-                        if item.get('friendlyName'):
-                            self.results_text.insert(tk.END, f"    Name: {item.get('friendlyName')}\n")
-                        self.results_text.insert(tk.END, "\n")
-                
-                elif artifact_type == 'prefetch':
-                    for i, item in enumerate(artifacts, 1):
-                        self.results_text.insert(tk.END, f"[{i}] File: {item.get('fileName', 'N/A')}\n")
-                        self.results_text.insert(tk.END, f"    Path: {item.get('path', 'N/A')}\n")
-                        if item.get('runCount'):
-                            self.results_text.insert(tk.END, f"    Run Count: {item.get('runCount')}\n")
-                        if item.get('lastRun'):
-                            self.results_text.insert(tk.END, f"    Last Run: {item.get('lastRun')}\n")
-                        self.results_text.insert(tk.END, "\n")
-                
-                elif artifact_type == 'lnk':
-                    for i, item in enumerate(artifacts, 1):
-                        self.results_text.insert(tk.END, f"[{i}] File: {item.get('fileName', 'N/A')}\n")
-                        self.results_text.insert(tk.END, f"    Target: {item.get('targetPath', 'N/A')}\n")
-                        if item.get('created'):
-                            self.results_text.insert(tk.END, f"    Created: {item.get('created')}\n")
-                        if item.get('modified'):
-                            self.results_text.insert(tk.END, f"    Modified: {item.get('modified')}\n")
-                        if item.get('accessed'):
-                            self.results_text.insert(tk.END, f"    Accessed: {item.get('accessed')}\n")
-                        self.results_text.insert(tk.END, "\n")
-                
-                elif artifact_type == 'installed_software':
-                    for i, item in enumerate(artifacts, 1):
-                        self.results_text.insert(tk.END, f"[{i}] Software: {item.get('displayName', 'N/A')}\n")
-                        if item.get('version'):
-                            self.results_text.insert(tk.END, f"    Version: {item.get('version')}\n")
-                        if item.get('publisher'):
-                            self.results_text.insert(tk.END, f"    Publisher: {item.get('publisher')}\n")
-                        if item.get('installDate'):
-                            self.results_text.insert(tk.END, f"    Install Date: {item.get('installDate')}\n")
-                        if item.get('installLocation'):
-                            self.results_text.insert(tk.END, f"    Location: {item.get('installLocation')}\n")
-                        self.results_text.insert(tk.END, "\n")
-                
-                elif artifact_type == 'security_software':
-                    for i, item in enumerate(artifacts, 1):
-                        self.results_text.insert(tk.END, f"[{i}] Product: {item.get('productName', 'N/A')}\n")
-                        if item.get('enabled'):
-                            self.results_text.insert(tk.END, f"    Enabled: {item.get('enabled')}\n")
-                        if item.get('upToDate'):
-                            self.results_text.insert(tk.END, f"    Up to Date: {item.get('upToDate')}\n")
-                        self.results_text.insert(tk.END, "\n")
-                
-                elif artifact_type == 'typed_paths':
-                    for i, item in enumerate(artifacts, 1):
-                        self.results_text.insert(tk.END, f"[{i}] Path: {item.get('path', 'N/A')}\n")
-                        if item.get('timestamp'):
-                            self.results_text.insert(tk.END, f"    Accessed: {item.get('timestamp')}\n")
-                        if item.get('order'):
-                            self.results_text.insert(tk.END, f"    Order: {item.get('order')}\n")
-                        self.results_text.insert(tk.END, "\n")
-                
-                elif artifact_type == 'recent_apps':
-                    for i, item in enumerate(artifacts, 1):
-                        self.results_text.insert(tk.END, f"[{i}] App: {item.get('appName', 'N/A')}\n")
-                        if item.get('path'):
-                            self.results_text.insert(tk.END, f"    Path: {item.get('path')}\n")
-                        if item.get('lastAccess'):
-                            self.results_text.insert(tk.END, f"    Last Access: {item.get('lastAccess')}\n")
-                        if item.get('launchCount'):
-                            self.results_text.insert(tk.END, f"    Launch Count: {item.get('launchCount')}\n")
-                        self.results_text.insert(tk.END, "\n")
-                
-                elif artifact_type == 'services':
-                    for i, item in enumerate(artifacts, 1):
-                        self.results_text.insert(tk.END, f"[{i}] Service: {item.get('serviceName', 'N/A')}\n")
-                        if item.get('displayName'):
-                            self.results_text.insert(tk.END, f"    Display Name: {item.get('displayName')}\n")
-                        if item.get('imagePath'):
-                            self.results_text.insert(tk.END, f"    Image Path: {item.get('imagePath')}\n")
-                        if item.get('startType'):
-                            self.results_text.insert(tk.END, f"    Start Type: {item.get('startType')}\n")
-                        if item.get('serviceType'):
-                            self.results_text.insert(tk.END, f"    Service Type: {item.get('serviceType')}\n")
-                        if item.get('description'):
-                            self.results_text.insert(tk.END, f"    Description: {item.get('description')}\n")
-                        self.results_text.insert(tk.END, "\n")
-                
-                elif artifact_type == 'wlan_profiles':
-                    for i, item in enumerate(artifacts, 1):
-                        self.results_text.insert(tk.END, f"[{i}] SSID: {item.get('ssid', 'N/A')}\n")
-                        if item.get('profileName'):
-                            self.results_text.insert(tk.END, f"    Profile: {item.get('profileName')}\n")
-                        if item.get('authentication'):
-                            self.results_text.insert(tk.END, f"    Auth: {item.get('authentication')}\n")
-                        if item.get('encryption'):
-                            self.results_text.insert(tk.END, f"    Encryption: {item.get('encryption')}\n")
-                        if item.get('connectionMode'):
-                            self.results_text.insert(tk.END, f"    Connection Mode: {item.get('connectionMode')}\n")
-                        self.results_text.insert(tk.END, "\n")
-                
-                elif artifact_type == 'timezone':
-                    for i, item in enumerate(artifacts, 1):
-                        self.results_text.insert(tk.END, f"[{i}] Timezone: {item.get('timezone', 'N/A')}\n")
-                        if item.get('displayName'):
-                            self.results_text.insert(tk.END, f"    Display Name: {item.get('displayName')}\n")
-                        if item.get('standardName'):
-                            self.results_text.insert(tk.END, f"    Standard Name: {item.get('standardName')}\n")
-                        if item.get('daylightName'):
-                            self.results_text.insert(tk.END, f"    Daylight Name: {item.get('daylightName')}\n")
-                        if item.get('bias'):
-                            self.results_text.insert(tk.END, f"    Bias: {item.get('bias')} minutes\n")
-                        self.results_text.insert(tk.END, "\n")
-                
-                # 기타 아티팩트는 기본 포맷으로 출력
-                else:
-                    for i, item in enumerate(artifacts, 1):
-                        self.results_text.insert(tk.END, f"[{i}] {item}\n\n")
+                if artifacts:
+                    self.results_text.insert(tk.END, f"    {ARTIFACT_LABELS.get(artifact_type, artifact_type)}: {len(artifacts)} items\n")
+            if hive_data.get('skipped'):
+                self.results_text.insert(tk.END, f"    ⏭️  Skipped (not applicable): {', '.join(hive_data['skipped'])}\n")
+            self.results_text.insert(tk.END, "\n")
         
         # ===== 상관관계 결과 (모든 항목 출력) =====
         if correlations:
@@ -1580,38 +1224,16 @@ Instructions:
                 
                 self.results_text.insert(tk.END, "\n")
         
-        # ===== 타임라인 (모든 이벤트 출력) =====
+        # ===== 타임라인 (이벤트는 아티팩트 / 타임라인 탭, 최신순) =====
         if timeline:
             self.results_text.insert(tk.END, "\n" + "#" * 80 + "\n")
-            self.results_text.insert(tk.END, f"#  UNIFIED TIMELINE - 모든 {len(timeline)}개 이벤트\n")
+            self.results_text.insert(tk.END, f"#  UNIFIED TIMELINE - {len(timeline)}개 이벤트 ('아티팩트 / 타임라인' 탭)\n")
             self.results_text.insert(tk.END, "#" * 80 + "\n\n")
-            
-            # 모든 이벤트를 시간순으로 정렬하여 표시 (타임스탬프 타입 안전 처리)
-            def safe_sort_key(event):
-                ts = event.get('timestamp', '')
-                if isinstance(ts, str):
-                    return ts
-                else:
-                    return str(ts)
-            
-            sorted_timeline = sorted(timeline, key=safe_sort_key, reverse=True)
-            
-            for i, event in enumerate(sorted_timeline, 1):
-                ts = event.get('timestamp', 'N/A')
-                desc = event.get('description', 'Unknown event')
-                hive = event.get('hive', 'N/A')
-                artifact = event.get('artifact_type', 'N/A')
-                
-                self.results_text.insert(tk.END, f"{i:4d}. [{ts}] {desc}\n")
-                self.results_text.insert(tk.END, f"        Source: {hive} - {artifact}\n")
-                
-                # 추가 정보가 있으면 표시
-                if event.get('path'):
-                    self.results_text.insert(tk.END, f"        Path: {event['path']}\n")
-                if event.get('details'):
-                    self.results_text.insert(tk.END, f"        Details: {event['details']}\n")
-                
-                self.results_text.insert(tk.END, "\n")
+        
+        if index is None:
+            index = FindingIndex(multi_hive_rows(analyzer.hives, correlations, timeline))
+        self.finding_index = index
+        self.result_browser.set_rows(index.rows, index)
         
         # ===== AI 분석 결과 =====
         if ai_result:
@@ -1660,9 +1282,9 @@ Instructions:
         
         self.results_text.insert(tk.END, "\n" + "═" * 80 + "\n")
         if ai_result:
-            self.results_text.insert(tk.END, "✅ Multi-Hive 전체 상세 분석 + AI 분석 완료! (생략 없음)\n")
+            self.results_text.insert(tk.END, "✅ Multi-Hive 전체 상세 분석 + AI 분석 완료!\n")
         else:
-            self.results_text.insert(tk.END, "✅ Multi-Hive 전체 상세 분석 완료! (생략 없음)\n")
+            self.results_text.insert(tk.END, "✅ Multi-Hive 전체 상세 분석 완료!\n")
             self.results_text.insert(tk.END, "💡 TIP: API 키를 입력하면 AI 기반 통합 분석도 제공됩니다.\n")
         self.results_text.insert(tk.END, "═" * 80 + "\n")
         
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Result Browser - 가상화 Treeview 결과 목록 (보이는 행만 렌더링, 정렬 / 필터)
+"""
+
+import json
+import tkinter as tk
+from tkinter import ttk, scrolledtext
+from typing import Dict, List, Optional, Set, Tuple
+
+from utils.search_index import FindingIndex, Row
+
+
+# 결과 키 -> 표시 이름 (보고서 요약 / 카테고리 열 / 필터 목록)
+ARTIFACT_LABELS = {
+    'shimcache': "🚀 ShimCache (Executed Programs)",
+    'amcache': "📦 Amcache (Program Information)",
+    'userassist': "👤 UserAssist (User Activity)",
+    'bam_dam': "⚡ BAM/DAM (Background Activity)",
+    'usb_devices': "💾 USB Devices",
+    'recent_docs': "📄 Recent Documents",
+    'run_keys': "🔑 Auto-Start Programs",
+    'sam_users': "👥 User Accounts",
+    'network_profiles': "🌐 Network Profiles",
+    'shellbags': "📁 ShellBags (Folder Access History)",
+    'muicache': "🎨 MuiCache (Application UI Cache)",
+    'prefetch': "⚡ Prefetch (Program Execution Cache)",
+    'lnk_files': "🔗 LNK Files (Shortcuts)",
+    'installed_software': "💿 Installed Software (Detailed)",
+    'security_detailed': "🔐 Security Policies & SIDs",
+    'typed_paths': "📍 TypedPaths (Address Bar History)",
+    'recent_apps': "📱 RecentApps (Windows 10+ Recent Apps)",
+    'services_detailed': "⚙️  Services (System Services)",
+    'wlan_profiles': "📶 WLAN Profiles (Wi-Fi Networks)",
+    'timezone': "🌍 Time Zone Information",
+    'correlation': "🔗 Correlation",
+    'timeline': "📅 Timeline",
+}
+
+# 항목 / 시간 열에 쓸 필드 (앞에 있는 필드 우선)
+ITEM_FIELDS = ('description', 'path', 'programName', 'program', 'device', 'deviceName', 'document',
+               'name', 'username', 'network', 'lnkPath', 'displayName', 'serviceName', 'profileName',
+               'policyName', 'sid', 'appName', 'standardName', 'filePath', 'type')
+TIME_FIELDS = ('timestamp', 'lastExecuted', 'lastWriteTime', 'lastAccessTime', 'lastAccess',
+               'installDate', 'lastConnectedTime', 'lastConnected', 'lastLogin', 'created')
+HIDDEN_FIELDS = ('offset', 'timestamp_field', 'hive', 'artifact_type')
+
+COLUMNS = ('no', 'category', 'source', 'time', 'item', 'details')
+HEADINGS = {'no': '#', 'category': '카테고리', 'source': '하이브', 'time': '시간', 'item': '항목', 'details': '상세'}
+WIDTHS = {'no': 60, 'category': 200, 'source': 90, 'time': 150, 'item': 320, 'details': 420}
+
+ALL_CATEGORIES = '전체'
+
+
+def _first(record: Dict, fields: Tuple[str, ...]) -> Tuple[Optional[str], str]:
+    """fields 중 값이 있는 첫 필드 (필드 이름, 문자열 값)"""
+    for field in fields:
+        value = record.get(field)
+        if value not in (None, '', 'N/A'):
+            return field, str(value)
+    return None, ''
+
+
+def format_row(row: Row) -> Tuple[str, str, str, str, str]:
+    """행 -> (카테고리, 하이브, 시간, 항목, 상세) 표시 문자열 (보이는 행에 대해서만 호출)"""
+    key, source, record = row
+    time_field, time = _first(record, TIME_FIELDS)
+    item_field, item = _first(record, ITEM_FIELDS)
+
+    # 타임라인 이벤트는 원본 아티팩트 필드를 상세로 표시
+    data = record.get('artifact_data', record)
+    if data is not record:
+        key = f"{ARTIFACT_LABELS['timeline']} / {record.get('artifact_type', '')}"
+    else:
+        key = ARTIFACT_LABELS.get(key, key)
+    details = '; '.join(f"{name}={value}" for name, value in data.items()
+                        if name not in HIDDEN_FIELDS and name not in (time_field, item_field)
+                        and value not in (None, '', [], {}))
+    return key, source, time, item, details[:500]
+
+
+def findings_rows(raw_findings: Dict[str, List[Dict]], hive_type: str) -> List[Row]:
+    """단일 하이브 결과 -> 행 목록"""
+    return [(key, hive_type, item) for key, items in raw_findings.items() for item in items]
+
+
+def multi_hive_rows(hives: Dict[str, Dict], correlations: List[Dict], timeline: List[Dict]) -> List[Row]:
+    """Multi-hive 결과 -> 행 목록 (하이브별 아티팩트, 상관관계, 최신순 타임라인)"""
+    rows = []
+    for hive_type, hive_data in hives.items():
+        for artifact_type, artifacts in hive_data.get('findings', {}).items():
+            rows.extend((artifact_type, hive_type, item) for item in artifacts)
+    rows.extend(('correlation', 'Multi-Hive', corr) for corr in correlations)
+
+    # 타임스탬프 타입 안전 처리
+    def safe_sort_key(event):
+        ts = event.get('timestamp', '')
+        if isinstance(ts, str):
+            return ts
+        else:
+            return str(ts)
+
+    rows.extend(('timeline', event.get('hive', 'N/A'), event)
+                for event in sorted(timeline, key=safe_sort_key, reverse=True))
+    return rows
+
+
+class ResultBrowser(ttk.Frame):
+    """
+    결과 행 브라우저
+
+    Treeview에는 화면에 보이는 행만 넣고 스크롤 위치(offset)에 맞춰 다시 채운다.
+    정렬 / 필터는 행 번호 목록(view)만 바꾸므로 100만 행에서도 렌더링 비용은 일정하다.
+    텍스트 필터와 검색(show_matches)은 FindingIndex 역색인을 사용한다.
+    """
+
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.rows: List[Row] = []
+        self.view: List[int] = []          # 필터 / 정렬된 행 번호
+        self.offset = 0                    # view에서 첫 번째로 보이는 위치
+        self.visible = 30                  # 보이는 행 수 (<Configure>에서 갱신)
+        self.sort_column: Optional[str] = None
+        self.sort_reverse = False
+        self.index: Optional[FindingIndex] = None
+        self.matches: Optional[Set[int]] = None  # 검색 결과 행 번호 (None이면 제한 없음)
+
+        # 필터 바
+        filter_frame = ttk.Frame(self)
+        filter_frame.pack(fill=tk.X, pady=(0, 5))
+
+        ttk.Label(filter_frame, text="필터:").pack(side=tk.LEFT, padx=(0, 5))
+        self.filter_text = tk.StringVar()
+        filter_entry = ttk.Entry(filter_frame, textvariable=self.filter_text, width=30)
+        filter_entry.pack(side=tk.LEFT, padx=(0, 5))
+        filter_entry.bind('<Return>', lambda e: self.apply_filter())
+
+        self.category = tk.StringVar(value=ALL_CATEGORIES)
+        self.category_box = ttk.Combobox(filter_frame, textvariable=self.category, state='readonly', width=32,
+                                         values=[ALL_CATEGORIES])
+        self.category_box.pack(side=tk.LEFT, padx=(0, 5))
+        self.category_box.bind('<<ComboboxSelected>>', lambda e: self.apply_filter())
+
+        tk.Button(filter_frame, text="적용", command=self.apply_filter,
+                  bg='#0066ff', fg='#ffffff', font=('Segoe UI', 9),
+                  cursor='hand2').pack(side=tk.LEFT, padx=(0, 5))
+
+        self.count_label = tk.Label(filter_frame, text="", bg='#1a1a1a', fg='#00ff00')
+        self.count_label.pack(side=tk.RIGHT)
+
+        # 테이블 + 가상 스크롤바
+        table_frame = ttk.Frame(self)
+        table_frame.pack(fill=tk.BOTH, expand=True)
+
+        self.tree = ttk.Treeview(table_frame, columns=COLUMNS, show='headings', selectmode='browse')
+        for column in COLUMNS:
+            self.tree.heading(column, text=HEADINGS[column], command=lambda c=column: self.sort_by(c))
+            self.tree.column(column, width=WIDTHS[column], stretch=column in ('item', 'details'),
+                             anchor=tk.E if column == 'no' else tk.W)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self._on_scroll)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.tree.bind('<Configure>', self._on_resize)
+        self.tree.bind('<MouseWheel>', lambda e: self.scroll_by(-3 if e.delta > 0 else 3))
+        self.tree.bind('<Button-4>', lambda e: self.scroll_by(-3))
+        self.tree.bind('<Button-5>', lambda e: self.scroll_by(3))
+        self.tree.bind('<Prior>', lambda e: self.scroll_by(-self.visible))
+        self.tree.bind('<Next>', lambda e: self.scroll_by(self.visible))
+        self.tree.bind('<Double-1>', self._show_record)
+
+    def set_rows(self, rows: List[Row], index: Optional[FindingIndex] = None):
+        """표시할 행 교체 (필터 / 정렬 / 검색 초기화)
+
+        index는 rows로 만든 역색인 (없으면 첫 텍스트 필터 때 생성)
+        """
+        self.rows = rows
+        self.index = index
+        self.matches = None
+        self.sort_column = None
+        self.sort_reverse = False
+
+        categories = sorted({ARTIFACT_LABELS.get(key, key) for key, _, _ in rows})
+        self.category_box.config(values=[ALL_CATEGORIES] + categories)
+        self.category.set(ALL_CATEGORIES)
+        self.filter_text.set("")
+        self.apply_filter()
+
+    def clear(self):
+        """모든 행 제거"""
+        self.set_rows([])
+
+    def apply_filter(self):
+        """카테고리 / 텍스트 필터 적용 (현재 정렬 유지)"""
+        query = self.filter_text.get().strip().lower()
+        category = self.category.get()
+
+        keys = None
+        if category != ALL_CATEGORIES:
+            keys = {key for key in ARTIFACT_LABELS if ARTIFACT_LABELS[key] == category} or {category}
+
+        matches = self.matches
+        if query:
+            if self.index is None:
+                self.index = FindingIndex(self.rows)
+            found = set(self.index.search(query))
+            matches = found if matches is None else matches & found
+
+        self.view = [index for index, row in enumerate(self.rows)
+                     if (keys is None or row[0] in keys)
+                     and (matches is None or index in matches)]
+        if self.sort_column:
+            self._sort_view()
+        self.offset = 0
+        self.render()
+
+    def show_matches(self, ids: Optional[List[int]]):
+        """검색 결과 행만 표시하고 첫 행으로 이동 (None이면 검색 해제)"""
+        self.matches = None if ids is None else set(ids)
+        self.apply_filter()
+        if self.view:
+            first = str(self.view[0])
+            self.tree.selection_set(first)
+            self.tree.focus(first)
+
+    def sort_by(self, column: str):
+        """열 머리글 클릭 - 같은 열이면 방향 전환"""
+        if self.sort_column == column:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_column = column
+            self.sort_reverse = False
+        self._sort_view()
+        self.offset = 0
+        self.render()
+
+    def _sort_view(self):
+        column = self.sort_column
+        rows = self.rows
+        if column == 'no':
+            key = None
+        elif column == 'category':
+            key = lambda index: rows[index][0]
+        elif column == 'source':
+            key = lambda index: rows[index][1]
+        elif column == 'time':
+            key = lambda index: _first(rows[index][2], TIME_FIELDS)[1]
+        elif column == 'item':
+            key = lambda index: _first(rows[index][2], ITEM_FIELDS)[1]
+        else:
+            key = lambda index: format_row(rows[index])[4]
+        self.view.sort(key=key, reverse=self.sort_reverse)
+
+    def scroll_by(self, delta: int):
+        """delta 행만큼 스크롤"""
+        self.scroll_to(self.offset + delta)
+        return 'break'
+
+    def scroll_to(self, offset: int):
+        """view의 offset 위치가 맨 위에 오도록 스크롤"""
+        offset = max(0, min(offset, len(self.view) - self.visible))
+        if offset != self.offset:
+            self.offset = offset
+            self.render()
+
+    def _on_scroll(self, *args):
+        """스크롤바 명령 (moveto fraction / scroll n units|pages)"""
+        if args[0] == 'moveto':
+            self.scroll_to(int(float(args[1]) * len(self.view)))
+        elif args[0] == 'scroll':
+            step = self.visible if args[2] == 'pages' else 1
+            self.scroll_by(int(args[1]) * step)
+
+    def _on_resize(self, event):
+        row_height = int(ttk.Style().lookup('Treeview', 'rowheight') or 20)
+        visible = max(1, (event.height - row_height) // row_height)  # 머리글 한 줄 제외
+        if visible != self.visible:
+            self.visible = visible
+            self.scroll_to(self.offset)
+            self.render()
+
+    def render(self):
+        """보이는 행만 Treeview에 채움"""
+        self.tree.delete(*self.tree.get_children())
+        end = min(self.offset + self.visible, len(self.view))
+        for position in range(self.offset, end):
+            index = self.view[position]
+            self.tree.insert('', tk.END, iid=str(index), values=(index + 1,) + format_row(self.rows[index]))
+
+        total = len(self.view)
+        if total:
+            self.scrollbar.set(self.offset / total, end / total)
+        else:
+            self.scrollbar.set(0, 1)
+        self.count_label.config(text=f"{total:,} / {len(self.rows):,}행")
+
+    def _show_record(self, event):
+        """더블클릭 - 원본 레코드 전체 보기"""
+        selection = self.tree.selection()
+        if not selection:
+            return
+        key, source, record = self.rows[int(selection[0])]
+
+        window = tk.Toplevel(self)
+        window.title(f"{ARTIFACT_LABELS.get(key, key)} - {source}")
+        window.geometry("700x500")
+        text = scrolledtext.ScrolledText(window, wrap=tk.WORD, bg='#0a0a0a', fg='#00ff00',
+                                         font=('Consolas', 10))
+        text.pack(fill=tk.BOTH, expand=True)
+        text.insert('1.0', json.dumps(record, indent=2, ensure_ascii=False, default=str))
+        text.config(state=tk.DISABLED)
@@ -6,19 +6,11 @@ AI 기반 포렌식 분석 및 전체 상세 출력 지원
 
 사용법:
     python3 main.py
+    python3 -m registry_analyzer analyze <hive> ...   (GUI 없이 분석, registry_analyzer.py 참고)
 """
 
 import tkinter as tk
-import sys
-import os
-
-# AI API 클라이언트 자동 설치
-try:
-    import requests
-except ImportError:
-    print("Installing required packages...")
-    os.system(f"{sys.executable} -m pip install requests")
-    import requests
+import multiprocessing
 
 # 모듈 import
 from gui.main_window import RegistryForensicGUI
@@ -32,4 +24,5 @@ def main():
 
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()  # 실행 파일(PyInstaller)에서 분석 워커 프로세스 지원
     main()
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Windows Registry Forensic Analyzer v4.0
+GUI 없는 명령행 실행 파일 - tkinter / AI 클라이언트를 import하지 않음
+
+사용법:
+    python3 -m registry_analyzer analyze SYSTEM                      (단일 하이브, JSON을 표준 출력으로)
+    python3 -m registry_analyzer analyze SYSTEM SOFTWARE NTUSER.DAT  (Multi-Hive 상관관계 / 타임라인)
+    python3 -m registry_analyzer analyze SYSTEM -w 4 -a shimcache,services_detailed -f csv -o out.csv
+    python3 -m registry_analyzer ingest ./triage -o groups.jsonl     (수집 폴더 - 호스트 / 사용자별 분석)
+    python3 -m registry_analyzer list                                (분석 모듈 목록)
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# 분석 모듈 / 파서는 인자 처리가 끝난 뒤 실제로 분석할 때 import (시작 시간 최소화)
+
+
+def log(args, message: str):
+    """진행 메시지 (표준 에러, --quiet이면 생략)"""
+    if not args.quiet:
+        print(message, file=sys.stderr)
+
+
+def parse_analyzers(value: Optional[str]) -> Optional[List[str]]:
+    """--analyzers 값 (쉼표 구분 결과 키) 확인"""
+    if not value:
+        return None
+    from analyzers.manifest import ANALYZER_MANIFEST
+    names = [name.strip() for name in value.split(',') if name.strip()]
+    unknown = [name for name in names if name not in ANALYZER_MANIFEST]
+    if unknown:
+        raise ValueError(f"unknown analyzer(s): {', '.join(unknown)} (see 'list')")
+    return names
+
+
+def open_cache(args):
+    """결과 캐시 (--no-cache이면 None)"""
+    if args.no_cache:
+        return None
+    from utils.result_cache import ResultCache
+    return ResultCache(args.cache) if args.cache else ResultCache()
+
+
+def analyze_single(args, only: Optional[List[str]]) -> Dict:
+    """하이브 하나 분석 - GUI 단일 분석 결과와 같은 구조 (AI 분석 제외)"""
+    from core.registry_parser import RegistryParser
+    from analyzers.forensics_analyzer import ForensicsAnalyzer
+
+    file_path = args.hives[0]
+    with RegistryParser.open(file_path) as parser:
+        parser.scan_workers = args.workers
+        if not parser.validate_hive():
+            log(args, f"warning: {file_path}: missing 'regf' signature")
+
+        hive_type = args.type or parser.detect_hive_type()
+        log(args, f"{os.path.basename(file_path)}: {hive_type}")
+
+        analyzer = ForensicsAnalyzer(parser, hive_type, open_cache(args), only)
+        total = len(analyzer.scheduled)
+        done = []
+
+        def on_analyzer_done(name, count):
+            done.append(name)
+            log(args, f"  [{len(done)}/{total}] {name}: {count}")
+
+        raw_findings = analyzer.run_analyzers(max_workers=args.workers, on_analyzer_done=on_analyzer_done)
+
+        return {
+            'file_name': os.path.basename(file_path),
+            'file_size': parser.size,
+            'hive_type': hive_type,
+            'analysis_date': datetime.now().isoformat(),
+            'raw_findings': raw_findings,
+            'skipped_analyzers': analyzer.skipped
+        }
+
+
+def analyze_multi(args, only: Optional[List[str]]) -> Dict:
+    """여러 하이브 분석 - 상관관계 / 타임라인 / 요약 및 하이브별 findings"""
+    from analyzers.multi_hive_analyzer import MultiHiveAnalyzer
+
+    analyzer = MultiHiveAnalyzer(cache=open_cache(args), only=only, suffix_match=args.suffix_match)
+    total = len(args.hives)
+    done = []
+
+    def on_hive_done(status):
+        done.append(status)
+        name = os.path.basename(status['file_path'])
+        if status['success']:
+            log(args, f"  [{len(done)}/{total}] {name}: {status['hive_type']}")
+        else:
+            log(args, f"  [{len(done)}/{total}] {name}: failed - {status['error']}")
+
+    try:
+        statuses = analyzer.add_hives(args.hives, max_workers=args.workers, on_hive_done=on_hive_done)
+        if not analyzer.hives:
+            raise RuntimeError("no hive could be loaded")
+
+        timeline = analyzer.build_timeline()
+        return {
+            'type': 'multi-hive',
+            'analysis_date': datetime.now().isoformat(),
+            'loaded_hives': [(os.path.basename(status['file_path']), status['hive_type'])
+                             for status in statuses if status['success']],
+            'failed_hives': [{'file_path': status['file_path'], 'error': status['error']}
+                             for status in statuses if not status['success']],
+            'correlations': analyzer.correlations,
+            'timeline': timeline,
+            'summary': analyzer.get_summary(),
+            'hives': {hive_type: {'file_path': hive['file_path'],
+                                  'findings': hive['findings'],
+                                  'skipped_analyzers': hive['skipped']}
+                      for hive_type, hive in analyzer.hives.items()}
+        }
+    finally:
+        analyzer.close()
+
+
+def cmd_analyze(args) -> int:
+    """analyze 명령"""
+    if args.workers < 1:
+        print("error: --workers must be at least 1", file=sys.stderr)
+        return 2
+    if args.type and len(args.hives) > 1:
+        print("error: --type applies to a single hive only (multi-hive types are detected)", file=sys.stderr)
+        return 2
+    try:
+        only = parse_analyzers(args.analyzers)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+    try:
+        if len(args.hives) == 1:
+            results = analyze_single(args, only)
+        else:
+            results = analyze_multi(args, only)
+    except Exception as e:
+        print(f"error: analysis failed: {e}", file=sys.stderr)
+        return 1
+
+    from utils.exporters import export_csv, export_json, write_csv, write_json
+    try:
+        if args.output:
+            (export_csv if args.format == 'csv' else export_json)(results, args.output)
+            log(args, f"Exported to {args.output}")
+        else:
+            (write_csv if args.format == 'csv' else write_json)(results, sys.stdout)
+            if args.format == 'json':
+                sys.stdout.write("\n")
+    except (OSError, ValueError) as e:
+        print(f"error: export failed: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_ingest(args) -> int:
+    """ingest 명령 - 수집 폴더의 하이브를 찾아 호스트 / 사용자별로 분석 (그룹당 JSON 한 줄)"""
+    import json
+    from analyzers.collection import analyze_groups, discover_hives, group_hives
+
+    if args.workers < 1:
+        print("error: --workers must be at least 1", file=sys.stderr)
+        return 2
+    if not os.path.isdir(args.root):
+        print(f"error: not a directory: {args.root}", file=sys.stderr)
+        return 2
+    try:
+        only = parse_analyzers(args.analyzers)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+    records = discover_hives(args.root, max_workers=args.workers,
+                             on_hive_found=lambda record: log(
+                                 args, f"  found {record['file_path']} ({record['hive_type']})"))
+    groups, unassigned = group_hives(records)
+    log(args, f"{len(records)} hive(s), {len(groups)} group(s)")
+    for record in unassigned:
+        log(args, f"  not grouped: {record['file_path']} - {record['reason']}")
+
+    def hive_entry(record: Dict) -> Dict:
+        return {key: record[key] for key in ('file_path', 'hive_type', 'sha256', 'size')}
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        def emit(entry: Dict):
+            out.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+            out.flush()
+
+        if args.list_only:
+            for group in groups:
+                emit(dict(group, hives=[hive_entry(record) for record in group['hives']],
+                          duplicates=[record['file_path'] for record in group['duplicates']]))
+            return 0
+
+        for group, analyzer, statuses in analyze_groups(groups, max_workers=args.workers, cache=open_cache(args),
+                                                         only=only, suffix_match=args.suffix_match):
+            try:
+                timeline = analyzer.build_timeline()
+                log(args, f"  {group['host']} / {group['user'] or '-'}: {len(analyzer.hives)} hive(s), "
+                          f"{len(analyzer.correlations)} correlation(s)")
+                emit({
+                    'host': group['host'],
+                    'user': group['user'],
+                    'volume_root': group['volume_root'],
+                    'hives': [dict(hive_entry(record), success=status['success'], error=status['error'])
+                              for record, status in zip(group['hives'], statuses)],
+                    'duplicates': [record['file_path'] for record in group['duplicates']],
+                    'correlations': analyzer.correlations,
+                    'timeline': timeline,
+                    'summary': analyzer.get_summary()
+                })
+            finally:
+                analyzer.close()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+def cmd_list(args) -> int:
+    """list 명령 - 분석 모듈 결과 키 / 적용 하이브 / 비용 등급"""
+    from analyzers.manifest import ANALYZER_MANIFEST
+    for name, entry in ANALYZER_MANIFEST.items():
+        print(f"{name:<20} {entry['cost']:<7} {', '.join(entry['hive_types'])}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='registry_analyzer',
+        description='Windows Registry Forensic Analyzer v4.0 (headless)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    analyze = commands.add_parser('analyze', help='analyze one hive, or correlate several hives')
+    analyze.add_argument('hives', nargs='+', metavar='HIVE', help='registry hive file(s)')
+    analyze.add_argument('-t', '--type', help='hive type for a single hive (default: detect)')
+    analyze.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 1,
+                         help='worker processes (default: CPU count, 1 = serial)')
+    analyze.add_argument('-a', '--analyzers', metavar='NAMES',
+                         help="comma-separated analyzer keys to run (default: all applicable, see 'list')")
+    analyze.add_argument('-f', '--format', choices=('json', 'csv'), default='json', help='output format')
+    analyze.add_argument('-o', '--output', help='output file (default: stdout)')
+    analyze.add_argument('--cache', metavar='PATH', help='result cache file (default: ~/.registry_analyzer)')
+    analyze.add_argument('--no-cache', action='store_true', help='do not read or write the result cache')
+    analyze.add_argument('--suffix-match', action='store_true',
+                         help='also correlate ShimCache/Amcache by path suffix when no file name matches')
+    analyze.add_argument('-q', '--quiet', action='store_true', help='no progress output on stderr')
+    analyze.set_defaults(func=cmd_analyze)
+
+    ingest = commands.add_parser('ingest', help='find hives in a collection folder and analyze them per host / user')
+    ingest.add_argument('root', metavar='DIR', help='triage collection or volume folder')
+    ingest.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 1,
+                        help='worker threads / processes (default: CPU count, 1 = serial)')
+    ingest.add_argument('-a', '--analyzers', metavar='NAMES',
+                        help="comma-separated analyzer keys to run (default: all applicable, see 'list')")
+    ingest.add_argument('-o', '--output', help='JSON Lines output file, one group per line (default: stdout)')
+    ingest.add_argument('--list-only', action='store_true', help='only discover and group hives, do not analyze')
+    ingest.add_argument('--cache', metavar='PATH', help='result cache file (default: ~/.registry_analyzer)')
+    ingest.add_argument('--no-cache', action='store_true', help='do not read or write the result cache')
+    ingest.add_argument('--suffix-match', action='store_true',
+                        help='also correlate ShimCache/Amcache by path suffix when no file name matches')
+    ingest.add_argument('-q', '--quiet', action='store_true', help='no progress output on stderr')
+    ingest.set_defaults(func=cmd_ingest)
+
+    list_cmd = commands.add_parser('list', help='list analyzers')
+    list_cmd.set_defaults(func=cmd_list)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 진입점"""
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except KeyboardInterrupt:
+        print("interrupted", file=sys.stderr)
+        return 130
+
+
+if __name__ == '__main__':
+    if getattr(sys, 'frozen', False):
+        import multiprocessing
+        multiprocessing.freeze_support()  # 실행 파일(PyInstaller)에서 분석 워커 프로세스 지원
+    sys.exit(main())
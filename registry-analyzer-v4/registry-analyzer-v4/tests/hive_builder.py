@@ -0,0 +1,158 @@
+"""
+Hive Builder - 테스트용 합성 regf 하이브 생성 (베이스 블록 + hbin 하나)
+"""
+
+import struct
+from typing import Dict, List, Sequence, Tuple
+
+REG_SZ = 1
+REG_EXPAND_SZ = 2
+REG_BINARY = 3
+REG_DWORD = 4
+REG_MULTI_SZ = 7
+REG_QWORD = 11
+
+DEFAULT_FILETIME = 132000000000000000  # 2019-04-12
+BIG_DATA_SEGMENT_SIZE = 16344
+
+# 하이브 타입 판별에 쓰이는 루트 키 1단계 하위 키 (core.registry_parser.HIVE_ROOT_SUBKEYS와 같은 이름)
+ROOT_SUBKEYS = {
+    'SYSTEM': ('ControlSet001', 'Select', 'MountedDevices', 'Setup'),
+    'SOFTWARE': ('Microsoft', 'Classes', 'Clients', 'Policies', 'RegisteredApplications'),
+    'NTUSER.DAT': ('Software', 'Control Panel', 'Environment', 'Keyboard Layout', 'AppEvents'),
+    'SAM': ('SAM',),
+    'Amcache.hve': ('Root',),
+}
+
+
+def sz(text: str) -> bytes:
+    """REG_SZ 데이터 (UTF-16 LE, 널 종료)"""
+    return text.encode('utf-16-le') + b'\x00\x00'
+
+
+def value(name: str, data_type: int, data: bytes) -> Tuple[str, int, bytes]:
+    return (name, data_type, data)
+
+
+def key(name: str, *subkeys: Dict, values: Sequence[Tuple[str, int, bytes]] = (),
+        timestamp: int = DEFAULT_FILETIME, list_kind: str = 'lh') -> Dict:
+    """키 선언 - list_kind: 하위 키 목록 셀 종류 ('lh' / 'lf' / 'li' / 'ri')"""
+    return {'name': name, 'subkeys': list(subkeys), 'values': list(values),
+            'timestamp': timestamp, 'list_kind': list_kind}
+
+
+def _lh_hash(name: str) -> int:
+    result = 0
+    for char in name.upper():
+        result = (result * 37 + ord(char)) & 0xFFFFFFFF
+    return result
+
+
+class _Cells:
+    """hbin 셀 할당 (오프셋은 hbin 데이터 시작 기준)"""
+
+    def __init__(self):
+        self.buf = bytearray(32)  # hbin 헤더 자리
+        desc = b'\x01\x00\x04\x80' + b'\x00' * 16
+        self.security = self.alloc(b'sk' + struct.pack('<HIIII', 0, 0, 0, 1, len(desc)) + desc)
+
+    def alloc(self, payload: bytes) -> int:
+        size = (len(payload) + 4 + 7) & ~7
+        offset = len(self.buf)
+        self.buf += struct.pack('<i', -size) + payload + b'\x00' * (size - 4 - len(payload))
+        return offset
+
+    def value(self, name: str, data_type: int, data: bytes) -> int:
+        if len(data) <= 4:
+            size = len(data) | 0x80000000  # 값 셀 안에 직접 저장
+            data_offset = struct.unpack('<I', data.ljust(4, b'\x00'))[0]
+        elif len(data) > BIG_DATA_SEGMENT_SIZE:
+            segments = [self.alloc(data[i:i + BIG_DATA_SEGMENT_SIZE])
+                        for i in range(0, len(data), BIG_DATA_SEGMENT_SIZE)]
+            segment_list = self.alloc(b''.join(struct.pack('<I', s) for s in segments))
+            data_offset = self.alloc(b'db' + struct.pack('<HI', len(segments), segment_list))
+            size = len(data)
+        else:
+            data_offset = self.alloc(data)
+            size = len(data)
+        raw_name = name.encode('latin-1')
+        return self.alloc(b'vk' + struct.pack('<HIIIHH', len(raw_name), size, data_offset, data_type,
+                                              1 if name else 0, 0) + raw_name)
+
+    def _subkey_list(self, entries: List[Tuple[int, str]], kind: str) -> int:
+        entries = sorted(entries, key=lambda entry: entry[1].upper())
+        if kind == 'lh':
+            return self.alloc(b'lh' + struct.pack('<H', len(entries)) + b''.join(
+                struct.pack('<II', offset, _lh_hash(name)) for offset, name in entries))
+        if kind == 'lf':
+            return self.alloc(b'lf' + struct.pack('<H', len(entries)) + b''.join(
+                struct.pack('<I', offset) + name.encode('latin-1')[:4].ljust(4, b'\x00')
+                for offset, name in entries))
+        if kind == 'li':
+            return self.alloc(b'li' + struct.pack('<H', len(entries)) + b''.join(
+                struct.pack('<I', offset) for offset, _ in entries))
+        # 'ri': li / lh 목록 두 개로 나눔
+        half = max(len(entries) // 2, 1)
+        lists = [self._subkey_list(entries[:half], 'li')]
+        if entries[half:]:
+            lists.append(self._subkey_list(entries[half:], 'lh'))
+        return self.alloc(b'ri' + struct.pack('<H', len(lists)) + b''.join(struct.pack('<I', o) for o in lists))
+
+    def key(self, spec: Dict, root: bool = False) -> int:
+        children = [(self.key(child), child['name']) for child in spec['subkeys']]
+        subkey_list = self._subkey_list(children, spec['list_kind']) if children else 0xFFFFFFFF
+        value_offsets = [self.value(*item) for item in spec['values']]
+        value_list = (self.alloc(b''.join(struct.pack('<I', o) for o in value_offsets))
+                      if value_offsets else 0xFFFFFFFF)
+        raw_name = spec['name'].encode('latin-1')
+        header = b'nk' + struct.pack('<HQII', 0x20 | (0x04 if root else 0), spec['timestamp'], 0, 0xFFFFFFFF)
+        header += struct.pack('<IIII', len(children), 0, subkey_list, 0xFFFFFFFF)
+        header += struct.pack('<III', len(value_offsets), value_list, self.security)
+        header += struct.pack('<IIIIII', 0xFFFFFFFF, 0, 0, 0, 0, 0)
+        header += struct.pack('<HH', len(raw_name), 0) + raw_name
+        return self.alloc(header)
+
+
+def _hbin(payload: bytes, relative_offset: int) -> bytearray:
+    """hbin 블록 (헤더 + payload, 남는 공간은 해제된 셀, 0x1000 배수 크기)"""
+    data = bytearray(32) + payload
+    padding = -len(data) % 0x1000
+    if padding:
+        data += struct.pack('<i', padding) + b'\x00' * (padding - 4)
+    data[0:32] = b'hbin' + struct.pack('<III', relative_offset, len(data), 0) + b'\x00' * 16
+    return data
+
+
+def build_hive(root: Dict, file_name: str = '', extra: bytes = b'', extra_hbins: Sequence[bytes] = ()) -> bytes:
+    """루트 키 선언으로 하이브 바이트 생성
+
+    Args:
+        root: key()로 만든 루트 키
+        file_name: 베이스 블록에 기록할 파일 이름 (빈 문자열이면 기록하지 않음)
+        extra: 셀 뒤 (첫 hbin 안)에 그대로 붙일 바이트 - 패턴 검색 분석 모듈용 원시 데이터
+        extra_hbins: 뒤에 이어 붙일 hbin마다의 원시 바이트 (hbin 경계 청크 스캔용)
+    """
+    cells = _Cells()
+    root_offset = cells.key(root, root=True)
+    data = _hbin(bytes(cells.buf[32:]) + extra, 0)
+    for payload in extra_hbins:
+        data += _hbin(payload, len(data))
+
+    base = bytearray(0x1000)
+    base[0:4] = b'regf'
+    struct.pack_into('<IIQIIIIIII', base, 4, 1, 1, DEFAULT_FILETIME, 1, 5, 0, 1, root_offset, len(data), 1)
+    if file_name:
+        embedded = ('\\SystemRoot\\System32\\Config\\' + file_name).encode('utf-16-le')[-64:]
+        base[0x30:0x30 + len(embedded)] = embedded
+    checksum = 0
+    for (dword,) in struct.iter_unpack('<I', bytes(base[:508])):
+        checksum ^= dword
+    struct.pack_into('<I', base, 508, checksum)
+    return bytes(base) + bytes(data)
+
+
+def typed_hive(hive_type: str, extra: bytes = b'', *subkeys: Dict, extra_hbins: Sequence[bytes] = ()) -> bytes:
+    """hive_type 루트 하위 키 (+ 추가 키)를 가진 하이브 - 이름 없이 루트 키만으로 타입 감지"""
+    tops = {child['name']: child for child in subkeys}
+    children = [tops.pop(name, None) or key(name) for name in ROOT_SUBKEYS[hive_type]] + list(tops.values())
+    return build_hive(key('ROOT', *children), extra=extra, extra_hbins=extra_hbins)
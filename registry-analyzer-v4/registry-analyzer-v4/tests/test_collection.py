@@ -0,0 +1,44 @@
+"""수집 폴더 하이브 탐색 / 그룹 분석 테스트"""
+
+from analyzers.collection import analyze_groups, discover_hives, group_hives
+from hive_builder import typed_hive
+
+EXECUTED = b'\x00' * 4 + b'C:\\Tools\\calc.exe' + b'\x00' * 4
+
+
+def _collection(root):
+    hives = {
+        ('Windows', 'System32', 'config', 'SYSTEM'): typed_hive('SYSTEM', EXECUTED),
+        ('Windows', 'System32', 'config', 'SOFTWARE'): typed_hive('SOFTWARE'),
+        ('Windows', 'AppCompat', 'Programs', 'Amcache.hve'): typed_hive('Amcache.hve', EXECUTED),
+        ('Users', 'alice', 'NTUSER.DAT'): typed_hive('NTUSER.DAT'),
+        ('Users', 'bob', 'NTUSER.DAT'): typed_hive('NTUSER.DAT', b'bob'),
+    }
+    for parts, data in hives.items():
+        path = root.joinpath('HOST1', 'C', *parts)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+
+def _analyze(groups, workers):
+    results = []
+    for group, analyzer, statuses in analyze_groups(groups, max_workers=workers):
+        try:
+            results.append((group['user'], [status['hive_type'] for status in statuses], analyzer.correlations))
+        finally:
+            analyzer.close()
+    return sorted(results, key=lambda result: result[0])
+
+
+def test_collection_groups_analyze_the_same_in_a_process_pool(tmp_path, capfd):
+    _collection(tmp_path)
+    groups, unassigned = group_hives(discover_hives(str(tmp_path), max_workers=2))
+    assert not unassigned
+    assert [(group['host'], group['user']) for group in groups] == [('HOST1', 'alice'), ('HOST1', 'bob')]
+
+    serial = _analyze(groups, 1)
+    assert serial == _analyze(groups, 3)
+    assert 'unavailable' not in capfd.readouterr().err  # 프로세스 풀에서 실행됨
+    for user, hive_types, correlations in serial:
+        assert hive_types == ['SYSTEM', 'SOFTWARE', 'Amcache.hve', 'NTUSER.DAT']
+        assert [c['program'] for c in correlations if c['type'] == 'ShimCache-Amcache Match'] == ['calc.exe']
@@ -0,0 +1,147 @@
+"""CorrelationEngine 테스트 - detect_hive_type이 돌려주는 하이브 타입으로 상관관계 실행"""
+
+import pytest
+
+from analyzers.correlation_engine import CorrelationEngine
+from analyzers.correlations import CORRELATIONS, required_hives
+from analyzers.forensics_analyzer import ForensicsAnalyzer
+from analyzers.manifest import is_applicable
+from analyzers.multi_hive_analyzer import MultiHiveAnalyzer
+from core.registry_parser import HIVE_ROOT_SUBKEYS, RegistryParser
+from hive_builder import typed_hive
+
+
+def _detected(hive_type: str) -> str:
+    detected = RegistryParser(typed_hive(hive_type)).detect_hive_type()
+    assert detected == hive_type
+    return detected
+
+
+def _sources(spec):
+    for source in spec['sources'].values():
+        yield from ([source] if isinstance(source[0], str) else source)
+
+
+@pytest.mark.parametrize('spec', CORRELATIONS, ids=lambda spec: spec['name'])
+def test_sources_use_detected_hive_types_the_manifest_runs_on(spec):
+    for hive_type, artifact in _sources(spec):
+        assert hive_type in HIVE_ROOT_SUBKEYS
+        assert is_applicable(artifact, hive_type), (hive_type, artifact)
+
+
+def _findings():
+    return {
+        _detected('SYSTEM'): {'findings': {
+            'shimcache': [{'path': 'C:\\Windows\\System32\\notepad.exe', 'timestamp': '2024-01-02'}],
+            'prefetch': [{'program': 'NOTEPAD.EXE', 'timestamp': '2024-01-03', 'runCount': 4}],
+            'bam_dam': [{'path': '\\Device\\HarddiskVolume3\\Windows\\System32\\notepad.exe',
+                         'timestamp': '2024-01-04'}],
+        }},
+        _detected('Amcache.hve'): {'findings': {
+            'amcache': [{'programName': 'notepad.exe', 'timestamp': '2024-01-01', 'sha1': 'AB' * 20}],
+        }},
+        _detected('NTUSER.DAT'): {'findings': {
+            'userassist': [{'program': 'notepad.exe', 'lastExecuted': '2024-01-05', 'runCount': 2}],
+            'run_keys': [{'name': 'Sync', 'command': 'C:\\Program Files\\SyncTool\\sync.exe /min'}],
+        }},
+        _detected('SOFTWARE'): {'findings': {
+            'installed_software': [{'displayName': 'SyncTool', 'publisher': 'Sync Inc.'},
+                                   {'displayName': '', 'publisher': 'Unnamed', 'installLocation': ''}],
+        }},
+    }
+
+
+def _run_all(engine, hives):
+    return {spec['name']: engine.run(spec['name'], hives) for spec in CORRELATIONS}
+
+
+def test_engine_correlates_detected_hive_types():
+    results = _run_all(CorrelationEngine(CORRELATIONS), _findings())
+
+    assert [(m['program'], m['path']) for m in results['shimcache_amcache']] == \
+        [('notepad.exe', 'C:\\Windows\\System32\\notepad.exe')]
+    (activity,) = results['user_activity']
+    assert activity['program'] == 'notepad.exe'
+    assert sorted(activity['sources']) == ['BAM/DAM', 'Prefetch', 'UserAssist']
+    assert activity['total_run_count'] == 6 and activity['confidence'] == 'HIGH'
+    (autorun,) = results['autorun_software']
+    assert autorun['matches'] == [{'autorun_program': 'Sync', 'autorun_path': 'C:\\Program Files\\SyncTool\\sync.exe /min',
+                                   'installed_software': 'SyncTool', 'publisher': 'Sync Inc.', 'install_date': None}]
+
+
+def test_empty_display_names_do_not_match_every_autorun():
+    hives = {'SOFTWARE': {'findings': {
+        'run_keys': [{'name': 'Run', 'command': 'C:\\Tools\\agent.exe'}],
+        'installed_software': [{'displayName': ''}, {'displayName': None, 'installLocation': ''}, {}],
+    }}}
+    assert CorrelationEngine(CORRELATIONS).run('autorun_software', hives) == []
+
+
+def test_engine_accepts_hive_type_aliases():
+    aliases = {'SYSTEM': 'system', 'Amcache.hve': 'AMCACHE', 'NTUSER.DAT': 'NTUSER', 'SOFTWARE': 'SOFTWARE'}
+    hives = {aliases[hive_type]: hive for hive_type, hive in _findings().items()}
+    assert _run_all(CorrelationEngine(CORRELATIONS), hives) == _run_all(CorrelationEngine(CORRELATIONS), _findings())
+
+
+def test_ready_correlators_wait_for_pending_detected_types():
+    analyzer = MultiHiveAnalyzer()
+    hives = _findings()
+    ntuser = hives.pop('NTUSER.DAT')
+    analyzer.hives = hives
+    done = {}
+    analyzer._run_ready_correlators(done, ['NTUSER.DAT'])
+    waiting = {name for name, required in analyzer.CORRELATORS if 'NTUSER.DAT' in required}
+    assert waiting == {'user_activity', 'usb_usage', 'autorun_software'}
+    assert waiting.isdisjoint(done) and 'shimcache_amcache' in done
+
+    analyzer.hives['NTUSER.DAT'] = ntuser
+    analyzer._run_ready_correlators(done, [])
+    assert set(done) == {spec['name'] for spec in CORRELATIONS}
+    assert done['user_activity'][0]['source_count'] == 3
+
+
+def test_required_hives_follow_declaration_order():
+    spec = next(spec for spec in CORRELATIONS if spec['name'] == 'user_activity')
+    assert required_hives(spec) == ['NTUSER.DAT', 'SYSTEM']
+
+
+# ---- shimcache_amcache: 파일명 해시 조인 vs 이전 중첩 루프 ----
+
+def _executables(paths):
+    return b''.join(b'\x00' * 8 + path.encode('ascii') + b'\x00' * 9 for path in paths)
+
+
+def _analyzed(hive_type: str, name: str, paths) -> list:
+    parser = RegistryParser(typed_hive(hive_type, _executables(paths)))
+    return ForensicsAnalyzer(parser, parser.detect_hive_type(), only=[name]).run_analyzers()[name]
+
+
+def _nested_loop_matches(shimcache, amcache):
+    """user-023 이전 구현 - Amcache 프로그램 이름이 ShimCache 경로에 포함되면 일치"""
+    shimcache_map = {item['path'].lower(): item for item in shimcache}
+    matches = []
+    for am_item in amcache:
+        program_name = am_item.get('programName', '').lower()
+        for sc_path, sc_item in shimcache_map.items():
+            if program_name in sc_path or program_name.replace('.exe', '') in sc_path:
+                matches.append((am_item, sc_item))
+    return matches
+
+
+def test_shimcache_amcache_equals_nested_loop_on_exact_basenames():
+    shimcache = _analyzed('SYSTEM', 'shimcache', [
+        'C:\\Windows\\System32\\notepad.exe', 'C:\\Tools\\calc.exe', 'C:\\Program Files\\App\\app.exe',
+        'D:\\Portable\\notepad.exe', 'C:\\TOOLS\\CALC.EXE', 'C:\\Games\\notepad2.exe'])
+    amcache = _analyzed('Amcache.hve', 'amcache', [
+        'C:\\Windows\\System32\\notepad.exe', 'C:\\Tools\\calc.exe', 'C:\\Games\\pad.exe',
+        'C:\\Other\\note.exe', 'E:\\app.exe'])
+    assert len(shimcache) == 5 and len(amcache) == 5
+
+    hives = {'SYSTEM': {'findings': {'shimcache': shimcache}}, 'Amcache.hve': {'findings': {'amcache': amcache}}}
+    joined = [(m['program'], m['path']) for m in CorrelationEngine(CORRELATIONS).run('shimcache_amcache', hives)]
+
+    old = [(am['programName'], sc['path']) for am, sc in _nested_loop_matches(shimcache, amcache)]
+    exact = [(program, path) for program, path in old
+             if program.lower() == path.lower().rsplit('\\', 1)[-1]]
+    assert joined == exact
+    assert len(exact) == 4 and len(old) > len(exact)  # 부분 문자열만 겹치는 쌍 (note / pad / notepad2)은 제외
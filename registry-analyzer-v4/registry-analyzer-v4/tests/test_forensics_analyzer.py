@@ -0,0 +1,38 @@
+"""ForensicsAnalyzer 분석 모듈 테스트 (합성 하이브)"""
+
+import pytest
+
+from analyzers.forensics_analyzer import ForensicsAnalyzer
+from analyzers.manifest import ANALYZER_MANIFEST
+from core.registry_parser import RegistryParser
+from hive_builder import sz, typed_hive
+
+RECENT_DOCS = b'RecentDocs\x00\x00' + sz('report.pdf') + sz('notes.txt') + b'\x00' * 8
+
+
+@pytest.mark.parametrize('hive_type', ['NTUSER.DAT', 'UsrClass.dat', 'ntuser'])
+def test_recent_docs_reports_each_document_once(hive_type):
+    analyzer = ForensicsAnalyzer(RegistryParser(typed_hive('NTUSER.DAT', RECENT_DOCS)), hive_type, only=['recent_docs'])
+    documents = [record['document'] for record in analyzer.run_analyzers()['recent_docs']]
+    assert documents == ['report.pdf', 'notes.txt']
+
+
+Z = b'\x00' * 8
+NTUSER_ACTIVITY = (Z + b'C:\\Users\\alice\\Recent\\report.lnk\x00' + Z + b'C:\\Docs\\report.pdf\x00'
+                   + Z + b'RecentApps\x00' + Z + b'C:\\Program Files\\App\\app.exe\x00'
+                   + Z + b'AppPath\x00' + Z + b'D:\\Tools\\app.exe\x00' + Z + RECENT_DOCS)
+
+
+def test_iter_findings_matches_list_api():
+    analyzer = ForensicsAnalyzer(RegistryParser(typed_hive('NTUSER.DAT', NTUSER_ACTIVITY)), 'NTUSER.DAT')
+    streamed = {name: [] for name in analyzer.scheduled}
+    for name, record in analyzer.iter_findings():
+        streamed[name].append(record)
+
+    findings = analyzer.run_analyzers()
+    for name in analyzer.scheduled:
+        assert streamed[name] == findings[name], name
+        assert getattr(analyzer, ANALYZER_MANIFEST[name]['method'])() == findings[name], name
+    for name in ('recent_docs', 'lnk_files', 'recent_apps'):
+        assert findings[name], name
+    assert findings['lnk_files'][0]['lnkPath'].endswith('report.lnk')
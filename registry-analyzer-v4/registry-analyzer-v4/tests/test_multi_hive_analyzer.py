@@ -0,0 +1,55 @@
+"""MultiHiveAnalyzer 테스트 - 감지된 하이브 타입으로 상관관계 실행"""
+
+from analyzers.multi_hive_analyzer import MultiHiveAnalyzer
+from hive_builder import typed_hive
+
+# ShimCache / Amcache 분석 모듈이 '.exe' 앵커에서 읽는 ASCII 경로
+EXECUTED = b'\x00' * 4 + b'C:\\Tools\\calc.exe' + b'\x00' * 4
+
+
+def _write_hives(tmp_path, hives):
+    paths = []
+    for name, data in hives.items():
+        path = tmp_path / name
+        path.write_bytes(data)
+        paths.append(str(path))
+    return paths
+
+
+def test_shimcache_amcache_match_from_detected_hives(tmp_path):
+    paths = _write_hives(tmp_path, {
+        'SYSTEM': typed_hive('SYSTEM', EXECUTED),
+        'SOFTWARE': typed_hive('SOFTWARE'),
+        'Amcache.hve': typed_hive('Amcache.hve', EXECUTED),
+    })
+    analyzer = MultiHiveAnalyzer()
+    try:
+        statuses = analyzer.add_hives(paths, max_workers=1)
+        assert [status['hive_type'] for status in statuses] == ['SYSTEM', 'SOFTWARE', 'Amcache.hve']
+        assert analyzer.hives['Amcache.hve']['findings']['amcache']
+
+        matches = [c for c in analyzer.correlations if c['type'] == 'ShimCache-Amcache Match']
+        assert [(m['program'], m['path'], m['confidence']) for m in matches] == \
+            [('calc.exe', 'C:\\Tools\\calc.exe', 'HIGH')]
+        assert analyzer.find_correlations() == analyzer.correlations
+    finally:
+        analyzer.close()
+
+
+def test_add_hives_process_pool_matches_serial(tmp_path, capfd):
+    paths = _write_hives(tmp_path, {
+        'SYSTEM': typed_hive('SYSTEM', EXECUTED),
+        'NTUSER.DAT': typed_hive('NTUSER.DAT'),
+        'Amcache.hve': typed_hive('Amcache.hve', EXECUTED),
+    })
+    results = []
+    for workers in (1, 3):
+        analyzer = MultiHiveAnalyzer()
+        try:
+            statuses = analyzer.add_hives(paths, max_workers=workers)
+            results.append((statuses, analyzer.correlations,
+                            {hive_type: hive['findings'] for hive_type, hive in analyzer.hives.items()}))
+        finally:
+            analyzer.close()
+    assert results[0] == results[1]
+    assert results[0][1] and 'unavailable' not in capfd.readouterr().err  # 프로세스 풀에서 실행됨
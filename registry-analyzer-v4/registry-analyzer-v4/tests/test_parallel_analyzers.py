@@ -0,0 +1,31 @@
+"""분석 모듈 프로세스 병렬 실행 테스트 - spawn 풀 결과가 순차 실행과 같음"""
+
+from analyzers import parallel
+from analyzers.forensics_analyzer import ForensicsAnalyzer
+from analyzers.parallel import run_analyzers_parallel
+from core.process_pool import pool_context
+from core.registry_parser import RegistryParser
+from hive_builder import sz, typed_hive
+
+RECORDS = (b'\x00' * 8 + b'C:\\Tools\\calc.exe\x00' + b'\x00' * 8 + sz('C:\\Windows\\explorer.exe')
+           + b'ControlSet001\\Services\\' + b'ImagePath\x00' + b'TimeZoneInformation\x00' + b'VID_0781&PID_5567')
+
+
+def test_pool_context_is_spawn():
+    assert pool_context().get_start_method() == 'spawn'
+
+
+def test_parallel_analyzers_match_serial(tmp_path, monkeypatch, capfd):
+    path = tmp_path / 'SYSTEM'
+    path.write_bytes(typed_hive('SYSTEM', RECORDS * 50))
+    monkeypatch.setattr(parallel, 'PARALLEL_MIN_HIVE_SIZE', 0)
+
+    with RegistryParser.open(str(path)) as parser:
+        serial = ForensicsAnalyzer(parser, 'SYSTEM').run_analyzers()
+    with RegistryParser.open(str(path)) as parser:
+        done = []
+        findings = run_analyzers_parallel(ForensicsAnalyzer(parser, 'SYSTEM'), max_workers=2,
+                                          on_analyzer_done=lambda name, count: done.append(name))
+    assert findings == serial
+    assert 'unavailable' not in capfd.readouterr().err  # 순차 실행으로 넘어가지 않음
+    assert any(serial.values()) and sorted(done) == sorted(ForensicsAnalyzer(RegistryParser(b''), 'SYSTEM').scheduled)
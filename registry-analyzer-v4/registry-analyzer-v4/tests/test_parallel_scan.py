@@ -0,0 +1,76 @@
+"""hbin 청크 병렬 스캔 테스트 - 직렬 _scan과 같은 결과"""
+
+from core import parallel_scan
+from core.parallel_scan import plan_chunks, scan_parallel
+from core.pattern_scanner import PatternScanner
+from core.registry_parser import RegistryParser
+from hive_builder import sz, typed_hive
+
+PATTERNS = ['.exe', 'Run', 'RunOnce', 'Run'.encode('utf-16-le'), 'ControlSet']
+
+
+def _hive() -> bytes:
+    # 첫 hbin에는 경계 (0x1000 배수)에 걸치는 패턴, 뒤에는 크기가 다른 hbin 여러 개
+    unit = b'..Run' + sz('RunOnce') + b'C:\\a.exe' + b'RunOnc'
+    return typed_hive('SYSTEM', unit * 2000, extra_hbins=[unit * (100 * (i % 5 + 1)) for i in range(20)])
+
+
+def _serial(parser: RegistryParser, scanner: PatternScanner):
+    parser.scan_workers = 1
+    return parser._scan(scanner)
+
+
+def test_plan_chunks_cover_size_on_boundaries():
+    boundaries = list(range(0x1000, 0x100000, 0x1000))
+    chunks = plan_chunks(0x100000, boundaries, workers=3, min_chunk=0x8000)
+    assert chunks[0][0] == 0 and chunks[-1][1] == 0x100000
+    assert all(end == start for (_, end), (start, _) in zip(chunks, chunks[1:]))
+    assert all(start in boundaries for start, _ in chunks[1:])
+
+
+def test_scan_parallel_matches_serial_scan(tmp_path):
+    data = _hive()
+    path = tmp_path / 'SYSTEM'
+    path.write_bytes(data)
+    boundaries = list(range(0x1000, len(data), 0x1000))  # 경계마다 자르도록 작은 청크
+    chunks = [(start, min(start + 0x1000, len(data))) for start in [0] + boundaries]
+
+    for ignore_case in (False, True):
+        scanner = PatternScanner(PATTERNS, ignore_case=ignore_case)
+        expected = scanner.scan(data)
+        with RegistryParser.open(str(path)) as parser:
+            assert _serial(parser, scanner) == expected
+            # 파일 경로 공유 (mmap) / 공유 메모리 두 경로 모두
+            assert scan_parallel(parser.share()[0], scanner, chunks, 2) == expected
+        source, shm = RegistryParser(data).share()
+        try:
+            assert scan_parallel(source, scanner, chunks, 2) == expected
+        finally:
+            shm.close()
+            shm.unlink()
+
+
+def test_parser_scan_uses_chunks_above_threshold(monkeypatch):
+    data = _hive()
+    monkeypatch.setattr('core.registry_parser.PARALLEL_SCAN_MIN_SIZE', 0)
+    calls = []
+    original = parallel_scan.scan_parallel
+
+    def recording(source, scanner, chunks, max_workers):
+        calls.append(chunks)
+        return original(source, scanner, chunks, max_workers)
+
+    monkeypatch.setattr('core.registry_parser.scan_parallel', recording)
+    monkeypatch.setattr('core.registry_parser.plan_chunks',
+                        lambda size, boundaries, workers: plan_chunks(size, boundaries, workers, min_chunk=0x2000))
+
+    parser = RegistryParser(data)
+    scanner = PatternScanner(PATTERNS)
+    expected = _serial(RegistryParser(data), scanner)
+    parser.scan_workers = 3
+    assert parser._scan(scanner) == expected
+    assert len(calls) == 1 and len(calls[0]) > 1
+
+    parser.register_patterns(PATTERNS)
+    for pattern in PATTERNS:
+        assert parser.search_pattern(pattern) == expected[PatternScanner.to_bytes(pattern)]
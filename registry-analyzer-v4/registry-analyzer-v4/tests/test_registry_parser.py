@@ -0,0 +1,110 @@
+"""RegistryParser 셀 파서 / 패턴 검색 테스트 (합성 하이브)"""
+
+import struct
+
+import pytest
+
+from core.registry_parser import RegistryParser
+from hive_builder import (REG_BINARY, REG_DWORD, REG_EXPAND_SZ, REG_MULTI_SZ, REG_QWORD, REG_SZ,
+                          build_hive, key, sz, typed_hive, value)
+
+
+SERVICES = [key('svc%03d' % i) for i in range(12)]
+
+
+def _system_hive() -> bytes:
+    service = key('Updater', values=[
+        value('ImagePath', REG_EXPAND_SZ, sz('C:\\Program Files\\Upd\\upd.exe')),
+        value('Start', REG_DWORD, struct.pack('<I', 2)),
+        value('Tags', REG_MULTI_SZ, sz('alpha') + sz('beta') + b'\x00\x00'),
+        value('Stamp', REG_QWORD, struct.pack('<Q', 132000000000000000)),
+        value('Blob', REG_BINARY, bytes(range(256)) * 80),  # db 빅데이터 (16344바이트 초과)
+        value('', REG_SZ, sz('default')),
+    ], timestamp=131000000000000000)
+    services = key('Services', service, *SERVICES, list_kind='ri')
+    control_set = key('ControlSet001', services, key('Control'), list_kind='lf')
+    select = key('Select', values=[value('Current', REG_DWORD, struct.pack('<I', 1))])
+    root = key('ROOT', control_set, select, key('MountedDevices'), key('Setup', list_kind='li'))
+    return build_hive(root, file_name='SYSTEM')
+
+
+@pytest.fixture
+def system_parser():
+    return RegistryParser(_system_hive())
+
+
+def test_base_block(system_parser):
+    base = system_parser.parse_base_block()
+    assert base['checksum_valid']
+    assert not base['dirty']
+    assert base['file_name'].endswith('\\Config\\SYSTEM')
+    assert [hbin['offset'] for hbin in system_parser.iter_hbins()] == [0x1000]
+
+
+def test_key_tree_round_trip(system_parser):
+    root = system_parser.root_key()
+    assert root.is_root
+    assert [k.name for k in root.subkeys()] == ['ControlSet001', 'MountedDevices', 'Select', 'Setup']
+
+    services = system_parser.open_key('HKLM\\SYSTEM\\CurrentControlSet\\Services')
+    assert services is not None and services.path == 'ControlSet001\\Services'
+    # ri (li + lh) 목록 전체 순회와 이름 조회
+    assert sorted(k.name for k in services.subkeys()) == sorted(['Updater'] + ['svc%03d' % i for i in range(12)])
+    assert services.subkey('SVC007').name == 'svc007'
+    assert services.subkey('missing') is None
+
+    updater = root.find_key('ControlSet001\\Services\\Updater')
+    assert updater.last_written_filetime == 131000000000000000
+    assert updater.subkey_count == 0 and updater.value_count == 6
+    assert [k.path for k in root.walk()][:3] == ['', 'ControlSet001', 'ControlSet001\\Control']
+
+
+def test_value_round_trip(system_parser):
+    updater = system_parser.open_key('ControlSet001\\Services\\Updater')
+    assert updater.value('imagepath').data == 'C:\\Program Files\\Upd\\upd.exe'
+    assert updater.value('ImagePath').type_name == 'REG_EXPAND_SZ'
+    assert updater.value('Start').data == 2
+    assert updater.value('Tags').data == ['alpha', 'beta']
+    assert updater.value('Stamp').data == 132000000000000000
+    assert updater.value('Blob').raw_data == bytes(range(256)) * 80
+    assert updater.value('').data == 'default'
+    assert updater.value('missing') is None
+
+
+def test_detect_hive_type_from_root_subkeys():
+    for hive_type in ('SYSTEM', 'SOFTWARE', 'NTUSER.DAT', 'SAM', 'Amcache.hve'):
+        assert RegistryParser(typed_hive(hive_type)).detect_hive_type() == hive_type
+
+
+def _naive_find(data: bytes, needle: bytes):
+    return [i for i in range(len(data) - len(needle) + 1) if data[i:i + len(needle)] == needle]
+
+
+def test_search_pattern_encoded_matches_naive_scan():
+    extra = (b'Run\x00' + sz('RunOnce') + b'xxRunServices' + 'Run'.encode('utf-16-le')
+             + b'R\x00u' + b'\x00n' + b'RUN' + sz('run'))
+    data = typed_hive('SOFTWARE', extra, key('Microsoft', key('Run'), key('RunOnce')))
+
+    for ignore_case in (False, True):
+        parser = RegistryParser(data)
+        parser.register_patterns(['Run', 'Run'.encode('utf-16-le')])
+        for pattern in ('Run', 'RunOnce', 'Services'):
+            haystack = data.lower() if ignore_case else data
+            expected = sorted(
+                [(offset, 'ascii') for offset in _naive_find(
+                    haystack, pattern.lower().encode('ascii') if ignore_case else pattern.encode('ascii'))] +
+                [(offset, 'utf-16-le') for offset in _naive_find(
+                    haystack, (pattern.lower() if ignore_case else pattern).encode('utf-16-le'))])
+            assert parser.search_pattern_encoded(pattern, ignore_case=ignore_case) == expected
+            # 캐시에서 다시 읽어도 같은 결과
+            assert parser.search_pattern_encoded(pattern, ignore_case=ignore_case) == expected
+        assert parser.search_pattern_encoded('Run', encodings=('utf-16-le',)) == \
+            [(offset, 'utf-16-le') for offset in _naive_find(data, 'Run'.encode('utf-16-le'))]
+
+
+def test_search_pattern_matches_naive_scan():
+    data = typed_hive('NTUSER.DAT', b'RunOnce Run RunServices .exe.exe')
+    parser = RegistryParser(data)
+    parser.register_patterns(['Run', '.exe'])
+    for pattern in ('Run', 'RunOnce', 'RunServices', '.exe', 'absent'):
+        assert parser.search_pattern(pattern) == _naive_find(data, pattern.encode('ascii'))
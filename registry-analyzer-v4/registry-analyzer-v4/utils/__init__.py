@@ -0,0 +1,8 @@
+"""
+Utils - 분석 결과 보조 도구
+"""
+
+from .search_index import FindingIndex
+from .result_cache import ResultCache
+
+__all__ = ['FindingIndex', 'ResultCache']
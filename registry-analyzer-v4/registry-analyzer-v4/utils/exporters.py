@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Exporters - 분석 결과 JSON / CSV 내보내기 (GUI / CLI 공용, tkinter 없이 사용)
+"""
+
+import json
+from typing import Dict, List, TextIO
+
+
+CSV_HEADER = "Category,Item,Timestamp,Details\n"
+
+
+def write_json(results: Dict, f: TextIO):
+    """분석 결과 전체를 JSON으로 기록"""
+    json.dump(results, f, indent=2, ensure_ascii=False, default=str)
+
+
+def export_json(results: Dict, filename: str):
+    """분석 결과를 JSON 파일로 저장"""
+    with open(filename, 'w', encoding='utf-8') as f:
+        write_json(results, f)
+
+
+def _raw_findings_sets(results: Dict) -> List[Dict]:
+    """CSV로 쓸 raw_findings 목록 (단일 하이브 결과 또는 하이브별 findings가 있는 Multi-Hive 결과)"""
+    if 'raw_findings' in results:
+        return [results['raw_findings']]
+    if 'hives' in results:
+        return [hive['findings'] for hive in results['hives'].values()]
+    raise ValueError("CSV export needs raw findings (single-hive result)")
+
+
+def write_csv(results: Dict, f: TextIO):
+    """아티팩트별 주요 항목을 CSV로 기록"""
+    # 헤더
+    f.write(CSV_HEADER)
+
+    for raw in _raw_findings_sets(results):
+        # ShimCache (with timestamp and file size)
+        for item in raw['shimcache']:
+            ts = item.get('timestamp', '')
+            size = item.get('fileSize', '')
+            details = f"Size: {size} bytes" if size else ""
+            f.write(f"ShimCache,{item['path']},{ts},{details}\n")
+
+        # Amcache (with SHA1, publisher, version, etc.)
+        for item in raw.get('amcache', []):
+            ts = item.get('timestamp', '')
+            sha1 = item.get('sha1', 'N/A')
+            pub = item.get('publisher', 'Unknown')
+            ver = item.get('version', '')
+            size = item.get('fileSize', '')
+            details = f"SHA1:{sha1[:16]}... Publisher:{pub} Version:{ver} Size:{size}"
+            f.write(f"Amcache,{item['programName']},{ts},{details}\n")
+
+        # UserAssist (with run count and focus time)
+        for item in raw['userassist']:
+            runs = item.get('runCount', '')
+            focus = item.get('focusTime', '')
+            details = f"Runs:{runs} FocusTime:{focus}ms" if runs or focus else ""
+            f.write(f"UserAssist,{item['program']},,{details}\n")
+
+        # BAM/DAM (with user SID)
+        for item in raw['bam_dam']:
+            ts = item.get('timestamp', '')
+            sid = item.get('userSID', '')
+            details = f"UserSID:{sid}" if sid else ""
+            f.write(f"BAM/DAM,{item['path']},{ts},{details}\n")
+
+        # USB
+        for item in raw['usb_devices']:
+            vid = item.get('vid', '')
+            pid = item.get('pid', '')
+            f.write(f"USB Device,{item['device']},,VID:{vid} PID:{pid}\n")
+
+        # Recent Docs
+        for item in raw['recent_docs']:
+            f.write(f"Recent Document,{item['document']},,\n")
+
+        # Run Keys
+        for item in raw['run_keys']:
+            f.write(f"Auto-Start,{item['name']},,{item['command']}\n")
+
+        # SAM Users
+        for item in raw['sam_users']:
+            f.write(f"User Account,{item['username']},,{item['sid']}\n")
+
+        # Network
+        for item in raw['network_profiles']:
+            f.write(f"Network Profile,{item['network']},,\n")
+
+
+def export_csv(results: Dict, filename: str):
+    """분석 결과를 CSV 파일로 저장 (Excel 호환 UTF-8 BOM)"""
+    with open(filename, 'w', encoding='utf-8-sig') as f:
+        write_csv(results, f)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Result Cache - 하이브 내용 해시 기반 분석 결과 디스크 캐시 (SQLite)
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import time
+import zlib
+from contextlib import closing
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.registry_analyzer')
+DEFAULT_CACHE_PATH = os.path.join(DEFAULT_CACHE_DIR, 'result_cache.sqlite3')
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 압축된 결과 합계 상한 (넘으면 오래 안 쓴 항목부터 삭제)
+
+CACHE_SCHEMA_VERSION = 2  # 저장 형식 / 키 구성이 바뀌면 올림 (이전 항목은 조회되지 않음, 2: 하이브 타입 옵션)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS findings (
+    hive_sha256 TEXT NOT NULL,
+    analyzer    TEXT NOT NULL,
+    version     TEXT NOT NULL,
+    options     TEXT NOT NULL,
+    payload     BLOB NOT NULL,
+    size        INTEGER NOT NULL,
+    last_used   REAL NOT NULL,
+    PRIMARY KEY (hive_sha256, analyzer, version, options)
+)
+"""
+
+
+def _encode(value):
+    """JSON 기본 타입이 아닌 값 (일부 분석 모듈의 datetime 타임스탬프)"""
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _decode(obj: Dict):
+    if len(obj) == 1 and '__datetime__' in obj:
+        return datetime.fromisoformat(obj['__datetime__'])
+    return obj
+
+
+class ResultCache:
+    """
+    (하이브 SHA-256, 분석 모듈, 모듈 버전, 옵션) -> findings 캐시
+
+    결과는 zlib 압축 JSON으로 SQLite 파일 하나에 저장하고, 압축 크기 합계가
+    max_bytes를 넘으면 last_used가 오래된 항목부터 지운다. 호출마다 연결을 새로
+    열므로 여러 스레드 / 프로세스에서 같은 캐시를 써도 된다. 캐시를 열 수 없으면
+    경고만 출력하고 항상 미스로 동작한다.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.enabled = True
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with closing(self._connect()) as conn, conn:
+                conn.execute(_SCHEMA)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Result cache disabled ({path}): {e}", file=sys.stderr)
+            self.enabled = False
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def _key(hive_sha256: str, analyzer: str, version, options: Optional[Dict]) -> tuple:
+        return (hive_sha256, analyzer, f"{CACHE_SCHEMA_VERSION}:{version}",
+                json.dumps(options or {}, sort_keys=True))
+
+    def get(self, hive_sha256: str, analyzer: str, version, options: Optional[Dict] = None) -> Optional[List[Dict]]:
+        """캐시된 findings (없으면 None) - 조회한 항목은 last_used 갱신"""
+        if not self.enabled:
+            return None
+        key = self._key(hive_sha256, analyzer, version, options)
+        try:
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute(
+                    "SELECT payload FROM findings "
+                    "WHERE hive_sha256 = ? AND analyzer = ? AND version = ? AND options = ?", key).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE findings SET last_used = ? "
+                    "WHERE hive_sha256 = ? AND analyzer = ? AND version = ? AND options = ?", (time.time(),) + key)
+            return json.loads(zlib.decompress(row[0]).decode('utf-8'), object_hook=_decode)
+        except (sqlite3.Error, zlib.error, ValueError) as e:
+            print(f"Result cache read failed: {e}", file=sys.stderr)
+            return None
+
+    def put(self, hive_sha256: str, analyzer: str, version, findings: List[Dict],
+            options: Optional[Dict] = None):
+        """findings 저장 후 크기 상한을 넘으면 LRU 삭제"""
+        if not self.enabled:
+            return
+        key = self._key(hive_sha256, analyzer, version, options)
+        try:
+            payload = zlib.compress(json.dumps(findings, default=_encode, ensure_ascii=False).encode('utf-8'))
+            with closing(self._connect()) as conn, conn:
+                conn.execute("INSERT OR REPLACE INTO findings VALUES (?, ?, ?, ?, ?, ?, ?)",
+                             key + (payload, len(payload), time.time()))
+                self._evict(conn)
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"Result cache write failed: {e}", file=sys.stderr)
+
+    def _evict(self, conn: sqlite3.Connection):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM findings").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for rowid, size in conn.execute("SELECT rowid, size FROM findings ORDER BY last_used").fetchall():
+            conn.execute("DELETE FROM findings WHERE rowid = ?", (rowid,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def info(self) -> Dict:
+        """캐시 항목 수 / 압축 크기 합계"""
+        if not self.enabled:
+            return {'entries': 0, 'bytes': 0, 'max_bytes': self.max_bytes}
+        with closing(self._connect()) as conn, conn:
+            entries, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM findings").fetchone()
+        return {'entries': entries, 'bytes': total, 'max_bytes': self.max_bytes}
+
+    def clear(self):
+        """모든 항목 삭제"""
+        if self.enabled:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("DELETE FROM findings")